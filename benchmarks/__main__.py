@@ -0,0 +1,139 @@
+"""Run the outlify benchmark suite and compare it with the recorded baseline.
+
+Usage:
+
+    python -m benchmarks                 # compare with benchmarks/baseline.json
+    python -m benchmarks --save          # record a new baseline
+    python -m benchmarks -k panel        # run only cases containing "panel"
+
+Timings are stored relative to a fixed pure-python calibration workload (string formatting,
+padding and joining, like the rendering itself), so a baseline recorded on one machine stays
+meaningful on another. The calibration is measured in turn with every case, so changes of
+the machine's speed during the run (frequency scaling, other processes) affect both alike:
+relative timings of an unchanged tree vary within about 15%, below the 25% threshold.
+The exit code is 1 if any case is slower than the baseline by more than the threshold.
+"""
+import argparse
+import contextlib
+import json
+import platform
+import statistics
+import sys
+import timeit
+from collections.abc import Callable, Iterator
+from pathlib import Path
+
+from benchmarks.cases import CASES
+
+BASELINE = Path(__file__).with_name("baseline.json")
+SAMPLE_SECONDS = 0.005  # minimum duration of a sample, short to follow changes of the machine's speed
+
+
+def reference() -> None:
+    """Calibration workload: format, pad, join and split lines, as rendering of the cases does."""
+    params = {f"key{index}": index * 1.5 for index in range(2_000)}
+    lines = [f"│ {key:<10} = {value!s:>8} │" for key, value in params.items()]
+    text = "\n".join(line.ljust(40, " ") for line in lines)
+    [line.strip().split(" = ") for line in text.split("\n")]
+
+
+def measure(workload: Callable[[], object], *, repeat: int) -> tuple[float, float]:
+    """Return the best time of a single workload run in seconds and its time relative to the calibration.
+
+    Short samples of the workload and of the calibration workload are taken in turn `repeat` times,
+    so both samples of a pair run at the same speed of the machine. The relative time
+    is the median of the pairs' ratios, which stays stable while the absolute times drift.
+    """
+    timer, calibration = timeit.Timer(workload), timeit.Timer(reference)
+    number, calibration_number = _get_number(timer), _get_number(calibration)
+    seconds, ratios = [], []
+    for _ in range(repeat):
+        sample = timer.timeit(number) / number
+        seconds.append(sample)
+        ratios.append(sample / (calibration.timeit(calibration_number) / calibration_number))
+    return min(seconds), statistics.median(ratios)
+
+
+def _get_number(timer: timeit.Timer) -> int:
+    """Get the number of runs that take at least `SAMPLE_SECONDS`."""
+    number = 1
+    while timer.timeit(number) < SAMPLE_SECONDS:
+        number *= 2
+    return number
+
+
+@contextlib.contextmanager
+def prepared(name: str) -> Iterator[Callable[[], object]]:
+    """Set up the case and get its workload, a generator case is torn down after the measurement."""
+    setup = CASES[name]()
+    if not isinstance(setup, Iterator):
+        yield setup
+        return
+    try:
+        yield next(setup)
+    finally:
+        next(setup, None)
+
+
+def run(names: list[str], *, repeat: int) -> dict[str, dict[str, float]]:
+    """Run the selected cases and return their absolute and relative timings."""
+    results = {}
+    for name in names:
+        with prepared(name) as workload:
+            seconds, relative = measure(workload, repeat=repeat)
+        results[name] = {"seconds": seconds, "relative": relative}
+    return results
+
+
+def compare(
+        results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], *, threshold: float,
+) -> list[str]:
+    """Print the comparison table and return names of regressed cases."""
+    regressed = []
+    print(f"{'case':<20} {'time':>12} {'baseline':>12} {'change':>8}")
+    for name, result in results.items():
+        line = f"{name:<20} {result['seconds'] * 1000:>9.3f} ms"
+        if name not in baseline:
+            print(f"{line} {'-':>12} {'new':>8}")
+            continue
+        change = result["relative"] / baseline[name]["relative"] - 1
+        status = ""
+        if change > threshold:
+            regressed.append(name)
+            status = "  REGRESSION"
+        expected = baseline[name]["relative"] * result["seconds"] / result["relative"]
+        print(f"{line} {expected * 1000:>9.3f} ms {change:>+8.1%}{status}")
+    return regressed
+
+
+def main() -> int:
+    """Run the suite; return the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("-k", dest="keyword", default="", help="run only cases whose name contains the keyword")
+    parser.add_argument("--baseline", type=Path, default=BASELINE, help="path to the baseline json file")
+    parser.add_argument("--save", action="store_true", help="record the results as the new baseline")
+    parser.add_argument("--threshold", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%% (default)")
+    parser.add_argument("--repeat", type=int, default=40, help="number of measurement pairs per case")
+    args = parser.parse_args()
+
+    names = [name for name in CASES if args.keyword in name]
+    results = run(names, repeat=args.repeat)
+
+    if args.save:
+        recorded = json.loads(args.baseline.read_text()) if args.baseline.exists() else {"cases": {}}
+        recorded["python"] = platform.python_version()
+        recorded["cases"].update(results)
+        args.baseline.write_text(f"{json.dumps(recorded, indent=2, sort_keys=True)}\n")
+        print(f"Baseline with {len(results)} case(s) saved to {args.baseline}")
+        return 0
+
+    baseline = json.loads(args.baseline.read_text())["cases"] if args.baseline.exists() else {}
+    regressed = compare(results, baseline, threshold=args.threshold)
+    if regressed:
+        print(f"\n{len(regressed)} case(s) regressed by more than {args.threshold:.0%}: {', '.join(regressed)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,86 @@
+"""Measure the import time of outlify modules with `python -X importtime` and check it against budgets.
+
+Run with:
+
+    python -m benchmarks.bench_import [--repeat 15] [--scale 1.0]
+
+Every module is imported in a fresh interpreter, the best cumulative time of `repeat` runs is reported.
+Bytecode caching is enabled for the measured runs (and a warm-up run writes the cache),
+so source compilation, which an installed package does not pay, is not counted.
+The exit code is 1 if any module exceeds its budget.
+"""
+import argparse
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# cumulative import time budgets in milliseconds, with the interpreter's own startup imports excluded
+BUDGETS = {
+    "outlify": 1,
+    "outlify.style": 15,
+    "outlify.list": 30,
+    "outlify.panel": 30,
+    "outlify.decorators": 35,
+}
+# modules that must not be imported by the module, e.g. `re` is compiled lazily on the first render
+FORBIDDEN = {
+    "outlify": ("outlify.style", "outlify.panel", "outlify.decorators", "re", "typing"),
+    "outlify.style": ("re", "shutil", "typing"),
+    "outlify.list": ("re", "shutil", "typing"),
+    "outlify.panel": ("re", "shutil", "textwrap", "typing"),
+    "outlify.decorators": (
+        "inspect", "tracemalloc", "pickle", "cProfile", "pstats", "json", "pathlib", "random", "string", "re", "typing",
+    ),
+}
+
+
+def import_time(module: str) -> tuple[float, set[str]]:
+    """Import the module in a fresh interpreter, return the cumulative time in seconds and the imported modules."""
+    env = {name: value for name, value in os.environ.items() if name != "PYTHONDONTWRITEBYTECODE"}
+    result = subprocess.run(  # noqa: S603 - the interpreter itself with a fixed command
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, check=True, cwd=ROOT, env=env,
+    )
+    total, imported = 0.0, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or line.endswith("| imported package"):  # not the header
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        imported.add(name.strip())
+        if name.strip() == module:
+            total = int(cumulative) / 1_000_000
+    return total, imported
+
+
+def main() -> int:
+    """Run the benchmark; return the process exit code."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=15, help="number of measurements per module (best is used)")
+    parser.add_argument("--scale", type=float, default=1.0, help="multiplier of the budgets for slower machines")
+    args = parser.parse_args()
+
+    failed = []
+    print(f"{'module':<20} {'time':>10} {'budget':>10}")
+    for module, budget in BUDGETS.items():
+        _, imported = import_time(module)  # warm-up, writes the bytecode cache
+        best = min(import_time(module)[0] for _ in range(args.repeat))
+        status = ""
+        if best * 1000 > budget * args.scale:
+            failed.append(module)
+            status = "  OVER BUDGET"
+        if leaked := sorted(set(FORBIDDEN.get(module, ())) & imported):
+            failed.append(module)
+            status += f"  imports {', '.join(leaked)}"
+        print(f"{module:<20} {best * 1000:>7.2f} ms {budget * args.scale:>7.2f} ms{status}")
+
+    if failed:
+        print(f"\n{len(failed)} check(s) failed: {', '.join(dict.fromkeys(failed))}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,69 @@
+"""Compare `outlify._wrap.wrap` with `textwrap.wrap` on a large generated log.
+
+Run with:
+
+    python -m benchmarks.bench_wrap [--lines 100000] [--width 76]
+"""
+import argparse
+import random
+import textwrap
+import time
+from collections.abc import Callable
+
+from outlify._wrap import wrap
+
+WORDS = ("lorem", "ipsum", "dolor", "sit", "amet", "consectetur", "adipiscing", "elit", "sed", "do", "eiusmod")
+STYLES = ("\033[31m", "\033[1m", "\033[32m\033[4m")
+
+
+def generate_lines(count: int, *, seed: int = 0) -> list[str]:
+    """Generate log-like lines: mostly short, some long, some with ansi styles."""
+    rnd = random.Random(seed)  # noqa: S311
+    lines = []
+    for _ in range(count):
+        words = rnd.choices(WORDS, k=rnd.choice((3, 6, 12, 30)))
+        if rnd.random() < 0.2:  # noqa: PLR2004
+            index = rnd.randrange(len(words))
+            words[index] = f"{rnd.choice(STYLES)}{words[index]}\033[0m"
+        lines.append(" ".join(words))
+    return lines
+
+
+def measure(func: Callable[[], object], *, repeat: int) -> float:
+    """Return the best wall time of `repeat` runs in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark and print the comparison."""
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--lines", type=int, default=100_000)
+    parser.add_argument("--width", type=int, default=76)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    lines = generate_lines(args.lines)
+    textwrap_time = measure(
+        lambda: [
+            textwrap.wrap(
+                line, width=args.width, replace_whitespace=False, drop_whitespace=False, break_on_hyphens=False,
+            )
+            for line in lines
+        ],
+        repeat=args.repeat,
+    )
+    outlify_time = measure(lambda: [wrap(line, args.width) for line in lines], repeat=args.repeat)
+
+    print(f"lines: {args.lines}, width: {args.width}, best of {args.repeat}")
+    print(f"textwrap.wrap : {textwrap_time:.3f} s")
+    print(f"outlify wrap  : {outlify_time:.3f} s")
+    print(f"speedup       : {textwrap_time / outlify_time:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
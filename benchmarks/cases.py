@@ -0,0 +1,174 @@
+"""Benchmark cases for every outlify component.
+
+Each case is a setup function that prepares the input data and returns
+a zero-argument callable with the measured workload. A case that changes global
+settings is a generator: it yields the workload and restores the settings after it.
+"""
+from collections.abc import Callable, Iterator
+
+from outlify.decorators import EveryNth, timer
+from outlify.list import TitledList
+from outlify.panel import Panel, PanelRenderer, ParamsPanel
+from outlify.style import ColorDepth, Colors, Styles, get_color_depth, set_color_depth, strip_ansi
+
+__all__ = ["CASES", "case"]
+
+
+Workload = Callable[[], object]
+Setup = Callable[[], "Workload | Iterator[Workload]"]
+CASES: dict[str, Setup] = {}
+
+WIDTH = 80
+TEXT = (
+    "Outlify helps you render beautiful command-line panels. "
+    "You can customize borders, alignment, titles and styles of every element."
+)
+
+
+def case(name: str) -> Callable[[Setup], Setup]:
+    """Register a benchmark case under the given name."""
+    def decorator(setup: Setup) -> Setup:
+        CASES[name] = setup
+        return setup
+    return decorator
+
+
+@case("panel-small")
+def panel_small() -> Workload:
+    """Short panel with a title: dominated by header/footer building."""
+    return lambda: str(Panel(TEXT, width=WIDTH, title="Title", subtitle="Subtitle", title_conns="[]"))
+
+
+@case("panel-renderer")
+def panel_renderer() -> Workload:
+    """Render the same panel as `panel-small` from a reusable template."""
+    renderer = PanelRenderer(width=WIDTH, title="Title", subtitle="Subtitle", title_conns="[]")
+    return lambda: renderer.render(TEXT)
+
+
+@case("panel-large")
+def panel_large() -> Workload:
+    """Panel with 10k lines of wrapped text."""
+    content = "\n".join(f"{index}: {TEXT}" for index in range(10_000))
+    return lambda: str(Panel(content, width=WIDTH))
+
+
+@case("panel-styled")
+def panel_styled() -> Workload:
+    """Panel with styled title, border and 1k lines of content with ansi colors."""
+    content = "\n".join(
+        f"{Colors.red}{index}{Colors.reset}: {Styles.bold}{TEXT}{Styles.reset}" for index in range(1_000)
+    )
+    return lambda: str(Panel(
+        content, width=WIDTH, title="Styled", title_style=[Colors.red, Styles.bold], border_style=[Colors.gray],
+        color="always",
+    ))
+
+
+@case("panel-styled-never")
+def panel_styled_never() -> Workload:
+    """Render the `panel-styled` panel as plain text: content without escapes, "never" color mode for the rest."""
+    content = "\n".join(
+        strip_ansi(f"{Colors.red}{index}{Colors.reset}: {Styles.bold}{TEXT}{Styles.reset}") for index in range(1_000)
+    )
+    return lambda: str(Panel(
+        content, width=WIDTH, title="Styled", title_style=[Colors.red, Styles.bold], border_style=[Colors.gray],
+        color="never",
+    ))
+
+
+@case("strip-ansi-1k-lines")
+def strip_ansi_1k_lines() -> Workload:
+    """Strip escape sequences from the 1k lines of the rendered `panel-styled` panel, e.g. to write them to a log."""
+    lines = panel_styled()().splitlines()
+    return lambda: [strip_ansi(line) for line in lines]
+
+
+@case("panel-wide")
+def panel_wide() -> Workload:
+    """Panel with 1k lines of east asian wide characters."""
+    content = "\n".join(f"{index}: 日本語のテキストを折り返して表示します。" * 3 for index in range(1_000))
+    return lambda: str(Panel(content, width=WIDTH, title="タイトル"))
+
+
+@case("params-panel-10k")
+def params_panel_10k() -> Workload:
+    """ParamsPanel with 10k keys, some of them hidden and some too long to fit."""
+    params = {f"parameter_{index}": TEXT if index % 10 == 0 else index for index in range(10_000)}
+    params.update({f"token_{index}": "secret" for index in range(100)})
+    return lambda: str(ParamsPanel(params, width=WIDTH, title="Parameters"))
+
+
+@case("params-hidden-patterns")
+def params_hidden_patterns() -> Workload:
+    """ParamsPanel with 10k keys and 20 hidden patterns re-rendered from a template."""
+    params = {f"parameter_{index}": index for index in range(10_000)}
+    hidden = [f".*secret_{index}.*" for index in range(10)] + [f"key_{index}_[a-z]+" for index in range(10)]
+    renderer = PanelRenderer(ParamsPanel, width=WIDTH, title="Parameters", hidden=hidden)
+    return lambda: renderer.render(params)
+
+
+@case("titled-list-100k")
+def titled_list_100k() -> Workload:
+    """TitledList with 100k package names."""
+    packages = [f"package-{index}@1.{index % 10}.0" for index in range(100_000)]
+    return lambda: str(TitledList(packages, title="Packages"))
+
+
+@case("titled-list-grid-100k")
+def titled_list_grid_100k() -> Workload:
+    """TitledList with 100k package names packed into columns like `ls`."""
+    packages = [f"package-{index}@1.{index % 10}.0" for index in range(100_000)]
+    return lambda: str(TitledList(packages, title="Packages", layout="columns", width=WIDTH))
+
+
+@case("timer-1k-calls")
+def timer_1k_calls() -> Workload:
+    """1k calls of an empty function decorated with `timer`: per-call overhead of the decorator."""
+    @timer(output_func=lambda _: None)
+    def noop() -> None:
+        pass
+
+    def workload() -> None:
+        for _ in range(1_000):
+            noop()
+    return workload
+
+
+@case("timer-sampled-1k-calls")
+def timer_sampled_1k_calls() -> Workload:
+    """1k calls of an empty function decorated with aggregating `timer` measuring every 100th call."""
+    @timer(aggregate=True, report_at_exit=False, sampling=EveryNth(100))
+    def noop() -> None:
+        pass
+
+    def workload() -> None:
+        for _ in range(1_000):
+            noop()
+    return workload
+
+
+@case("timer-styled-1k-calls")
+def timer_styled_1k_calls() -> Workload:
+    """1k calls of a `timer`-decorated function with composed label and time styles."""
+    @timer(
+        output_func=lambda _: None, label_style=Colors.gray | Styles.bold, time_style=Colors.red | Styles.bold,
+        color="always",
+    )
+    def noop() -> None:
+        pass
+
+    def workload() -> None:
+        for _ in range(1_000):
+            noop()
+    return workload
+
+
+@case("colors-rgb-4k")
+def colors_rgb_4k() -> Iterator[Workload]:
+    """Convert a frame of 4k RGB colors (a gradient) to the 256-color palette, as redrawn on every frame."""
+    depth = get_color_depth()
+    set_color_depth(ColorDepth.extended)
+    gradient = [(index % 256, index // 16 % 256, 255 - index % 256) for index in range(4_096)]
+    yield lambda: [Colors.rgb(*rgb) for rgb in gradient]
+    set_color_depth(depth)
@@ -0,0 +1,64 @@
+"""Structured cli output — beautifully, simply, and dependency-free.
+
+The public API is available both from its modules (`outlify.panel.Panel`) and from the package (`outlify.Panel`).
+Modules are imported on the first access to their names, so `import outlify` itself costs nothing
+and a program that only uses colors never imports the panels or the decorators.
+"""
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:  # pragma: no cover
+    from outlify.decorators import (
+        EveryNth,
+        PerSecond,
+        Probability,
+        Sampler,
+        Span,
+        TimingCollector,
+        TimingStats,
+        TraceSink,
+        profile,
+        report_spans,
+        reset_spans,
+        span,
+        timer,
+        timer_overhead,
+    )
+    from outlify.list import TitledList
+    from outlify.live import Live
+    from outlify.panel import Panel, PanelRenderer, ParamsPanel
+    from outlify.style import Align, AnsiCodes, Back, BorderStyle, Colors, Styles
+
+_MODULES = {
+    "outlify.decorators": (
+        "EveryNth", "PerSecond", "Probability", "Sampler", "Span", "TimingCollector", "TimingStats", "TraceSink",
+        "profile", "report_spans", "reset_spans", "span", "timer", "timer_overhead",
+    ),
+    "outlify.list": ("TitledList",),
+    "outlify.live": ("Live",),
+    "outlify.panel": ("Panel", "PanelRenderer", "ParamsPanel"),
+    "outlify.style": ("Align", "AnsiCodes", "Back", "BorderStyle", "Colors", "Styles"),
+}
+_LOCATIONS = {name: module for module, names in _MODULES.items() for name in names}
+
+__all__ = [
+    "Align", "AnsiCodes", "Back", "BorderStyle", "Colors", "EveryNth", "Live", "Panel", "PanelRenderer", "ParamsPanel",
+    "PerSecond", "Probability", "Sampler", "Span", "Styles", "TimingCollector", "TimingStats", "TitledList",
+    "TraceSink", "profile", "report_spans", "reset_spans", "span", "timer", "timer_overhead",
+]
+
+
+def __getattr__(name: str) -> object:
+    """Import the module of a public name on first access and cache the name in the package."""
+    module = _LOCATIONS.get(name)
+    if module is None:
+        error = f"module {__name__!r} has no attribute {name!r}"
+        raise AttributeError(error)
+    import importlib
+
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value  # the next access does not call `__getattr__`
+    return value
+
+
+def __dir__() -> list[str]:
+    """List the lazily imported public names together with the module attributes."""
+    return sorted({*globals(), *__all__})
@@ -1,35 +1,188 @@
+import functools
 from collections.abc import Sequence
 
+from outlify._color import ColorDepth, color_codes, get_color_depth, palette_to_standard, parse_hex, standard_code
+from outlify._lazy import LazyPattern
+
 __all__ = [
+    "ANSI_ESCAPE",
     "AnsiBackColorsCodes",
     "AnsiCodes",
     "AnsiColorsCodes",
     "AnsiStylesCodes",
     "Back",
     "Colors",
+    "Style",
     "Styles",
+    "strip_ansi",
 ]
 
 
 CSI = "\033["  # Control Sequence Introducer
 SGR = "m"      # Select Graphic Rendition suffix
 
+# CSI sequences (colors, cursor movement), OSC sequences (hyperlinks, titles) and two-byte escapes
+ANSI_ESCAPE = LazyPattern(r"\x1b(?:\[[0-?]*[ -/]*[@-~]|\][^\x07\x1b]*(?:\x07|\x1b\\)|[@-Z\\-_])")
+
+
+INTERN_SIZE = 4096  # interned styles are forgotten when there are this many
+
+# codes that turn off the attribute set by the code: bold and dim share one, and so do both blinks
+_RESETS = {1: 22, 2: 22, 3: 23, 4: 24, 5: 25, 6: 25, 7: 27, 8: 28, 9: 29, 38: 39, 48: 49}
+_RESET_CODES = frozenset((0, 22, 23, 24, 25, 27, 28, 29, 39, 49))
+_EXTENDED_COLORS = frozenset((38, 48))  # followed by `5;{id}` or `2;{r};{g};{b}`
+
 
 def code_to_ansi(*codes: int) -> str:
     return f"{CSI}{';'.join(map(str, codes))}{SGR}"
 
 
+class Style(str):
+    """Immutable, hashable style: the escape sequence of SGR codes, e.g. `Style(31, 1)` is `ESC[31;1m`.
+
+    It is a string, so it can be used anywhere an escape sequence can, and it is composed with `|`:
+    `Colors.red | Styles.bold` is the single sequence `ESC[31;1m`. Styles are interned by their codes,
+    so a composition is a dictionary lookup, and the minimal `reset` is computed once per style.
+    """
+
+    __slots__ = ("_reset", "codes")
+
+    codes: tuple[int, ...]
+    _reset: "Style | None"
+
+    def __new__(cls, *codes: int) -> "Style":
+        """Get the style of the codes, the same object for the same codes.
+
+        :param codes: SGR codes, e.g. `31` for red text or `38, 5, 207` for the color 207 of the 256-color palette
+        """
+        style = _INTERNED.get(codes)
+        if style is not None:
+            return style
+        for code in codes:
+            if type(code) is not int:
+                error = f"Invalid type for style code: {code!r} is not int"
+                raise TypeError(error)
+
+        style = super().__new__(cls, code_to_ansi(*codes) if codes else "")
+        style.codes = codes
+        style._reset = None
+        if len(_INTERNED) >= INTERN_SIZE:
+            _INTERNED.clear()
+        _INTERNED[codes] = style
+        return style
+
+    @property
+    def reset(self) -> "Style":
+        """Get the minimal style that turns off this one, e.g. `ESC[39;22m` for red bold text.
+
+        Unknown codes are turned off by the full reset `ESC[0m`.
+        """
+        if self._reset is None:
+            self._reset = Style(*_get_reset_codes(self.codes))
+        return self._reset
+
+    def __or__(self, other: object) -> "Style":
+        """Compose the styles into one, the codes of `other` are applied after the codes of this style."""
+        if not isinstance(other, Style):
+            return NotImplemented
+        return Style(*self.codes, *other.codes)
+
+    def __reduce__(self) -> tuple[type["Style"], tuple[int, ...]]:
+        """Pickle and copy the style by its codes."""
+        return Style, self.codes
+
+    def __repr__(self) -> str:
+        """Return the style's constructor call, e.g. `Style(31, 1)`."""
+        return f"{self.__class__.__name__}({', '.join(map(str, self.codes))})"
+
+
+_INTERNED: dict[tuple[int, ...], Style] = {}
+
+
+@functools.lru_cache(maxsize=4096)
+def _rgb_style(rgb: tuple[int, int, int], extended: int, standard: int, depth: ColorDepth) -> Style:
+    """Get the style of the RGB color, cached, so converting the same colors again (e.g. every frame) is a lookup."""
+    return Style(*color_codes(rgb, extended=extended, standard=standard, depth=depth))
+
+
+def _get_reset_codes(codes: tuple[int, ...]) -> tuple[int, ...]:
+    resets: dict[int, None] = {}  # ordered set
+    index = 0
+    while index < len(codes):
+        code = codes[index]
+        index += 1
+        if code in _EXTENDED_COLORS and index < len(codes):  # skip the arguments of the color
+            index += {5: 2, 2: 4}.get(codes[index], 0)
+        if code in _RESET_CODES:
+            continue
+        if 30 <= code <= 37 or 90 <= code <= 97:  # noqa: PLR2004
+            resets[39] = None
+        elif 40 <= code <= 47 or 100 <= code <= 107:  # noqa: PLR2004
+            resets[49] = None
+        else:
+            resets[_RESETS.get(code, 0)] = None
+    return (0,) if 0 in resets else tuple(resets)
+
+
 class AnsiCodes:
-    def __init__(self) -> None:
-        for name in (name for name in dir(self) if not name.startswith("_")):
-            value = getattr(self, name)
-            if isinstance(value, Sequence):
-                setattr(self, name, code_to_ansi(*value))
-            else:
-                setattr(self, name, code_to_ansi(value))
+    def __init_subclass__(cls, **kwargs: object) -> None:
+        """Replace the codes declared in the class body with `Style`s, once per class.
+
+        Only the class's own attributes are converted: inherited ones already are,
+        so creating an instance does no work at all.
+        """
+        super().__init_subclass__(**kwargs)
+        for name, value in list(vars(cls).items()):
+            if name.startswith("_") or isinstance(value, str):
+                continue
+            if isinstance(value, int):
+                setattr(cls, name, Style(value))
+            elif isinstance(value, Sequence):
+                setattr(cls, name, Style(*value))
+
+
+class _ColorCodes(AnsiCodes):
+    """RGB, hex and 256-color palette colors, downsampled to the color depth of the terminal."""
+
+    _extended = 38  # code of extended colors
+    _standard = 30  # code of the first standard color
+
+    def rgb(self, red: int, green: int, blue: int) -> Style:
+        """Get the color by its red, green and blue values from 0 to 255.
+
+        The color is exact on truecolor terminals, otherwise it is the nearest color of the 256-color palette
+        or of the 16 standard colors (see `get_color_depth`), the conversions are cached.
 
+        :raises ValueError: a value is out of range
+        """
+        rgb = (red, green, blue)
+        for value in rgb:
+            if type(value) is not int or not 0 <= value <= 255:  # noqa: PLR2004
+                error = f"Invalid value for RGB color: {value!r} is not an int from 0 to 255"
+                raise ValueError(error)
+        return _rgb_style(rgb, self._extended, self._standard, get_color_depth())
 
-class AnsiColorsCodes(AnsiCodes):
+    def hex(self, color: str) -> Style:
+        """Get the color by its hex value, `#rrggbb` or `#rgb`, the same as `rgb`.
+
+        :raises ValueError: the color is not a hex color
+        """
+        return self.rgb(*parse_hex(color))
+
+    def palette(self, index: int) -> Style:
+        """Get the color of the 256-color palette, the nearest of the 16 standard colors if it is not supported.
+
+        :raises ValueError: the index is out of range
+        """
+        if type(index) is not int or not 0 <= index <= 255:  # noqa: PLR2004
+            error = f"Invalid index of palette color: {index!r} is not an int from 0 to 255"
+            raise ValueError(error)
+        if get_color_depth() >= ColorDepth.extended:
+            return Style(self._extended, 5, index)
+        return Style(standard_code(palette_to_standard(index), standard=self._standard))
+
+
+class AnsiColorsCodes(_ColorCodes):
     # standard colors
     black   : str = 30
     red     : str = 31
@@ -54,7 +207,10 @@ class AnsiColorsCodes(AnsiCodes):
     reset   : str = 39
 
 
-class AnsiBackColorsCodes(AnsiCodes):
+class AnsiBackColorsCodes(_ColorCodes):
+    _extended = 48
+    _standard = 40
+
     # standard colors
     black   : str = 40
     red     : str = 41
@@ -105,3 +261,13 @@ class AnsiStylesCodes(AnsiCodes):
 Colors = AnsiColorsCodes()
 Back = AnsiBackColorsCodes()
 Styles = AnsiStylesCodes()
+
+
+def strip_ansi(text: str) -> str:
+    """Remove ANSI escape sequences (styles, cursor movement, hyperlinks) from the text.
+
+    Text without the escape character is returned as is, without running the regular expression.
+    """
+    if "\x1b" not in text:
+        return text
+    return ANSI_ESCAPE.sub("", text)
@@ -0,0 +1,43 @@
+"""Kinds of functions told by the flags of their code objects, without importing `inspect`, which is slow."""
+import functools
+from collections.abc import Callable
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    from typing import Any
+
+__all__ = ["is_async_generator_function", "is_coroutine_function", "is_generator_function"]
+
+
+# flags of `code.co_flags`, the same as `inspect.CO_GENERATOR`, `inspect.CO_COROUTINE`, etc.
+CO_GENERATOR = 0x20
+CO_COROUTINE = 0x80
+CO_ASYNC_GENERATOR = 0x200
+
+
+def is_generator_function(func: Callable[..., "Any"]) -> bool:
+    """Equivalent of `inspect.isgeneratorfunction`."""
+    return bool(_flags(func) & CO_GENERATOR)
+
+
+def is_coroutine_function(func: Callable[..., "Any"]) -> bool:
+    """Equivalent of `inspect.iscoroutinefunction` for functions defined with `async def`."""
+    return bool(_flags(func) & CO_COROUTINE)
+
+
+def is_async_generator_function(func: Callable[..., "Any"]) -> bool:
+    """Equivalent of `inspect.isasyncgenfunction`."""
+    return bool(_flags(func) & CO_ASYNC_GENERATOR)
+
+
+def _flags(func: Callable[..., "Any"]) -> int:
+    """Get the flags of the function's code, looking through bound methods and `functools.partial`."""
+    while True:
+        if isinstance(func, functools.partial):
+            func = func.func
+        elif hasattr(func, "__func__"):  # bound method
+            func = func.__func__
+        else:
+            break
+    code = getattr(func, "__code__", None)
+    return code.co_flags if code is not None else 0
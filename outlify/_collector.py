@@ -0,0 +1,164 @@
+"""Timing statistics combined from many functions, threads and processes."""
+import threading
+from collections.abc import Callable, Sequence
+
+from outlify._report import format_bytes, format_duration, styling_text, table
+from outlify._stats import TimingStats
+from outlify.style import AnsiCodes, Style
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    from typing import Any
+
+__all__ = ["TimingCollector"]
+
+
+class _Buffer:
+    """Statistics recorded by a single thread and not flushed to the collector yet."""
+
+    __slots__ = ("pending", "stats")
+
+    def __init__(self) -> None:
+        self.stats: dict[str, TimingStats] = {}
+        self.pending = 0
+
+
+class TimingCollector:
+    """Collect timing statistics of many functions into one report.
+
+    Every thread records into its own buffer without locking and flushes it to the shared
+    statistics after every `flush_every` records. Statistics of other processes are combined
+    with `snapshot()` in the child process and `merge()` in the parent one.
+    """
+
+    def __init__(self, *, flush_every: int = 1000) -> None:
+        """Create an empty collector.
+
+        :param flush_every: number of records after which a thread flushes its buffer to the shared statistics
+        """
+        if flush_every < 1:
+            error = f"Invalid value for flush_every: {flush_every} < 1"
+            raise ValueError(error)
+        self.flush_every = flush_every
+        self._stats: dict[str, TimingStats] = {}
+        self._buffers: list[_Buffer] = []
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def add(self, name: str, seconds: float, items: int = 0, memory: tuple[int, int] | None = None) -> None:
+        """Record a single duration of the named function in the current thread's buffer.
+
+        :param memory: peak and net memory allocated during the call in bytes, if measured
+        """
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None:
+            buffer = self._local.buffer = _Buffer()
+            with self._lock:
+                self._buffers.append(buffer)
+
+        stats = buffer.stats.get(name)
+        if stats is None:
+            stats = buffer.stats[name] = TimingStats()
+        stats.add(seconds, items, memory)
+        buffer.pending += 1
+        if buffer.pending >= self.flush_every:
+            self.flush()
+
+    def flush(self) -> None:
+        """Move the statistics recorded by the current thread to the shared statistics."""
+        buffer = getattr(self._local, "buffer", None)
+        if buffer is None or not buffer.pending:
+            return
+        with self._lock:
+            _merge_into(self._stats, buffer.stats)
+            buffer.stats = {}
+            buffer.pending = 0
+
+    def stats(self) -> dict[str, TimingStats]:
+        """Get combined statistics of every function, including records not flushed by other threads yet.
+
+        Buffers of other threads are read while they may be recording,
+        so their latest records can be partially included.
+        """
+        self.flush()
+        combined: dict[str, TimingStats] = {}
+        with self._lock:
+            _merge_into(combined, self._stats)
+            for buffer in self._buffers:
+                _merge_into(combined, dict(buffer.stats))
+        return combined
+
+    def snapshot(self, *, reset: bool = False) -> dict[str, dict[str, "Any"]]:
+        """Get the combined statistics as a JSON-serializable (and picklable) dict, see `merge`.
+
+        :param reset: forget the statistics after taking the snapshot, so the next snapshot
+                      contains only new records, e.g. when a worker process sends a snapshot after every task
+        """
+        snapshot = {name: stats.snapshot() for name, stats in self.stats().items()}
+        if reset:
+            self.reset()
+        return snapshot
+
+    def merge(self, snapshot: dict[str, dict[str, "Any"]]) -> None:
+        """Add statistics from the `snapshot()` result, e.g. of a child process."""
+        with self._lock:
+            _merge_into(self._stats, {name: TimingStats.from_snapshot(data) for name, data in snapshot.items()})
+
+    def reset(self) -> None:
+        """Forget all collected statistics."""
+        with self._lock:
+            self._stats = {}
+            for buffer in self._buffers:
+                buffer.stats = {}
+                buffer.pending = 0
+
+    def report(
+            self, time_format: str = "{h:02}:{m:02}:{s:02}.{ms:03}",
+            time_style: Style | Sequence[AnsiCodes] | None = None,
+            output_func: Callable[[str], None] = print,
+            *,
+            color: str | None = None,
+    ) -> None:
+        """Output one table with the combined statistics of every function.
+
+        :param time_format: a string format specifying how the durations will be displayed, see `timer`
+        :param time_style: enumeration of time styles. Any class inherited from AnsiCodes,
+                           including Colors, Back and Styles
+        :param output_func: function for outputting the report
+        :param color: color mode of the report: "auto", "always" or "never", the global mode by default
+
+        :raises KeyError: used invalid key(s) of 'time_format' format-string
+        :raises ValueError: invalid format spec in 'time_format' format-string, e.g. "{ms:zz}"
+        """
+        def styled(seconds: float) -> str:
+            return styling_text(format_duration(seconds, fmt=time_format), style=time_style, color=color)
+
+        combined = sorted(self.stats().items())
+        memory = any(stats.memory_peak is not None for _, stats in combined)
+        rows = [("name", "calls", "total", "mean", "p50", "p95", "p99", "max")]
+        if memory:
+            rows[0] += ("peak memory", "net memory")
+        for name, stats in combined:
+            row = (
+                name, str(stats.count), styled(stats.total), styled(stats.mean), styled(stats.percentile(50)),
+                styled(stats.percentile(95)), styled(stats.percentile(99)), styled(stats.max),
+            )
+            if memory:
+                measured = stats.memory_peak is not None
+                row += (
+                    format_bytes(stats.memory_peak) if measured else "-",
+                    format_bytes(stats.memory_net, sign=True) if measured else "-",
+                )
+            rows.append(row)
+        output_func(table(rows))
+
+    def __repr__(self) -> str:
+        """Return an unambiguous string representation of the collector for debugging."""
+        return f"{self.__class__.__name__}(flush_every={self.flush_every}, names={sorted(self.stats())})"
+
+
+def _merge_into(target: dict[str, TimingStats], source: dict[str, TimingStats]) -> None:
+    for name, stats in source.items():
+        if name not in target:
+            target[name] = TimingStats()
+        target[name].merge(stats)
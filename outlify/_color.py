@@ -0,0 +1,215 @@
+"""Terminal color depth detection and conversion of RGB colors to the codes the terminal supports."""
+import functools
+import os
+import sys
+from enum import IntEnum
+
+__all__ = [
+    "COLOR_MODES", "ColorDepth", "color_codes", "detect_color", "detect_color_depth", "get_color_depth",
+    "get_color_mode", "palette_rgb", "palette_to_standard", "parse_hex", "rgb_to_palette", "rgb_to_standard",
+    "set_color_depth", "set_color_mode", "standard_code", "use_color",
+]
+
+
+class ColorDepth(IntEnum):
+    """Number of colors the terminal can display, as bits per color."""
+
+    no_color = 0
+    standard = 4    # 16 colors: `Colors.red`, `Colors.gold`, etc.
+    extended = 8    # 256-color palette
+    truecolor = 24  # any RGB color
+
+
+# RGB values of the 16 standard colors as xterm shows them by default (terminal themes may change them)
+STANDARD_RGB = (
+    (0, 0, 0), (205, 0, 0), (0, 205, 0), (205, 205, 0), (0, 0, 238), (205, 0, 205), (0, 205, 205), (229, 229, 229),
+    (127, 127, 127), (255, 0, 0), (0, 255, 0), (255, 255, 0), (92, 92, 255), (255, 0, 255), (0, 255, 255),
+    (255, 255, 255),
+)
+CUBE_LEVELS = (0, 95, 135, 175, 215, 255)  # channel values of the 6x6x6 color cube, palette colors 16-231
+GRAY_LEVELS = tuple(8 + 10 * step for step in range(24))  # palette colors 232-255
+_HEX_DIGITS = frozenset("0123456789abcdefABCDEF")
+_settings: dict[str, ColorDepth | None] = {"depth": None}  # set by `set_color_depth`
+COLOR_MODES = ("auto", "always", "never")
+_mode = {"mode": "auto"}  # set by `set_color_mode`
+
+
+@functools.cache
+def detect_color_depth() -> ColorDepth:
+    """Detect the color depth of the terminal once per process.
+
+    `COLORTERM=truecolor` (or `24bit`) and Windows Terminal mean any RGB color, `TERM` ending with `256color` -
+    the 256-color palette, `TERM=dumb` - no colors, any other `TERM` - the 16 standard colors.
+    Without `TERM` (e.g. in the Windows console), the 16 colors are assumed if stdout is a terminal,
+    otherwise no colors.
+    """
+    if os.environ.get("COLORTERM", "").lower() in ("truecolor", "24bit") or "WT_SESSION" in os.environ:
+        return ColorDepth.truecolor
+    term = os.environ.get("TERM", "").lower()
+    if term.endswith("256color"):
+        return ColorDepth.extended
+    if term == "dumb":
+        return ColorDepth.no_color
+    if term:
+        return ColorDepth.standard
+    isatty = getattr(sys.stdout, "isatty", None)
+    return ColorDepth.standard if isatty is not None and isatty() else ColorDepth.no_color
+
+
+def get_color_depth() -> ColorDepth:
+    """Get the color depth set by `set_color_depth` or else detected for the terminal."""
+    depth = _settings["depth"]
+    return detect_color_depth() if depth is None else depth
+
+
+def set_color_depth(depth: ColorDepth | int | None) -> None:
+    """Override the detected color depth for the colors created afterward, `None` restores the detection.
+
+    :param depth: `ColorDepth` or the number of bits: 0, 4, 8 or 24
+    """
+    _settings["depth"] = None if depth is None else ColorDepth(depth)
+
+
+@functools.cache
+def detect_color() -> bool:
+    """Decide once per process whether the "auto" color mode outputs styles.
+
+    A non-empty `NO_COLOR` disables styles and a non-empty `FORCE_COLOR` enables them (see no-color.org
+    and force-color.org), `NO_COLOR` wins if both are set. Otherwise styles are output only if stdout
+    is a terminal that supports colors.
+    """
+    if os.environ.get("NO_COLOR"):
+        return False
+    if os.environ.get("FORCE_COLOR"):
+        return True
+    isatty = getattr(sys.stdout, "isatty", None)
+    return isatty is not None and isatty() and detect_color_depth() > ColorDepth.no_color
+
+
+def get_color_mode() -> str:
+    """Get the global color mode set by `set_color_mode`: "auto" (default), "always" or "never"."""
+    return _mode["mode"]
+
+
+def set_color_mode(mode: str) -> None:
+    """Set the global color mode for the output created afterward.
+
+    :param mode: "auto" - style the output only for a color terminal, honouring `NO_COLOR` and `FORCE_COLOR`,
+                 "always" - always style it, "never" - never style it, no escape sequences are even built
+    """
+    _validate_mode(mode)
+    _mode["mode"] = mode
+
+
+def use_color(mode: str | None = None) -> bool:
+    """Decide whether to style the output.
+
+    :param mode: color mode of a single call that overrides the global one, `None` uses the global mode
+    """
+    if mode is None:
+        mode = _mode["mode"]
+    if mode == "auto":
+        return detect_color()
+    if mode == "always":
+        return True
+    _validate_mode(mode)
+    return False
+
+
+def _validate_mode(mode: str) -> None:
+    if mode not in COLOR_MODES:
+        error = f"Invalid value for color mode: {mode!r} is not one of {', '.join(COLOR_MODES)}"
+        raise ValueError(error)
+
+
+def color_codes(rgb: tuple[int, int, int], *, extended: int, standard: int, depth: ColorDepth) -> tuple[int, ...]:
+    """Get the codes of the RGB color for the color depth: exact, the nearest of the palette or of the 16 colors.
+
+    Colors are never dropped completely: with no color support they are converted to the 16 colors,
+    whether to output styles at all is decided elsewhere.
+
+    :param rgb: red, green and blue values from 0 to 255
+    :param extended: code of extended colors, 38 for text or 48 for background
+    :param standard: code of the first of the 8 standard colors, 30 for text or 40 for background
+    :param depth: color depth of the terminal
+    """
+    if depth >= ColorDepth.truecolor:
+        return extended, 2, *rgb
+    if depth >= ColorDepth.extended:
+        return extended, 5, rgb_to_palette(rgb)
+    return (standard_code(rgb_to_standard(rgb), standard=standard),)
+
+
+def standard_code(index: int, *, standard: int) -> int:
+    """Get the code of the standard color by its index from 0 to 15, the last 8 are the bright colors."""
+    return standard + index if index < 8 else standard + 60 + index - 8  # noqa: PLR2004
+
+
+def rgb_to_palette(rgb: tuple[int, int, int]) -> int:
+    """Get the index of the nearest color of the 256-color palette, among the color cube and grays (16-255)."""
+    red, green, blue = rgb
+    cube = (_nearest_cube_level(red), _nearest_cube_level(green), _nearest_cube_level(blue))
+    gray = min(max(((red + green + blue) // 3 - 3) // 10, 0), len(GRAY_LEVELS) - 1)
+    cube_rgb = (CUBE_LEVELS[cube[0]], CUBE_LEVELS[cube[1]], CUBE_LEVELS[cube[2]])
+    gray_rgb = (GRAY_LEVELS[gray],) * 3
+    if _distance(rgb, gray_rgb) < _distance(rgb, cube_rgb):
+        return 232 + gray
+    return 16 + 36 * cube[0] + 6 * cube[1] + cube[2]
+
+
+def rgb_to_standard(rgb: tuple[int, int, int]) -> int:
+    """Get the index of the nearest of the 16 standard colors through the nearest palette color."""
+    return palette_to_standard(rgb_to_palette(rgb))
+
+
+def palette_to_standard(index: int) -> int:
+    """Get the index of the nearest of the 16 standard colors to the palette color, from a precomputed table."""
+    return _palette_to_standard()[index]
+
+
+def palette_rgb(index: int) -> tuple[int, int, int]:
+    """Get the RGB value of the color of the 256-color palette."""
+    if index < 16:  # noqa: PLR2004
+        return STANDARD_RGB[index]
+    if index >= 232:  # noqa: PLR2004
+        return (GRAY_LEVELS[index - 232],) * 3
+    index -= 16
+    return CUBE_LEVELS[index // 36], CUBE_LEVELS[index // 6 % 6], CUBE_LEVELS[index % 6]
+
+
+def parse_hex(color: str) -> tuple[int, int, int]:
+    """Parse `#rrggbb` or `#rgb` (`#` is optional) into red, green and blue values.
+
+    :raises ValueError: the color is not a hex color
+    """
+    digits = color.removeprefix("#")
+    if len(digits) == 3:  # noqa: PLR2004
+        digits = "".join(digit * 2 for digit in digits)
+    if len(digits) != 6 or not _HEX_DIGITS.issuperset(digits):  # noqa: PLR2004
+        error = f"Invalid hex color: {color!r} is not #rrggbb or #rgb"
+        raise ValueError(error)
+    value = int(digits, 16)
+    return value >> 16, value >> 8 & 0xFF, value & 0xFF
+
+
+@functools.cache
+def _palette_to_standard() -> tuple[int, ...]:
+    """Build the table of the nearest standard colors of all palette colors, once, on the first use."""
+    return tuple(_nearest_standard(palette_rgb(index)) for index in range(256))
+
+
+def _nearest_standard(rgb: tuple[int, int, int]) -> int:
+    return min(range(len(STANDARD_RGB)), key=lambda index: _distance(rgb, STANDARD_RGB[index]))
+
+
+def _nearest_cube_level(value: int) -> int:
+    """Get the index of the nearest of `CUBE_LEVELS`: the levels are 40 apart except the first two."""
+    if value < 48:  # noqa: PLR2004
+        return 0
+    if value < 115:  # noqa: PLR2004
+        return 1
+    return (value - 35) // 40
+
+
+def _distance(first: tuple[int, int, int], second: tuple[int, int, int]) -> int:
+    return (first[0] - second[0]) ** 2 + (first[1] - second[1]) ** 2 + (first[2] - second[2]) ** 2
@@ -0,0 +1,65 @@
+"""Lazy flattening of nested mappings and sequences into pairs of dotted paths and values."""
+from collections.abc import Callable, Iterable, Iterator, Mapping, Sequence
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    from typing import Any
+
+__all__ = ["flatten"]
+
+
+_END = object()
+
+
+def flatten(
+        pairs: Iterable[tuple[str, "Any"]], *, max_depth: int, keep: Callable[[str], bool] | None = None,
+) -> Iterator[tuple[str, "Any"]]:
+    """Lazily replace nested mappings and sequences with their items under dotted paths.
+
+    For example, `("db", {"hosts": ["a"]})` becomes `("db.hosts[0]", "a")`. The traversal uses an explicit
+    stack of iterators instead of recursion, so only the current path is kept in memory and the first pair
+    is available immediately, however large the data is.
+    A container that is already on the current path (a cycle) is replaced with `{...}` or `[...]`,
+    like in `repr`, and empty containers are kept as values.
+
+    :param pairs: top-level keys and values
+    :param max_depth: number of nesting levels to expand, deeper containers are kept as values
+    :param keep: predicate of paths whose containers are kept as values, e.g. hidden keys that are masked anyway
+    """
+    for key, value in pairs:
+        if max_depth < 1 or not _expandable(value) or (keep is not None and keep(key)):
+            yield key, value
+            continue
+
+        path_ids = [id(value)]  # containers on the current path, to detect cycles
+        stack = [(key, _children(value))]
+        while stack:
+            prefix, children = stack[-1]
+            child = next(children, _END)
+            if child is _END:
+                stack.pop()
+                path_ids.pop()
+                continue
+
+            name, item = child
+            path = f"{prefix}{name}"
+            if len(stack) >= max_depth or not _expandable(item) or (keep is not None and keep(path)):
+                yield path, item
+            elif id(item) in path_ids:
+                yield path, "{...}" if isinstance(item, Mapping) else "[...]"
+            else:
+                path_ids.append(id(item))
+                stack.append((path, _children(item)))
+
+
+def _expandable(value: "Any") -> bool:
+    """Check whether the value is a non-empty mapping or sequence (other than a string)."""
+    if isinstance(value, str | bytes | bytearray):
+        return False
+    return isinstance(value, Mapping | Sequence) and len(value) > 0
+
+
+def _children(container: Mapping["Any", "Any"] | Sequence["Any"]) -> Iterator[tuple[str, "Any"]]:
+    if isinstance(container, Mapping):
+        return ((f".{key}", value) for key, value in container.items())
+    return ((f"[{index}]", value) for index, value in enumerate(container))
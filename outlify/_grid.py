@@ -0,0 +1,63 @@
+"""Packing of items into the maximum number of columns that fit the width, like `ls` does."""
+from collections.abc import Iterator, Sequence
+
+__all__ = ["LAYOUTS", "fit_columns", "iter_grid"]
+
+
+LAYOUTS = ("inline", "columns", "rows")
+
+
+def fit_columns(widths: Sequence[int], *, width: int, gap: int, column_major: bool) -> list[int]:
+    """Find the maximum number of columns that fit the width and get the width of every column.
+
+    Column counts are tried from the upper bound given by the narrowest item down to one.
+    Every try takes the maxima of slices of the precomputed widths and stops as soon as
+    the columns exceed the width, so it costs about one pass over the widths in C.
+
+    :param widths: display widths of the items
+    :param width: available width
+    :param gap: display width of the separator between columns
+    :param column_major: items fill columns top to bottom (like `ls`), otherwise rows left to right (like `ls -x`)
+    :return: widths of the columns, at least one column
+    """
+    count = len(widths)
+    if not count:
+        return []
+    narrowest = min(widths) + gap
+    most = min(count, (width + gap) // narrowest) if narrowest else count
+    for requested in range(most, 1, -1):
+        rows = -(-count // requested)
+        if column_major:  # the same number of rows can need fewer columns
+            slices = (widths[column * rows:(column + 1) * rows] for column in range(-(-count // rows)))
+        else:
+            slices = (widths[column::requested] for column in range(requested))
+
+        column_widths, total = [], -gap
+        for part in slices:
+            column_widths.append(max(part))
+            total += column_widths[-1] + gap
+            if total > width:
+                break
+        else:
+            return column_widths
+    return [max(widths)]
+
+
+def iter_grid(
+        items: Sequence[str], widths: Sequence[int], column_widths: Sequence[int], *, separator: str,
+        column_major: bool,
+) -> Iterator[str]:
+    """Lazily yield the lines of the grid, items are padded to their column width, except the last ones."""
+    columns = len(column_widths)
+    if not columns:
+        return
+    count = len(items)
+    rows = -(-count // columns)
+    for row in range(rows):
+        indexes = range(row, count, rows) if column_major else range(row * columns, min((row + 1) * columns, count))
+        cells = [
+            f"{items[index]}{' ' * (column_width - widths[index])}"
+            for index, column_width in zip(indexes, column_widths, strict=False)
+        ]
+        cells[-1] = items[indexes[-1]]
+        yield separator.join(cells)
@@ -0,0 +1,29 @@
+"""Deferred compilation of regular expressions, so importing outlify does not import `re`."""
+
+__all__ = ["LazyPattern"]
+
+
+class LazyPattern:
+    """Regular expression compiled, together with the import of `re`, on the first use of any of its methods.
+
+    Used methods are stored on the instance, so later calls cost the same as on the compiled pattern.
+    """
+
+    def __init__(self, pattern: str) -> None:
+        """Remember the pattern without compiling it.
+
+        :param pattern: regular expression source
+        """
+        self.pattern = pattern
+
+    def __getattr__(self, name: str) -> object:
+        """Get the attribute of the compiled pattern and keep it for the next lookups."""
+        import re
+
+        value = getattr(re.compile(self.pattern), name)
+        setattr(self, name, value)
+        return value
+
+    def __repr__(self) -> str:
+        """Return the representation of the pattern the same as `re.compile` would."""
+        return f"{self.__class__.__name__}({self.pattern!r})"
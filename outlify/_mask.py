@@ -0,0 +1,113 @@
+"""Matching of parameter names against the patterns of hidden keys, with memoized results."""
+import functools
+from collections.abc import Collection
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    import re
+    from collections.abc import Iterable
+    from typing import Any
+
+__all__ = ["HiddenKeys", "hidden_keys", "mask"]
+
+
+MASK = "*****"
+MEMO_SIZE = 65536  # the memo is cleared when it grows to this many keys
+_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+class HiddenKeys:
+    """Decide whether a parameter is hidden by any of the patterns, i.e. any pattern `fullmatch`es its name.
+
+    Patterns are split by their form, so most names are decided without running a regex:
+    `literal` is checked by set membership, `literal.*` by `str.startswith` and `.*literal.*`
+    by the `in` operator. All other patterns are combined into one alternation, except patterns with flags
+    (which can be set inline, only at the start of a pattern) and groups (whose backreferences would break
+    in an alternation): they are matched on their own.
+    The decision is memoized per name, so a name rendered many times is matched once.
+    """
+
+    __slots__ = ("_exact", "_memo", "_prefixes", "_regexes", "_substrings")
+
+    def __init__(self, patterns: "Iterable[re.Pattern[str]]") -> None:
+        """Prepare the patterns for matching."""
+        import re
+
+        default_flags = re.compile("").flags  # re.UNICODE for str patterns
+        self._exact: set[str] = set()
+        prefixes: list[str] = []
+        self._substrings: list[str] = []
+        alternation: list[str] = []
+        self._regexes: list[re.Pattern[str]] = []
+        for pattern in patterns:
+            source = pattern.pattern
+            plain = pattern.flags == default_flags
+            if plain and _is_literal(source):
+                self._exact.add(source)
+            elif plain and source.startswith(".*") and source.endswith(".*") and _is_literal(source[2:-2]):
+                self._substrings.append(source[2:-2])
+            elif plain and source.endswith(".*") and _is_literal(source[:-2]):
+                prefixes.append(source[:-2])
+            elif plain and not pattern.groups:
+                alternation.append(f"(?:{source})")
+            else:
+                self._regexes.append(pattern)
+        self._prefixes = tuple(prefixes)
+        if alternation:
+            self._regexes.append(re.compile("|".join(alternation)))
+        self._memo: dict[str, bool] = {}
+
+    def __call__(self, key: str) -> bool:
+        """Check whether the parameter with the name is hidden."""
+        hidden = self._memo.get(key)
+        if hidden is not None:
+            return hidden
+        if len(self._memo) >= MEMO_SIZE:
+            self._memo.clear()
+        hidden = self._memo[key] = self._match(key)
+        return hidden
+
+    def _match(self, key: str) -> bool:
+        if key in self._exact:
+            return True
+        if "\n" not in key:  # `.` does not match a line break
+            if self._prefixes and key.startswith(self._prefixes):
+                return True
+            for literal in self._substrings:
+                if literal in key:
+                    return True
+        for regex in self._regexes:  # noqa: SIM110 - faster than any() with a generator
+            if regex.fullmatch(key):
+                return True
+        return False
+
+
+@functools.lru_cache(maxsize=32)
+def hidden_keys(patterns: "tuple[re.Pattern[str], ...]") -> HiddenKeys:
+    """Get the shared matcher of the patterns, so its memo is reused by every panel with the same `hidden`."""
+    return HiddenKeys(patterns)
+
+
+def mask(value: "Any", *, visible: int = 0) -> str:
+    """Replace the value with asterisks, an empty string stays empty.
+
+    Collections (lists, dicts, bytes, etc.) are replaced entirely without converting them to a string,
+    so hiding a huge value costs nothing. Other values are converted with `str`.
+
+    :param value: value of a hidden parameter
+    :param visible: number of the last characters left visible, they are shown only
+                    if the value is more than twice as long, so short secrets are hidden entirely
+    """
+    if not isinstance(value, str):
+        if isinstance(value, Collection):
+            return MASK
+        value = str(value)
+    if not value:
+        return value
+    if visible and len(value) > visible * 2:
+        return f"{MASK}{value[-visible:]}"
+    return MASK
+
+
+def _is_literal(source: str) -> bool:
+    return _METACHARACTERS.isdisjoint(source)
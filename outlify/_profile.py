@@ -0,0 +1,149 @@
+"""Profiling of decorated functions: deterministic with `cProfile` or by sampling stacks of slow calls."""
+import contextlib
+import os
+import sys
+import threading
+import time
+from collections.abc import Iterator
+from types import CodeType, FrameType
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    import cProfile
+
+__all__ = ["SORT_KEYS", "FunctionStats", "SampledCall", "cprofile_stats", "watch"]
+
+
+SORT_KEYS = ("cumulative", "self")
+
+# function label: (number of calls or samples, self seconds, cumulative seconds)
+FunctionStats = dict[str, tuple[int, float, float]]
+
+
+def function_label(filename: str, line: int, name: str) -> str:
+    """Get a short label of the function: `name (file.py:line)`, or just the name for built-ins."""
+    if filename == "~":  # built-in functions in cProfile stats
+        return name
+    return f"{name} ({os.path.basename(filename)}:{line})"  # noqa: PTH119
+
+
+def cprofile_stats(profiler: "cProfile.Profile") -> FunctionStats:
+    """Get the statistics of every function called while the profiler was enabled."""
+    profiler.create_stats()
+    return {
+        function_label(*function): (calls, own, cumulative)
+        for function, (_, calls, own, cumulative, _) in profiler.stats.items()  # type: ignore[attr-defined]
+        if function[2] != "<method 'disable' of '_lsprof.Profiler' objects>"
+    }
+
+
+class SampledCall:
+    """A running call whose stack is sampled once it has been running longer than the threshold."""
+
+    __slots__ = ("code", "cumulative", "interval", "own", "samples", "start", "thread_id", "threshold")
+
+    def __init__(self, code: CodeType, *, threshold: float, interval: float) -> None:
+        """Register the call of the function with the code, made by the current thread."""
+        self.code = code
+        self.thread_id = threading.get_ident()
+        self.threshold = threshold
+        self.interval = interval
+        self.start = time.perf_counter()
+        self.samples = 0
+        self.own: dict[str, int] = {}
+        self.cumulative: dict[str, int] = {}
+
+    def sample(self, frame: FrameType) -> None:
+        """Count the functions of the stack, from the top frame down to the frame of the decorated function."""
+        self.samples += 1
+        labels = list(_stack_labels(frame, self.code))
+        if not labels:
+            return
+        self.own[labels[0]] = self.own.get(labels[0], 0) + 1
+        for label in set(labels):
+            self.cumulative[label] = self.cumulative.get(label, 0) + 1
+
+    def stats(self, duration: float) -> FunctionStats:
+        """Get the statistics of sampled functions.
+
+        Samples are not taken exactly every interval (e.g. the sampling thread waits for the GIL),
+        so the time of a function is estimated as its share of samples of the sampled part of the call.
+
+        :param duration: duration of the whole call in seconds
+        """
+        if not self.samples:
+            return {}
+        per_sample = max(duration - self.threshold, 0.0) / self.samples
+        return {
+            label: (samples, self.own.get(label, 0) * per_sample, samples * per_sample)
+            for label, samples in self.cumulative.items()
+        }
+
+
+def _stack_labels(frame: FrameType | None, code: CodeType) -> Iterator[str]:
+    while frame is not None:
+        frame_code = frame.f_code
+        yield function_label(frame_code.co_filename, frame_code.co_firstlineno, frame_code.co_name)
+        if frame_code is code:
+            return
+        frame = frame.f_back
+
+
+class _Watcher:
+    """A single daemon thread sampling stacks of all registered calls that run longer than their threshold."""
+
+    def __init__(self) -> None:
+        self._calls: dict[int, SampledCall] = {}
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def register(self, call: SampledCall) -> None:
+        with self._lock:
+            self._calls[id(call)] = call
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="outlify-profile", daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+
+    def unregister(self, call: SampledCall) -> None:
+        with self._lock:
+            self._calls.pop(id(call), None)
+
+    def _run(self) -> None:
+        while True:
+            with self._lock:
+                calls = list(self._calls.values())
+            if not calls:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            now = time.perf_counter()
+            due = [call for call in calls if now - call.start >= call.threshold]
+            if due:
+                frames = sys._current_frames()  # noqa: SLF001 - the only way to get stacks of other threads
+                for call in due:
+                    frame = frames.get(call.thread_id)
+                    if frame is not None:
+                        call.sample(frame)
+                del frames
+            wait = min(
+                call.interval if now - call.start >= call.threshold else call.start + call.threshold - now
+                for call in calls
+            )
+            if self._wakeup.wait(max(wait, 0.0001)):  # a new call may need to be sampled earlier
+                self._wakeup.clear()
+
+
+_watcher = _Watcher()
+
+
+@contextlib.contextmanager
+def watch(call: SampledCall) -> Iterator[SampledCall]:
+    """Sample the stack of the call while the `with` block runs."""
+    _watcher.register(call)
+    try:
+        yield call
+    finally:
+        _watcher.unregister(call)
@@ -0,0 +1,172 @@
+"""Formatting of measured durations and timing reports."""
+import functools
+from collections.abc import Callable, Sequence
+
+from outlify import _width
+from outlify._sampling import Sampler
+from outlify._stats import TimingStats
+from outlify._utils import get_reset_by_style, parse_styles
+from outlify.style import AnsiCodes, Style
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    from typing import Any
+
+__all__ = [
+    "TIME_KEYS", "compile_time_format", "format_bytes", "format_duration", "get_memory", "get_message",
+    "get_message_parts", "get_summary", "get_throughput", "styling_text", "table",
+]
+
+
+TIME_KEYS = frozenset(("h", "m", "s", "ms", "us", "ns"))
+
+
+def format_duration(seconds: float, *, fmt: str) -> str:
+    """Format the duration specified in seconds according to the specified pattern."""
+    return compile_time_format(fmt)(int(seconds * 1e9))
+
+
+@functools.cache
+def compile_time_format(fmt: str) -> Callable[[int], str]:
+    """Validate the pattern once and get a function formatting durations specified in nanoseconds.
+
+    :raises KeyError: unavailable key(s) in the pattern
+    :raises ValueError: invalid format spec, e.g. "{ms:zz}"
+    """
+    import string  # slow to import (it compiles regular expressions), so only when a format is compiled
+
+    keys = {field for _, field, _, _ in string.Formatter().parse(fmt) if field is not None}
+    if not {key.split(".")[0].split("[")[0] for key in keys} <= TIME_KEYS:
+        error = (
+            "Unavailable key(s) in 'time_format' format-string. Available keys: "
+            "h - hours, m - minutes, s - seconds, ms - milliseconds, us - microseconds, ns - nanoseconds"
+        )
+        raise KeyError(error)
+
+    def format_ns(nanoseconds: int) -> str:
+        total_microseconds, nanoseconds = divmod(nanoseconds, 1000)
+        total_milliseconds, microseconds = divmod(total_microseconds, 1000)
+        total_seconds, milliseconds = divmod(total_milliseconds, 1000)
+        total_minutes, seconds = divmod(total_seconds, 60)
+        hours, minutes = divmod(total_minutes, 60)
+        return fmt.format(h=hours, m=minutes, s=seconds, ms=milliseconds, us=microseconds, ns=nanoseconds)
+
+    format_ns(0)  # raise errors of format specs (e.g. "{ms:zz}") now, not on every formatted duration
+    return format_ns
+
+
+def format_bytes(size: int, *, sign: bool = False) -> str:
+    """Format the number of bytes with a binary unit, e.g. "512 B" or "1.5 MiB".
+
+    :param sign: always show the sign, e.g. "+1.5 MiB", for changes of allocated memory
+    """
+    prefix = "+" if sign and size >= 0 else ""
+    if abs(size) < 1024:  # noqa: PLR2004
+        return f"{prefix}{size} B"
+    value = float(size)
+    for unit in ("KiB", "MiB", "GiB"):
+        value /= 1024
+        if abs(value) < 1024 or unit == "GiB":  # noqa: PLR2004
+            break
+    return f"{prefix}{value:.1f} {unit}"
+
+
+def get_memory(peak: int, net: int) -> str:
+    return f"peak {format_bytes(peak)}, net {format_bytes(net, sign=True)}"
+
+
+def get_summary(
+        stats: TimingStats, *, time_format: str, time_style: Style | Sequence[AnsiCodes] | None, connector: str,
+        label: str | None, label_style: Style | Sequence[AnsiCodes] | None, funcname: str, panel: bool,
+        throughput: bool, sampler: Sampler | None = None, color: str | None = None,
+) -> str:
+    """Get the summary of the recorded durations as a single line or as a `ParamsPanel`.
+
+    With sampling, the number of calls is taken from the sampler, and the total duration
+    and the number of items are scaled from the measured calls to all calls.
+    """
+    calls, total, items = stats.count, stats.total, stats.items
+    if sampler is not None and sampler.calls > stats.count:
+        calls = sampler.calls
+        total = stats.mean * calls
+        items = round(stats.items * calls / stats.count)
+
+    durations = {
+        "total": total, "mean": stats.mean, "min": stats.min,
+        "p50": stats.percentile(50), "p95": stats.percentile(95), "p99": stats.percentile(99), "max": stats.max,
+    }
+    durations = {name: format_duration(seconds, fmt=time_format) for name, seconds in durations.items()}
+
+    if panel:
+        from outlify.panel import ParamsPanel
+
+        params: dict[str, Any] = {"calls": calls}
+        if calls != stats.count:
+            params["sampled"] = stats.count
+        params.update(
+            (name, styling_text(duration, style=time_style, color=color)) for name, duration in durations.items()
+        )
+        if throughput:
+            params["items"] = items
+            params["items/sec"] = f"{stats.throughput:.1f}"
+        if stats.memory_peak is not None:
+            params["peak memory"] = format_bytes(stats.memory_peak)
+            params["net memory"] = format_bytes(stats.memory_net, sign=True)
+        title = label if label else f"Function {funcname}"
+        return str(ParamsPanel(params, title=f" {title} ", title_style=label_style, hidden=(), color=color))
+
+    details = ", ".join(
+        f"{name}: {styling_text(durations[name], style=time_style, color=color)}"
+        for name in ("min", "p50", "p95", "p99", "max")
+    )
+    message = get_message(
+        durations["mean"], time_style, connector,
+        label, label_style, funcname=funcname, color=color,
+    )
+    if throughput:
+        details = f"{details}, {get_throughput(items, total)}"
+    if stats.memory_peak is not None:
+        details = f"{details}, {get_memory(stats.memory_peak, stats.memory_net)}"
+    calls_text = f"{calls} calls" if calls == stats.count else f"{calls} calls, {stats.count} sampled"
+    return f"{message} on average over {calls_text} ({details})"
+
+
+def get_throughput(items: int, seconds: float) -> str:
+    rate = items / seconds if seconds else 0.0
+    return f"{items} items, {rate:.1f} items/sec"
+
+
+def get_message(
+        duration: str, time_style: Style | Sequence[AnsiCodes] | None, connector: str,
+        label: str | None, label_style: Style | Sequence[AnsiCodes] | None, funcname: str, color: str | None = None,
+) -> str:
+    prefix, suffix = get_message_parts(time_style, connector, label, label_style, funcname=funcname, color=color)
+    return f"{prefix}{duration}{suffix}"
+
+
+def get_message_parts(
+        time_style: Style | Sequence[AnsiCodes] | None, connector: str,
+        label: str | None, label_style: Style | Sequence[AnsiCodes] | None, funcname: str, color: str | None = None,
+) -> tuple[str, str]:
+    """Get the styled text before and after the duration in the message."""
+    label = label if label else f"Function {funcname}"
+    label = styling_text(label, style=label_style, color=color)
+    time_style = parse_styles(time_style, color)
+    return f"{label} {connector} {time_style}", get_reset_by_style(time_style)
+
+
+def styling_text(text: str, style: Style | Sequence[AnsiCodes] | None, color: str | None = None) -> str:
+    style = parse_styles(style, color)
+    reset = get_reset_by_style(style)
+    return f"{style}{text}{reset}"
+
+
+def table(rows: Sequence[Sequence[str]]) -> str:
+    """Align the rows in columns: the first column to the left, the others to the right."""
+    widths = [max(_width.visible_width(row[column]) for row in rows) for column in range(len(rows[0]))]
+    return "\n".join(
+        "  ".join([_width.ljust(row[0], widths[0])] + [
+            _width.rjust(cell, width) for cell, width in zip(row[1:], widths[1:], strict=True)
+        ])
+        for row in rows
+    )
@@ -0,0 +1,136 @@
+"""Sampling policies deciding which calls of a timed function are measured."""
+import time
+from abc import ABC, abstractmethod
+
+__all__ = ["EveryNth", "PerSecond", "Probability", "Sampler"]
+
+
+class Sampler(ABC):
+    """Base class of sampling policies.
+
+    The policy is called before every call of the timed function and returns whether to measure it.
+    It counts all calls and the measured ones, so the statistics can be scaled to all calls.
+    Counters are not locked: with many threads the number of calls can be slightly underestimated.
+    """
+
+    __slots__ = ("calls", "sampled")
+
+    def __init__(self) -> None:
+        """Create a policy with zero counters."""
+        self.calls = 0
+        self.sampled = 0
+
+    @abstractmethod
+    def __call__(self) -> bool:
+        """Count the call and decide whether to measure it."""
+
+    def reset(self) -> None:
+        """Reset the counters."""
+        self.calls = 0
+        self.sampled = 0
+
+    def __repr__(self) -> str:
+        """Return an unambiguous string representation of the policy for debugging."""
+        return f"{self.__class__.__name__}(calls={self.calls}, sampled={self.sampled})"
+
+
+class EveryNth(Sampler):
+    """Measure one call out of every `n` calls."""
+
+    __slots__ = ("_countdown", "n")
+
+    def __init__(self, n: int) -> None:
+        """Create a policy measuring the 1st, (n+1)th, (2n+1)th, ... calls.
+
+        :param n: measure one call out of every `n`
+        """
+        if n < 1:
+            error = f"Invalid value for n: {n} < 1"
+            raise ValueError(error)
+        super().__init__()
+        self.n = n
+        self._countdown = 1
+
+    def __call__(self) -> bool:
+        """Count the call and decide whether to measure it."""
+        self.calls += 1
+        self._countdown -= 1
+        if self._countdown:
+            return False
+        self._countdown = self.n
+        self.sampled += 1
+        return True
+
+    def reset(self) -> None:
+        """Reset the counters."""
+        super().reset()
+        self._countdown = 1
+
+
+class Probability(Sampler):
+    """Measure every call with the given probability."""
+
+    __slots__ = ("_random", "probability")
+
+    def __init__(self, probability: float) -> None:
+        """Create a policy measuring a random subset of calls.
+
+        :param probability: probability of measuring a call, from 0 (exclusive) to 1
+        """
+        if not 0 < probability <= 1:
+            error = f"Invalid value for probability: {probability} is not in range (0, 1]"
+            raise ValueError(error)
+        import random  # slow to import, so only when the policy is used
+
+        super().__init__()
+        self.probability = probability
+        self._random = random.random
+
+    def __call__(self) -> bool:
+        """Count the call and decide whether to measure it."""
+        self.calls += 1
+        if self._random() < self.probability:
+            self.sampled += 1
+            return True
+        return False
+
+
+class PerSecond(Sampler):
+    """Measure at most `limit` calls per second, the first calls of each second are measured."""
+
+    __slots__ = ("_window", "_window_sampled", "limit")
+
+    def __init__(self, limit: int) -> None:
+        """Create a policy bounding the number of measured calls per second.
+
+        Unlike `EveryNth` and `Probability`, the measured calls are not spread evenly within a second,
+        so bursts of calls are represented by their first calls.
+
+        :param limit: maximum number of measured calls per second
+        """
+        if limit < 1:
+            error = f"Invalid value for limit: {limit} < 1"
+            raise ValueError(error)
+        super().__init__()
+        self.limit = limit
+        self._window = -1
+        self._window_sampled = 0
+
+    def __call__(self) -> bool:
+        """Count the call and decide whether to measure it."""
+        self.calls += 1
+        window = time.monotonic_ns() // 1_000_000_000
+        if window != self._window:
+            self._window = window
+            self._window_sampled = 0
+        if self._window_sampled >= self.limit:
+            return False
+        self._window_sampled += 1
+        self.sampled += 1
+        return True
+
+    def reset(self) -> None:
+        """Reset the counters."""
+        super().reset()
+        self._window = -1
+        self._window_sampled = 0
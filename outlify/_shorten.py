@@ -0,0 +1,162 @@
+"""Size-limited conversion of values to strings, the cost is bounded by the output size."""
+import collections
+import functools
+import itertools
+import sys
+from collections.abc import Iterator
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    from typing import Any
+
+__all__ = ["ELLIPSIS", "shorten", "validate_limits"]
+
+
+ELLIPSIS = "…"
+_BRACKETS = {list: ("[", "]"), tuple: ("(", ")"), dict: ("{", "}"), set: ("{", "}"), frozenset: ("frozenset({", "})")}
+_CONTAINERS = tuple(_BRACKETS)
+# `repr` of every namedtuple class is a closure over the same code
+_NAMEDTUPLE_REPR = collections.namedtuple("_NamedTuple", ()).__repr__.__code__  # noqa: PYI024
+
+
+class _Leave:
+    """End of a container in the stream of tokens, removes it from the current path."""
+
+    __slots__ = ("container_id",)
+
+    def __init__(self, container_id: int) -> None:
+        self.container_id = container_id
+
+
+def shorten(value: "Any", *, max_chars: int | None, max_items: int | None, max_level: int | None) -> str:
+    """Convert the value to a string like `str`, but not longer than the limits.
+
+    Lists, tuples, dicts, sets and frozensets (including subclasses like `defaultdict`, `OrderedDict`
+    and named tuples, unless they define their own `repr`) are formatted like their `repr` piece by piece,
+    only the first `max_items` items of every container are formatted, and formatting stops
+    as soon as `max_chars` characters are produced, so a container with a million items costs
+    as much as its visible part. Other values are converted with `str` (or `repr` inside containers)
+    and then truncated, their cost depends on their own `__str__`.
+
+    :param value: value to convert
+    :param max_chars: maximum number of characters, longer strings end with `…`
+    :param max_items: maximum number of items shown in every container, the rest is replaced with `…`
+    :param max_level: maximum nesting level of containers, deeper containers are shown as `[…]`, `{…}`, etc.
+    """
+    if max_chars is None and max_items is None and max_level is None:
+        return str(value)
+    if _get_brackets(value) is None:
+        text = value if isinstance(value, str) else str(value)
+        return _truncate(text, max_chars)
+
+    pieces = _iter_pieces(value, max_chars=max_chars, max_items=max_items, max_level=max_level)
+    if max_chars is None:
+        return "".join(pieces)
+    result, length = [], 0
+    for piece in pieces:
+        result.append(piece)
+        length += len(piece)
+        if length > max_chars:
+            break
+    return _truncate("".join(result), max_chars)
+
+
+def validate_limits(*, max_chars: int | None, max_items: int | None, max_level: int | None) -> None:
+    """Check that the limits of `shorten` are not negative."""
+    for name, limit in (("max_chars", max_chars), ("max_items", max_items), ("max_level", max_level)):
+        if limit is not None and limit < 0:
+            error = f"Invalid value for {name}: {limit} < 0"
+            raise ValueError(error)
+
+
+def _get_brackets(value: "Any") -> tuple[str, str] | None:
+    """Get the parts of the container's `repr` around its items, None if it is not formatted piece by piece."""
+    brackets = _BRACKETS.get(type(value))
+    if brackets is not None or not isinstance(value, _CONTAINERS):
+        return brackets
+    if type(value).__repr__ is collections.defaultdict.__repr__:
+        return f"{type(value).__name__}({value.default_factory!r}, {{", "})"
+    return _get_subclass_brackets(type(value))
+
+
+@functools.cache
+def _get_subclass_brackets(cls: type) -> tuple[str, str] | None:
+    """Get the parts of `repr` around the items for a subclass of a container, None if it has its own `repr`."""
+    for base in (list, tuple, dict):
+        if issubclass(cls, base) and cls.__repr__ is base.__repr__:
+            return _BRACKETS[base]
+    if cls.__repr__ in (set.__repr__, frozenset.__repr__) or (
+        # `OrderedDict([('key', 'value')])` before Python 3.12
+        sys.version_info >= (3, 12) and cls.__repr__ is collections.OrderedDict.__repr__
+    ):
+        return f"{cls.__name__}({{", "})"
+    if _is_namedtuple(cls):
+        return f"{cls.__name__}(", ")"
+    return None
+
+
+def _is_namedtuple(cls: type) -> bool:
+    return getattr(cls.__repr__, "__code__", None) is _NAMEDTUPLE_REPR
+
+
+def _truncate(text: str, max_chars: int | None) -> str:
+    if max_chars is None or len(text) <= max_chars:
+        return text
+    return f"{text[:max(max_chars - 1, 0)]}{ELLIPSIS}"
+
+
+def _iter_pieces(
+        value: "Any", *, max_chars: int | None, max_items: int | None, max_level: int | None,
+) -> Iterator[str]:
+    """Lazily produce the pieces of the container's representation with an explicit stack instead of recursion."""
+    path_ids: set[int] = set()  # containers being formatted, to detect cycles
+    stack = [iter(((value, 0),))]
+    while stack:
+        token = next(stack[-1], None)
+        if token is None:
+            stack.pop()
+        elif isinstance(token, str):
+            yield token
+        elif isinstance(token, _Leave):
+            path_ids.discard(token.container_id)
+        else:
+            item, level = token
+            brackets = _get_brackets(item)
+            if brackets is None:
+                # a string is cut before `repr`, a cut one is longer than `max_chars` and gets truncated anyway
+                yield repr(item[:max_chars]) if isinstance(item, str) and max_chars is not None else repr(item)
+            elif not item:
+                yield repr(item)  # `[]`, `()`, `{}`, `set()` or `frozenset()`
+            elif id(item) in path_ids:
+                yield f"{brackets[0]}...{brackets[1]}"  # like in `repr` of a recursive container
+            elif max_level is not None and level >= max_level:
+                yield f"{brackets[0]}{ELLIPSIS}{brackets[1]}"
+            else:
+                path_ids.add(id(item))
+                stack.append(_iter_tokens(item, level + 1, brackets, max_items=max_items))
+
+
+def _iter_tokens(
+        container: "Any", level: int, brackets: tuple[str, str], *, max_items: int | None,
+) -> Iterator[str | tuple["Any", int] | _Leave]:
+    """Get the tokens of the container: strings to output and items to format at the level."""
+    yield brackets[0]
+    items = container.items() if isinstance(container, dict) else container
+    fields = container._fields if _is_namedtuple(type(container)) else None
+    for index, item in enumerate(itertools.islice(items, max_items)):
+        if index:
+            yield ", "
+        if isinstance(container, dict):
+            yield item[0], level
+            yield ": "
+            yield item[1], level
+        else:
+            if fields is not None:
+                yield f"{fields[index]}="
+            yield item, level
+    if max_items is not None and len(container) > max_items:
+        yield f", {ELLIPSIS}" if max_items else ELLIPSIS
+    elif brackets is _BRACKETS[tuple] and len(container) == 1:
+        yield ","
+    yield brackets[1]
+    yield _Leave(id(container))
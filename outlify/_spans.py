@@ -0,0 +1,143 @@
+"""Nested timing of named blocks of code, the current span is tracked with `contextvars`."""
+import functools
+import threading
+import time
+from collections.abc import Callable
+from contextvars import ContextVar
+from types import TracebackType
+
+from outlify._code import is_async_generator_function, is_coroutine_function, is_generator_function
+from outlify._trace import TraceSink
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    from typing import Any
+
+__all__ = ["ROOT", "Span", "SpanNode", "span"]
+
+
+class SpanNode:
+    """Accumulated timings of all spans with the same name under the same parent span."""
+
+    __slots__ = ("children", "count", "cpu", "name", "total")
+
+    def __init__(self, name: str) -> None:
+        """Create an empty node of the span tree."""
+        self.name = name
+        self.count = 0
+        self.total = 0.0
+        self.cpu = 0.0
+        self.children: dict[str, SpanNode] = {}
+
+    @property
+    def self_time(self) -> float:
+        """Wall time spent in the span itself, not in its child spans."""
+        return max(self.total - sum(child.total for child in self.children.values()), 0.0)
+
+    def child(self, name: str) -> "SpanNode":
+        """Get the child node with the name, creating it if needed."""
+        node = self.children.get(name)
+        if node is None:
+            with _lock:
+                node = self.children.setdefault(name, SpanNode(name))
+        return node
+
+    def add(self, wall: float, cpu: float) -> None:
+        """Record a single finished span."""
+        with _lock:
+            self.count += 1
+            self.total += wall
+            self.cpu += cpu
+
+    def reset(self) -> None:
+        """Forget all recorded spans below this node."""
+        with _lock:
+            self.children = {}
+            self.count = 0
+            self.total = self.cpu = 0.0
+
+    def __repr__(self) -> str:
+        """Return an unambiguous string representation of the node for debugging."""
+        return (
+            f"{self.__class__.__name__}(name={self.name!r}, count={self.count}, total={self.total}, "
+            f"cpu={self.cpu}, children={list(self.children)})"
+        )
+
+
+_lock = threading.Lock()
+ROOT = SpanNode("")  # top-level spans are children of the root, the root itself is never timed
+_current: ContextVar[SpanNode | None] = ContextVar("outlify_span", default=None)
+_current_trace: ContextVar[TraceSink | None] = ContextVar("outlify_span_trace", default=None)
+
+
+class Span:
+    """A single run of a named block of code, see `span`."""
+
+    __slots__ = ("_cpu_start", "_node", "_sink", "_start", "_token", "_trace_token", "name", "trace")
+
+    def __init__(self, name: str, *, trace: TraceSink | None = None) -> None:
+        """Create a span, it is started when the `with` block is entered."""
+        self.name = name
+        self.trace = trace
+
+    def __enter__(self) -> "Span":
+        """Start the span as a child of the current one."""
+        parent = _current.get()
+        self._node = (ROOT if parent is None else parent).child(self.name)
+        self._token = _current.set(self._node)
+        self._sink = _current_trace.get() if self.trace is None else self.trace
+        self._trace_token = None if self.trace is None else _current_trace.set(self.trace)
+        self._cpu_start = time.thread_time()
+        self._start = time.perf_counter()
+        return self
+
+    def __exit__(
+            self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None,
+    ) -> None:
+        """Finish the span and record its wall and CPU time."""
+        end = time.perf_counter()
+        wall = end - self._start
+        cpu = time.thread_time() - self._cpu_start
+        _current.reset(self._token)
+        if self._trace_token is not None:
+            _current_trace.reset(self._trace_token)
+        self._node.add(wall, cpu)
+        if self._sink is not None:
+            self._sink.emit(
+                self.name, start_ns=int(self._start * 1e9), duration_ns=int(wall * 1e9), category="span",
+                args={"cpu_us": cpu * 1e6},
+            )
+
+    def __call__(self, func: Callable[..., "Any"]) -> Callable[..., "Any"]:
+        """Use the span as a decorator: every call of the function runs in a new span."""
+        if is_generator_function(func) or is_async_generator_function(func):
+            error = "span cannot decorate generators, the span would be left open between items; use timer instead"
+            raise TypeError(error)
+        name, trace = self.name, self.trace
+
+        if is_coroutine_function(func):
+            async def wrapper(*args: "Any", **kwargs: "Any") -> "Any":
+                with Span(name, trace=trace):
+                    return await func(*args, **kwargs)
+        else:
+            def wrapper(*args: "Any", **kwargs: "Any") -> "Any":
+                with Span(name, trace=trace):
+                    return func(*args, **kwargs)
+        return functools.wraps(func)(wrapper)
+
+
+def span(name: str, *, trace: TraceSink | None = None) -> Span:
+    """Time the block of code as a span nested in the current span.
+
+    Can be used as a context manager (`with span("parse"): ...`) or as a decorator (`@span("parse")`).
+    Spans started inside the block become its children. The current span is tracked with `contextvars`,
+    so asyncio tasks inherit the span they were created in, and a thread inherits it
+    if it runs in a copied context (`contextvars.copy_context().run`), otherwise its spans are top-level.
+
+    Wall time and CPU time of the thread (`time.thread_time`) are recorded, the timings of spans
+    with the same name under the same parent are summed up.
+
+    :param name: name of the span in the report
+    :param trace: emit an event of this span and of all spans inside it to the `TraceSink`
+    """
+    return Span(name, trace=trace)
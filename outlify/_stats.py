@@ -0,0 +1,143 @@
+import math
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    from typing import Any
+
+__all__ = ["TimingStats"]
+
+
+SUBBUCKETS = 16  # histogram buckets per power of two, max relative error of a percentile is 1 / (2 * SUBBUCKETS)
+_ZERO_BUCKET = -(1 << 20)  # bucket for zero (or negative) durations
+
+
+def _bucket(seconds: float) -> int:
+    """Get the index of the logarithmic histogram bucket for the duration."""
+    if seconds <= 0:
+        return _ZERO_BUCKET
+    mantissa, exponent = math.frexp(seconds)  # seconds = mantissa * 2 ** exponent, 0.5 <= mantissa < 1
+    return exponent * SUBBUCKETS + int((mantissa - 0.5) * 2 * SUBBUCKETS)
+
+
+def _bucket_middle(index: int) -> float:
+    """Get the duration in the middle of the histogram bucket."""
+    if index == _ZERO_BUCKET:
+        return 0.0
+    exponent, subbucket = divmod(index, SUBBUCKETS)
+    return math.ldexp(0.5 + (subbucket + 0.5) / (2 * SUBBUCKETS), exponent)
+
+
+class TimingStats:
+    """Constant-memory statistics of measured durations.
+
+    Keeps the number of calls, total, min and max duration, the number of processed items and a logarithmic histogram
+    (16 buckets per power of two), which is used to estimate percentiles with a relative error
+    of about 3%. Memory usage does not depend on the number of measurements.
+    If allocated memory is measured, the highest peak and the total net allocation in bytes are kept too.
+    """
+
+    __slots__ = ("buckets", "count", "items", "max", "memory_net", "memory_peak", "min", "total")
+
+    def __init__(self) -> None:
+        """Create empty statistics."""
+        self.count = 0
+        self.total = 0.0
+        self.min = math.inf
+        self.max = 0.0
+        self.items = 0
+        self.memory_peak: int | None = None
+        self.memory_net = 0
+        self.buckets: dict[int, int] = {}
+
+    def add(self, seconds: float, items: int = 0, memory: tuple[int, int] | None = None) -> None:
+        """Record a single duration in seconds, the number of items and the (peak, net) allocated bytes during it."""
+        self.count += 1
+        if memory is not None:
+            peak, net = memory
+            self.memory_peak = max(self.memory_peak or 0, peak)
+            self.memory_net += net
+        self.total += seconds
+        self.items += items
+        self.min = min(self.min, seconds)
+        self.max = max(self.max, seconds)
+        index = _bucket(seconds)
+        self.buckets[index] = self.buckets.get(index, 0) + 1
+
+    @property
+    def mean(self) -> float:
+        """Mean duration in seconds, 0 if nothing is recorded."""
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Processed items per second of the total duration, 0 if nothing is recorded."""
+        return self.items / self.total if self.total else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """Estimate the duration below which the given percent of measurements fall.
+
+        :param percent: percent from 0 to 100, e.g. 50 for the median or 99 for p99
+        :return: duration in seconds, 0 if nothing is recorded
+        """
+        if not 0 <= percent <= 100:  # noqa: PLR2004
+            error = f"Invalid value for percent: {percent} is not in range [0, 100]"
+            raise ValueError(error)
+        if not self.count:
+            return 0.0
+
+        rank = max(math.ceil(self.count * percent / 100), 1)
+        seen = 0
+        for index in sorted(self.buckets):
+            seen += self.buckets[index]
+            if seen >= rank:
+                return min(max(_bucket_middle(index), self.min), self.max)
+        return self.max  # pragma: no cover
+
+    def merge(self, other: "TimingStats") -> None:
+        """Add all durations recorded in other statistics, e.g. of another thread or process."""
+        if not other.count:
+            return
+        self.count += other.count
+        self.total += other.total
+        self.items += other.items
+        self.min = min(self.min, other.min)
+        self.max = max(self.max, other.max)
+        if other.memory_peak is not None:
+            self.memory_peak = max(self.memory_peak or 0, other.memory_peak)
+        self.memory_net += other.memory_net
+        for index, count in list(other.buckets.items()):  # other can be still recording in another thread
+            self.buckets[index] = self.buckets.get(index, 0) + count
+
+    def snapshot(self) -> dict[str, "Any"]:
+        """Get the statistics as a JSON-serializable dict, see `from_snapshot`."""
+        return {
+            "count": self.count, "total": self.total, "items": self.items,
+            "min": self.min if self.count else None, "max": self.max,
+            "memory_peak": self.memory_peak, "memory_net": self.memory_net,
+            "buckets": {str(index): count for index, count in self.buckets.items()},
+        }
+
+    @classmethod
+    def from_snapshot(cls, snapshot: dict[str, "Any"]) -> "TimingStats":
+        """Restore the statistics from the `snapshot()` result."""
+        stats = cls()
+        stats.count = snapshot["count"]
+        stats.total = snapshot["total"]
+        stats.items = snapshot["items"]
+        stats.min = math.inf if snapshot["min"] is None else snapshot["min"]
+        stats.max = snapshot["max"]
+        stats.memory_peak = snapshot.get("memory_peak")
+        stats.memory_net = snapshot.get("memory_net", 0)
+        stats.buckets = {int(index): count for index, count in snapshot["buckets"].items()}
+        return stats
+
+    def reset(self) -> None:
+        """Forget all recorded durations."""
+        self.__init__()
+
+    def __repr__(self) -> str:
+        """Return an unambiguous string representation of the statistics for debugging."""
+        return (
+            f"{self.__class__.__name__}(count={self.count}, total={self.total}, "
+            f"min={self.min}, max={self.max}, mean={self.mean})"
+        )
@@ -0,0 +1,253 @@
+"""Wrappers that measure the real duration of functions, coroutines and (async) generators."""
+import functools
+import threading
+import time
+from collections.abc import AsyncGenerator, Callable, Generator
+
+from outlify._code import is_async_generator_function, is_coroutine_function, is_generator_function
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    from typing import Any
+
+__all__ = ["Memory", "Record", "measure", "overhead_ns", "sample"]
+
+
+Memory = tuple[int, int]  # (peak, net) bytes allocated during the call
+# (duration, time of the end, number of yielded items or None, allocated memory or None)
+Record = Callable[[int, int, "int | None", "Memory | None"], None]
+
+CALIBRATION_SAMPLES = 1000
+
+# peaks of the memory-measured calls in progress in all threads, kept from before `tracemalloc.reset_peak`
+# of nested and concurrent calls; guarded by `_memory_lock` as `tracemalloc` is shared by the whole process
+_frames: list[list[int]] = []
+_tracing = {"started": False}  # whether tracing was started by outlify and is stopped after the calls
+_memory_lock = threading.Lock()
+
+
+@functools.cache
+def overhead_ns() -> int:
+    """Estimate the timer's own cost included in every measured duration, in nanoseconds.
+
+    It is the median duration measured for a call of an empty function: the cost of reading the clock
+    and calling the function. Measured once per process, on the first call.
+    """
+    import statistics  # slow to import, so only when the timer is used
+
+    def empty() -> None:
+        pass
+
+    samples = []
+    for _ in range(CALIBRATION_SAMPLES):
+        start = time.perf_counter_ns()
+        empty()
+        samples.append(time.perf_counter_ns() - start)
+    return int(statistics.median(samples))
+
+
+def measure(
+        func: Callable[..., "Any"], record: Record, *, overhead: int = 0, memory: bool = False,
+) -> Callable[..., "Any"]:
+    """Wrap the function so that `record` is called after each call.
+
+    `record` gets the duration in nanoseconds, the `time.perf_counter_ns()` value at the end of the call,
+    the number of yielded items (None for functions and coroutines) and the allocated memory
+    (None if `memory` is not enabled). The duration is:
+
+    - plain functions: duration of the call;
+    - coroutine functions: duration until the coroutine is finished (awaited), not just created;
+    - generators and async generators: time spent inside the generator while it is consumed
+      (time of the consumer's own work between items is not counted) and the number of yielded items.
+      It is recorded when the generator is exhausted or closed (e.g. the consumer breaks the loop).
+
+    If the function raises an exception, nothing is recorded.
+
+    :param overhead: nanoseconds subtracted from every measured interval (see `overhead_ns`),
+                     a generator is measured in one interval per resume
+    :param memory: also measure peak and net memory allocated during the call with `tracemalloc`.
+                   If it is not tracing yet, it is started for the duration of measured calls only.
+                   Only for functions and coroutine functions
+
+    :raises TypeError: `memory` is enabled for a generator function
+    """
+    if memory:
+        if is_generator_function(func) or is_async_generator_function(func):
+            error = "Memory tracking is available only for functions and coroutine functions, not for generators"
+            raise TypeError(error)
+        wrapper = _measure_coroutine_memory(func, record, overhead) if is_coroutine_function(func) \
+            else _measure_function_memory(func, record, overhead)
+        return functools.wraps(func)(wrapper)
+
+    if is_async_generator_function(func):
+        wrapper = _measure_async_generator(func, record, overhead)
+    elif is_coroutine_function(func):
+        wrapper = _measure_coroutine(func, record, overhead)
+    elif is_generator_function(func):
+        wrapper = _measure_generator(func, record, overhead)
+    else:
+        wrapper = _measure_function(func, record, overhead)
+    return functools.wraps(func)(wrapper)
+
+
+def sample(
+        func: Callable[..., "Any"], measured: Callable[..., "Any"], sampler: Callable[[], bool],
+) -> Callable[..., "Any"]:
+    """Wrap the function so that only calls chosen by `sampler` go through the `measured` wrapper."""
+    if is_coroutine_function(func):
+        async def wrapper(*args: "Any", **kwargs: "Any") -> "Any":
+            if sampler():
+                return await measured(*args, **kwargs)
+            return await func(*args, **kwargs)
+    elif is_generator_function(func):
+        def wrapper(*args: "Any", **kwargs: "Any") -> "Any":
+            if sampler():
+                return (yield from measured(*args, **kwargs))
+            return (yield from func(*args, **kwargs))
+    else:  # functions, and async generators: the call just creates the async generator object
+        def wrapper(*args: "Any", **kwargs: "Any") -> "Any":
+            if sampler():
+                return measured(*args, **kwargs)
+            return func(*args, **kwargs)
+    return functools.wraps(func)(wrapper)
+
+
+def _measure_function(func: Callable[..., "Any"], record: Record, overhead: int) -> Callable[..., "Any"]:
+    def wrapper(*args: "Any", **kwargs: "Any") -> "Any":
+        start = time.perf_counter_ns()
+        result = func(*args, **kwargs)
+        end = time.perf_counter_ns()
+        record(max(end - start - overhead, 0), end, None, None)
+        return result
+    return wrapper
+
+
+def _measure_coroutine(func: Callable[..., "Any"], record: Record, overhead: int) -> Callable[..., "Any"]:
+    async def wrapper(*args: "Any", **kwargs: "Any") -> "Any":
+        start = time.perf_counter_ns()
+        result = await func(*args, **kwargs)
+        end = time.perf_counter_ns()
+        record(max(end - start - overhead, 0), end, None, None)
+        return result
+    return wrapper
+
+
+def _measure_function_memory(func: Callable[..., "Any"], record: Record, overhead: int) -> Callable[..., "Any"]:
+    def wrapper(*args: "Any", **kwargs: "Any") -> "Any":
+        frame = _enter_memory()
+        try:
+            start = time.perf_counter_ns()
+            result = func(*args, **kwargs)
+            end = time.perf_counter_ns()
+        finally:
+            allocated = _exit_memory(frame)
+        record(max(end - start - overhead, 0), end, None, allocated)
+        return result
+    return wrapper
+
+
+def _measure_coroutine_memory(func: Callable[..., "Any"], record: Record, overhead: int) -> Callable[..., "Any"]:
+    async def wrapper(*args: "Any", **kwargs: "Any") -> "Any":
+        frame = _enter_memory()
+        try:
+            start = time.perf_counter_ns()
+            result = await func(*args, **kwargs)
+            end = time.perf_counter_ns()
+        finally:
+            allocated = _exit_memory(frame)
+        record(max(end - start - overhead, 0), end, None, allocated)
+        return result
+    return wrapper
+
+
+def _enter_memory() -> list[int]:
+    """Start measuring memory of a call; return its frame: the memory before the call and the peak so far.
+
+    `tracemalloc` has a single peak for the process, so before it is reset for this call,
+    the peak reached so far is saved into the frames of all calls in progress (e.g. the outer ones).
+    """
+    import tracemalloc  # slow to import (it imports pickle), so only when memory is measured
+
+    with _memory_lock:
+        if not _frames and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            _tracing["started"] = True
+        current, peak = tracemalloc.get_traced_memory()
+        for frame in _frames:
+            frame[1] = max(frame[1], peak)
+        tracemalloc.reset_peak()
+        frame = [current, current]
+        _frames.append(frame)
+    return frame
+
+
+def _exit_memory(frame: list[int]) -> Memory:
+    """Finish measuring memory of a call; return its peak and net allocated memory."""
+    import tracemalloc
+
+    with _memory_lock:
+        current, peak = tracemalloc.get_traced_memory()
+        _frames.remove(frame)  # not always the last one: coroutines and other threads can finish in any order
+        if not _frames and _tracing["started"]:
+            tracemalloc.stop()
+            _tracing["started"] = False
+    before, saved_peak = frame
+    return max(peak, saved_peak) - before, current - before
+
+
+def _measure_generator(func: Callable[..., Generator], record: Record, overhead: int) -> Callable[..., Generator]:
+    def wrapper(*args: "Any", **kwargs: "Any") -> Generator:
+        generator = func(*args, **kwargs)
+        elapsed, items = 0, 0
+        method, argument = generator.send, None
+        while True:
+            start = time.perf_counter_ns()
+            try:
+                item = method(argument)
+            except StopIteration as stop:
+                end = time.perf_counter_ns()
+                record(elapsed + max(end - start - overhead, 0), end, items, None)
+                return stop.value
+            end = time.perf_counter_ns()
+            elapsed += max(end - start - overhead, 0)
+            items += 1
+
+            try:
+                method, argument = generator.send, (yield item)
+            except GeneratorExit:  # the consumer stopped iterating
+                generator.close()
+                record(elapsed, end, items, None)
+                raise
+            except BaseException as error:  # noqa: BLE001 - propagate into the wrapped generator
+                method, argument = generator.throw, error
+    return wrapper
+
+
+def _measure_async_generator(
+        func: Callable[..., AsyncGenerator], record: Record, overhead: int,
+) -> Callable[..., AsyncGenerator]:
+    async def wrapper(*args: "Any", **kwargs: "Any") -> AsyncGenerator:
+        generator = func(*args, **kwargs)
+        elapsed, items = 0, 0
+        method, argument = generator.asend, None
+        while True:
+            start = time.perf_counter_ns()
+            try:
+                item = await method(argument)
+            except StopAsyncIteration:
+                end = time.perf_counter_ns()
+                record(elapsed + max(end - start - overhead, 0), end, items, None)
+                return
+            end = time.perf_counter_ns()
+            elapsed += max(end - start - overhead, 0)
+            items += 1
+
+            try:
+                method, argument = generator.asend, (yield item)
+            except GeneratorExit:  # the consumer stopped iterating
+                await generator.aclose()
+                record(elapsed, end, items, None)
+                raise
+            except BaseException as error:  # noqa: BLE001 - propagate into the wrapped generator
+                method, argument = generator.athrow, error
+    return wrapper
@@ -0,0 +1,153 @@
+"""Buffered export of timing events in Chrome Trace Event Format or as JSON lines."""
+import atexit
+import os
+import threading
+from types import TracebackType
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    from typing import Any, TextIO
+
+__all__ = ["TraceSink"]
+
+
+FORMATS = ("chrome", "jsonl")
+_sinks: set["TraceSink"] = set()  # open sinks, restarted in a forked child process
+
+
+class TraceSink:
+    """Collect timing events in memory and write them to a file or a stream in bulk."""
+
+    def __init__(
+            self, target: "str | os.PathLike | TextIO", *, trace_format: str = "chrome", buffer_size: int = 1000,
+    ) -> None:
+        """Create a sink for events of `timer` and `span`.
+
+        Each event has a name, a category ("timer" or "span"), a start time and a duration
+        in microseconds (`ts` and `dur`, on the `time.perf_counter` clock), process and thread ids
+        and optional arguments. Events are buffered and written every `buffer_size` events
+        and when the sink is closed, which happens at process exit at the latest.
+
+        In a child process created by `fork`, the sink starts empty: events buffered by the parent
+        are written by the parent only. With a path target, the child writes its events to a file
+        of its own, `<path>.<pid>`. With a stream target, events of the child are dropped,
+        as the stream is shared with the parent.
+
+        :param target: path of the file to write (it is overwritten) or a text stream
+        :param trace_format: "chrome" - a JSON array of Chrome Trace Event Format complete events
+                             that can be opened in chrome://tracing or https://ui.perfetto.dev,
+                             "jsonl" - one JSON object per line
+        :param buffer_size: number of events kept in memory before writing them
+        """
+        if trace_format not in FORMATS:
+            error = f"Invalid value for trace_format: {trace_format!r} is not one of {FORMATS}"
+            raise ValueError(error)
+        if buffer_size < 1:
+            error = f"Invalid value for buffer_size: {buffer_size} < 1"
+            raise ValueError(error)
+        self.trace_format = trace_format
+        self.buffer_size = buffer_size
+        self._target = target
+        self._stream: TextIO | None = None
+        self._events: list[dict[str, Any]] = []
+        self._written = 0
+        self._closed = False
+        self._lock = threading.Lock()
+        _sinks.add(self)
+        atexit.register(self.close)
+
+    def emit(
+            self, name: str, *, start_ns: int, duration_ns: int, category: str, args: dict[str, "Any"] | None = None,
+    ) -> None:
+        """Add a complete event, times are in nanoseconds on the `time.perf_counter_ns` clock."""
+        event = {
+            "name": name, "cat": category, "ph": "X", "ts": start_ns / 1000, "dur": duration_ns / 1000,
+            "pid": os.getpid(), "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = args
+        with self._lock:  # not appended to the list that `flush` has just taken
+            self._events.append(event)
+            full = len(self._events) >= self.buffer_size
+        if full:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered events."""
+        with self._lock:
+            events, self._events = self._events, []
+            if not events or self._closed:  # events emitted after closing are dropped
+                return
+            import json  # slow to import, so only when events are written
+
+            stream = self._open()
+            if self.trace_format == "chrome":
+                separator = ",\n" if self._written else "[\n"
+                stream.write(separator + ",\n".join(json.dumps(event) for event in events))
+            else:
+                stream.write("".join(f"{json.dumps(event)}\n" for event in events))
+            stream.flush()
+            self._written += len(events)
+
+    def close(self) -> None:
+        """Write buffered events and finish the output, a file opened by the sink is closed."""
+        self.flush()
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+            if self.trace_format == "chrome":
+                stream = self._open()
+                stream.write("\n]\n" if self._written else "[]\n")
+                stream.flush()
+            if self._stream is not None and self._stream is not self._target:
+                self._stream.close()
+        _sinks.discard(self)
+        atexit.unregister(self.close)
+
+    def _restart_in_child(self) -> None:
+        """Forget the state inherited from the parent process after `fork`."""
+        self._lock = threading.Lock()  # could be held by another thread of the parent at the time of fork
+        self._events = []
+        self._written = 0
+        if isinstance(self._target, str | os.PathLike):
+            self._target = f"{os.fspath(self._target)}.{os.getpid()}"
+            self._stream = None  # the parent's file, left to the parent
+        else:
+            self._closed = True
+
+    def _open(self) -> "TextIO":
+        if self._stream is None:
+            if isinstance(self._target, str | os.PathLike):
+                from pathlib import Path
+
+                self._stream = Path(self._target).open("w", encoding="utf-8")  # noqa: SIM115 - closed in close()
+            else:
+                self._stream = self._target
+        return self._stream
+
+    def __enter__(self) -> "TraceSink":
+        """Use the sink in a `with` block that closes it."""
+        return self
+
+    def __exit__(
+            self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None,
+    ) -> None:
+        """Close the sink."""
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return an unambiguous string representation of the sink for debugging."""
+        return (
+            f"{self.__class__.__name__}(target={self._target!r}, trace_format={self.trace_format!r}, "
+            f"buffer_size={self.buffer_size})"
+        )
+
+
+def _restart_sinks_in_child() -> None:
+    for sink in _sinks:
+        sink._restart_in_child()  # noqa: SLF001
+
+
+if hasattr(os, "register_at_fork"):  # not available on Windows, which has no `fork`
+    os.register_at_fork(after_in_child=_restart_sinks_in_child)
@@ -1,8 +1,10 @@
-import shutil
 from collections.abc import Sequence
-from typing import Any
 
-from outlify.style import Align, Styles
+from outlify.style import Align, Style, Styles, use_color
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    from typing import Any
 
 
 def resolve_width(width: int | None) -> int:
@@ -12,6 +14,8 @@ def resolve_width(width: int | None) -> int:
         error = f"Invalid type for width: {width} is not int"
         raise TypeError(error)
 
+    import shutil  # slow to import, so only when the width is not given
+
     try:
         return shutil.get_terminal_size().columns
     except (AttributeError, OSError):
@@ -22,20 +26,32 @@ def parse_title_align(align: str | Align) -> Align:
     return _parse_class(align, Align)
 
 
-def _parse_class(element: str | Any, cls: Any) -> Any:
+def _parse_class(element: "str | Any", cls: "Any") -> "Any":
     if isinstance(element, cls):
         return element
     return cls(element)
 
 
-def parse_styles(codes: Sequence | None) -> str:
-    return "".join(codes) if codes is not None else ""
+def parse_styles(codes: Style | Sequence | None, color: str | None = None) -> str:
+    """Join the style codes into a single escape sequence.
+
+    Returns an empty string if styles are disabled by the color mode (see `use_color`),
+    so no escape sequences are built, measured or reset at all.
+    """
+    if not use_color(color) or codes is None:
+        return ""
+    if isinstance(codes, Style):  # already a single sequence, kept as is to keep its minimal reset
+        return codes
+    return "".join(codes)
 
 
 def get_reset_by_style(style: str) -> str:
     """Return the appropriate reset code for the given style.
 
     If the style is empty, returns an empty reset.
+    If it is a `Style`, returns its minimal reset (computed once per style).
     Otherwise, returns the standard reset
     """
+    if isinstance(style, Style):
+        return style.reset
     return Styles.reset if style != "" else ""
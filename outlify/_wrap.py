@@ -0,0 +1,141 @@
+"""Single-pass line wrapping that understands ANSI escape sequences and wide characters."""
+from outlify._ansi import Styles
+from outlify._lazy import LazyPattern
+from outlify._width import ANSI_ESCAPE, split_at_width, strip_ansi, visible_width
+
+__all__ = ["split", "wrap"]
+
+
+_CHUNK = LazyPattern(r"[\t\n\x0b\x0c\r ]+|[^\t\n\x0b\x0c\r ]+")  # whitespace runs and words, as in `textwrap`
+_SGR = LazyPattern(r"\x1b\[[0-9;:]*m")
+_RESETS = frozenset((Styles.reset, "\x1b[m"))
+
+
+def wrap(text: str, width: int) -> list[str]:
+    """Wrap a single line of text into lines of at most `width` visible cells.
+
+    Produces the same result as `textwrap.wrap(text, width, replace_whitespace=False,
+    drop_whitespace=False, break_on_hyphens=False)` for plain text, but:
+
+    - measures text in terminal cells, so wide characters and escape sequences are handled correctly;
+    - never splits an escape sequence;
+    - closes styles active at the end of a wrapped line and reopens them on the next one.
+
+    Break points are searched in the text without escape sequences, which are put back afterward.
+
+    :param text: line to wrap (without line breaks)
+    :param width: maximum visible width of each line
+    :return: list of wrapped lines
+    """
+    if "\t" in text:
+        text = text.expandtabs()
+    plain = strip_ansi(text)
+    if width >= 1 and plain.isascii() and plain.isprintable():
+        breaks = _find_breaks(plain, width)
+    else:
+        breaks = _find_wide_breaks(plain, width)
+
+    if plain is not text:
+        return _restyle(text, breaks)
+    if not text:
+        return []
+    return [text[start:stop] for start, stop in zip([0, *breaks], [*breaks, len(text)], strict=True)]
+
+
+def split(text: str, width: int) -> tuple[str, str]:
+    """Split a line into its head of at most `width` visible cells and the rest.
+
+    Styles active at the cut are closed at the end of the head and reopened at the start of the rest,
+    as for the lines produced by `wrap`.
+    """
+    plain = strip_ansi(text)
+    if plain is text:
+        return split_at_width(text, width)
+    head, _ = split_at_width(plain, width)
+    head, tail = _restyle(text, [len(head)])
+    return head, tail
+
+
+def _find_breaks(text: str, width: int) -> list[int]:
+    """Find offsets where printable ascii text should be broken into lines.
+
+    Every char of such text is one cell and the only whitespace is a space, so instead of
+    building chunks it finds the run (word or spaces) that crosses the line limit with
+    `str.find` / `str.rfind` and breaks before it or, if the run is longer than a whole line,
+    right at the limit.
+    """
+    breaks = []
+    position, length = 0, len(text)
+    while length - position > width:
+        limit = position + width  # index of the first char that does not fit
+        if text[limit] == " ":
+            start = stop = limit
+            while start > position and text[start - 1] == " ":
+                start -= 1
+            while stop < length and text[stop] == " ":
+                stop += 1
+        else:
+            start = max(text.rfind(" ", position, limit) + 1, position)
+            stop = text.find(" ", limit)
+            stop = length if stop == -1 else stop
+
+        position = limit if stop - start > width else start
+        breaks.append(position)
+    return breaks
+
+
+def _find_wide_breaks(text: str, width: int) -> list[int]:
+    """Find offsets where arbitrary text should be broken into lines, measuring chunks in cells."""
+    breaks = []
+    used = 0
+    for match in _CHUNK.finditer(text):
+        start, chunk = match.start(), match.group()
+        size = visible_width(chunk)
+        while used + size > width:
+            if size > width:  # longer than a whole line: fill the remaining space with its head
+                head, chunk = split_at_width(chunk, width - used if width >= 1 else 1)
+                if head == "" and used == 0:  # a wide char does not fit even into an empty line
+                    head, chunk = chunk[0], chunk[1:]
+                start += len(head)
+                size = visible_width(chunk)
+                if not chunk:  # the forced wide char was the rest of the chunk
+                    used, size = used + visible_width(head), 0
+                    break
+            breaks.append(start)
+            used = 0
+        used += size
+    return breaks
+
+
+def _restyle(text: str, breaks: list[int]) -> list[str]:
+    """Cut styled text at the breaks found for its unstyled version, carrying active styles over.
+
+    :param text: text with escape sequences
+    :param breaks: break offsets in the text without escape sequences
+    :return: wrapped lines
+    """
+    lines: list[str] = []
+    active: list[str] = []  # SGR sequences in effect at the current position
+    escapes = ANSI_ESCAPE.finditer(text)
+    escape = next(escapes, None)
+    start = shift = 0  # shift - length of escape sequences before the current position
+    for cut in breaks:
+        prefix = "".join(active)
+        # escape sequences right at the break belong to the next line
+        while escape is not None and escape.start() - shift < cut:
+            _update_styles(active, escape.group())
+            shift += escape.end() - escape.start()
+            escape = next(escapes, None)
+        end = cut + shift
+        lines.append(f"{prefix}{text[start:end]}{Styles.reset if active else ''}")
+        start = end
+    lines.append(f"{''.join(active)}{text[start:]}")
+    return lines
+
+
+def _update_styles(active: list[str], sequence: str) -> None:
+    """Track SGR sequences in effect after the given escape sequence."""
+    if sequence in _RESETS:
+        active.clear()
+    elif _SGR.fullmatch(sequence):
+        active.append(sequence)
@@ -1,27 +1,73 @@
+import atexit
 import functools
+import threading
 import time
-from typing import Callable, ParamSpec, Sequence, TypeVar  # noqa: UP035
-
-from outlify._utils import get_reset_by_style, parse_styles
-from outlify.style import AnsiCodes
-
-__all__ = ["timer"]
-
-
-P = ParamSpec("P")
-R = TypeVar("R")
+from collections.abc import Callable, Sequence
+
+from outlify._code import is_async_generator_function, is_coroutine_function, is_generator_function
+from outlify._collector import TimingCollector
+from outlify._profile import SORT_KEYS, FunctionStats, SampledCall, cprofile_stats, watch
+from outlify._report import (
+    compile_time_format,
+    format_duration,
+    get_memory,
+    get_message_parts,
+    get_summary,
+    get_throughput,
+    styling_text,
+    table,
+)
+from outlify._sampling import EveryNth, PerSecond, Probability, Sampler
+from outlify._shorten import shorten
+from outlify._spans import ROOT, Span, SpanNode, span
+from outlify._stats import TimingStats
+from outlify._timing import Memory, Record, measure, overhead_ns, sample
+from outlify._trace import TraceSink
+from outlify._utils import resolve_width
+from outlify.style import AnsiCodes, Style
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    from typing import ParamSpec, TypeVar
+
+    P = ParamSpec("P")
+    R = TypeVar("R")
+
+__all__ = [
+    "EveryNth", "PerSecond", "Probability", "Sampler", "Span", "TimingCollector", "TimingStats", "TraceSink",
+    "profile", "report_spans", "reset_spans", "span", "timer", "timer_overhead",
+]
+
+
+_profiling = threading.local()  # `active` is set while a call in the thread runs under `profile`'s profiler
 
 
 def timer(
         label: str | None = None,
-        label_style: Sequence[AnsiCodes] | None = None,
+        label_style: Style | Sequence[AnsiCodes] | None = None,
         connector: str = "took",
         time_format: str = "{h:02}:{m:02}:{s:02}.{ms:03}",
-        time_style: Sequence[AnsiCodes] | None = None,
+        time_style: Style | Sequence[AnsiCodes] | None = None,
         output_func: Callable[[str], None] = print,
-) -> Callable[[Callable[P, R]], Callable[P, R]]:
+        *,
+        aggregate: bool = False,
+        report_interval: float | None = None,
+        report_at_exit: bool = True,
+        report_panel: bool = False,
+        throughput: bool = False,
+        calibrate: bool = False,
+        memory: bool = False,
+        sampling: Sampler | None = None,
+        collector: TimingCollector | None = None,
+        trace: TraceSink | None = None,
+        color: str | None = None,
+) -> "Callable[[Callable[P, R]], Callable[P, R]]":
     """Time the function.
 
+    Coroutine functions are timed until the coroutine is finished, generators and async generators
+    are timed while they are consumed: only time spent inside the generator is counted,
+    the time of the consumer's own work between items is not.
+
     :param label: optional custom label; if not provided, defaults to "Function {function name}"
     :param label_style: enumeration of label styles. Any class inherited from AnsiCodes,
                         including Colors, Back and Styles
@@ -32,7 +78,9 @@ def timer(
             {h} - hours,
             {m} - minutes (0-59),
             {s} - seconds (0-59),
-            {ms} - milliseconds (0-999).
+            {ms} - milliseconds (0-999),
+            {us} - microseconds (0-999),
+            {ns} - nanoseconds (0-999).
 
         You can use any valid Python `str.format` syntax.
         Example: "{h:02}:{m:02}:{s:02}.{ms:03}" → "00:00:05.123"
@@ -40,57 +88,346 @@ def timer(
     :param time_style: enumeration of time styles. Any class inherited from AnsiCodes,
                        including Colors, Back and Styles
     :param output_func: function for outputting measurements
+    :param aggregate: instead of outputting every call, record durations into constant-memory statistics
+                      (count, min, max, mean, percentiles) and output only a summary. The decorated function
+                      gets a `stats` attribute with `TimingStats` and a `report()` method to output the summary
+    :param report_interval: in aggregate mode, output the summary after a call if at least this many seconds
+                            have passed since the previous summary
+    :param report_at_exit: in aggregate mode, output the summary at process exit
+    :param report_panel: in aggregate mode, output the summary as a `ParamsPanel` instead of a single line
+    :param throughput: for generators and async generators, also output the number of yielded items
+                       and the throughput in items per second
+    :param calibrate: subtract the timer's own per-call overhead (see `timer_overhead`) from measured durations
+    :param memory: also measure memory allocated during every call with `tracemalloc`: the peak
+                   and the net change of allocated memory, including nested measured calls. If `tracemalloc`
+                   is not tracing yet, it is started for the duration of measured calls, which slows down
+                   all allocations of the process meanwhile. Not available for generators
+    :param sampling: measure only some calls, e.g. `EveryNth(100)`, `Probability(0.01)` or `PerSecond(10)`.
+                     Calls that are not measured only increase a counter. The policy is copied
+                     for every decorated function, which gets it as a `sampler` attribute. In aggregate mode,
+                     the total duration and the number of items are scaled to all calls.
+                     Can not be used with `collector`
+    :param collector: instead of outputting every call, add durations to the `TimingCollector`
+                      under the label (or the qualified name of the function), to report them
+                      together with other functions, threads and processes. Takes precedence over `aggregate`
+    :param trace: also emit an event with the start and duration of every measured call to the `TraceSink`,
+                  named by the label (or the qualified name of the function)
+    :param color: color mode of the output: "auto" - styled only for a color terminal, "always" or "never".
+                  If not specified, the global mode set by `set_color_mode` is used. Without aggregation,
+                  the mode is applied once, when the function is decorated
 
     :raises KeyError: used invalid key(s) of 'time_format' format-string
+    :raises ValueError: invalid format spec in 'time_format' format-string, e.g. "{ms:zz}",
+                        or `sampling` is used together with `collector`
+    :raises TypeError: `memory` is enabled for a generator function
     """
-    def decorator(func: Callable[P, R]) -> Callable[P, R]:
-        @functools.wraps(func)
-        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
-            start = time.perf_counter()
-            result = func(*args, **kwargs)
-            try:
-                duration = _format_duration(time.perf_counter() - start, fmt=time_format)
-            except KeyError:
-                error = (
-                    "Unavailable key(s) in 'time_format' format-string. "
-                    "Available keys: h - hours, m - minutes, s - seconds, ms - milliseconds"
-                )
-                raise KeyError(error) from None
-
-            message = _get_message(
-                duration, time_style, connector,
-                label, label_style, funcname=repr(func.__name__),
+    format_ns = compile_time_format(time_format)
+    _validate_timer_params(sampling=sampling, collector=collector)
+
+    def decorator(func: "Callable[P, R]") -> "Callable[P, R]":
+        overhead = overhead_ns() if calibrate else 0
+        sampler = None
+        if sampling is not None:
+            import copy
+
+            sampler = copy.copy(sampling)
+            sampler.reset()
+
+        name = label if label else func.__qualname__
+        if collector is not None:
+            def record(nanoseconds: int, _end: int, items: int | None, allocated: Memory | None) -> None:
+                collector.add(name, nanoseconds / 1e9, items or 0, allocated)
+            wrapper = measure(func, _traced(record, trace, name=name), overhead=overhead, memory=memory)
+        elif aggregate:
+            wrapper = _aggregate(
+                func, label=label, label_style=label_style, connector=connector, time_format=time_format,
+                time_style=time_style, output_func=output_func, report_interval=report_interval,
+                report_at_exit=report_at_exit, report_panel=report_panel, throughput=throughput, overhead=overhead,
+                memory=memory, sampler=sampler, trace=trace, color=color,
             )
-            output_func(message)
-            return result
+        else:
+            prefix, suffix = get_message_parts(
+                time_style, connector, label, label_style, funcname=repr(func.__name__), color=color,
+            )
+
+            def record(nanoseconds: int, _end: int, items: int | None, allocated: Memory | None) -> None:
+                message = f"{prefix}{format_ns(nanoseconds)}{suffix}"
+                if throughput and items is not None:
+                    message = f"{message} ({get_throughput(items, nanoseconds / 1e9)})"
+                if allocated is not None:
+                    message = f"{message} ({get_memory(*allocated)})"
+                output_func(message)
+            wrapper = measure(func, _traced(record, trace, name=name), overhead=overhead, memory=memory)
+
+        if sampler is not None:
+            measured = wrapper
+            wrapper = sample(func, measured, sampler.__call__)  # a bound method is called faster than an instance
+            wrapper.__dict__.update(measured.__dict__)  # keep `stats` and `report` of the aggregate mode
+            wrapper.sampler = sampler
         return wrapper
     return decorator
 
 
-def _format_duration(seconds: float, *, fmt: str) -> str:
-    """Format the duration specified in seconds according to the specified pattern."""
-    total_milliseconds = int(seconds * 1000)
+def _validate_timer_params(*, sampling: Sampler | None, collector: TimingCollector | None) -> None:
+    if sampling is not None and collector is not None:
+        error = "sampling can not be used with collector, which does not scale measured calls to all calls"
+        raise ValueError(error)
 
-    total_seconds, milliseconds = divmod(total_milliseconds, 1000)
-    total_minutes, seconds = divmod(total_seconds, 60)
-    hours, minutes = divmod(total_minutes, 60)
-    return fmt.format(h=hours, m=minutes, s=seconds, ms=milliseconds)
 
+def profile(
+        label: str | None = None,
+        label_style: Style | Sequence[AnsiCodes] | None = None,
+        time_format: str = "{s}.{ms:03}{us:03}",
+        output_func: Callable[[str], None] = print,
+        *,
+        top: int = 10,
+        sort: str = "cumulative",
+        threshold: float | None = None,
+        interval: float = 0.001,
+        width: int | None = None,
+        color: str | None = None,
+) -> "Callable[[Callable[P, R]], Callable[P, R]]":
+    """Profile the function and output its hotspots in a `Panel`.
+
+    Without `threshold`, every call runs under `cProfile`, and the panel shows the number of calls,
+    self time and cumulative time of the top functions.
+
+    With `threshold`, calls are not profiled: a background thread samples the call's stack every `interval`
+    seconds, but only after the call has been running longer than `threshold` seconds, so the cost is paid
+    only by slow calls. The panel is output only for calls longer than `threshold` and shows the number of
+    samples in which the function was running and the estimated self and cumulative times.
 
-def _get_message(
-        duration: str, time_style: Sequence[AnsiCodes] | None, connector: str,
-        label: str | None, label_style: Sequence[AnsiCodes] | None, funcname: str,
+    :param label: optional custom label; if not provided, defaults to "Function {function name}"
+    :param label_style: enumeration of label styles. Any class inherited from AnsiCodes,
+                        including Colors, Back and Styles
+    :param time_format: a string format specifying how the durations will be displayed, see `timer`
+    :param output_func: function for outputting the panel
+    :param top: number of functions to show
+    :param sort: "cumulative" - sort by time including called functions, "self" - by time in the function itself
+    :param threshold: profile only calls longer than this many seconds, by sampling
+    :param interval: interval between stack samples in seconds
+    :param width: total panel width (including borders). If not specified, the terminal width is used
+    :param color: color mode of the panel: "auto", "always" or "never", the global mode by default
+
+    :raises KeyError: used invalid key(s) of 'time_format' format-string
+    :raises ValueError: invalid format spec in 'time_format' format-string, e.g. "{ms:zz}",
+                        or invalid value of `sort`, `top`, `threshold` or `interval`
+    """
+    format_ns = compile_time_format(time_format)
+    _validate_profile_params(sort=sort, top=top, threshold=threshold, interval=interval)
+
+    def decorator(func: "Callable[P, R]") -> "Callable[P, R]":
+        if is_coroutine_function(func) or is_generator_function(func) or is_async_generator_function(func):
+            error = "profile can decorate only regular functions, not coroutines or generators"
+            raise TypeError(error)
+        title = f" {label if label else f'Function {func.__name__!r}'} "
+
+        def output(stats: FunctionStats, nanoseconds: int, details: str) -> None:
+            panel = _get_profile_panel(
+                stats, title=title, subtitle=f" took {format_ns(nanoseconds)}{details} ", label_style=label_style,
+                counter="samples" if threshold is not None else "calls", sort=sort, top=top,
+                time_format=time_format, width=width, color=color,
+            )
+            output_func(panel)
+
+        @functools.wraps(func)
+        def wrapper(*args: "P.args", **kwargs: "P.kwargs") -> "R":
+            if threshold is not None:
+                call = SampledCall(func.__code__, threshold=threshold, interval=interval)
+                start = time.perf_counter_ns()
+                with watch(call):
+                    result = func(*args, **kwargs)
+                duration = time.perf_counter_ns() - start
+                if duration >= threshold * 1e9:
+                    output(call.stats(duration / 1e9), duration, f", {call.samples} samples")
+                return result
+
+            if getattr(_profiling, "active", False):  # a nested call is already measured by the outer profiler
+                return func(*args, **kwargs)
+
+            import cProfile  # slow to import, so only when a call is profiled
+
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+            except ValueError:  # another profiler is active, e.g. in another thread on Python 3.12+
+                return func(*args, **kwargs)
+            _profiling.active = True
+            start = time.perf_counter_ns()
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                profiler.disable()
+                _profiling.active = False
+            output(cprofile_stats(profiler), time.perf_counter_ns() - start, "")
+            return result
+        return wrapper
+    return decorator
+
+
+def _validate_profile_params(*, sort: str, top: int, threshold: float | None, interval: float) -> None:
+    if sort not in SORT_KEYS:
+        error = f"Invalid value for sort: {sort!r} is not one of {SORT_KEYS}"
+        raise ValueError(error)
+    if top < 1:
+        error = f"Invalid value for top: {top} < 1"
+        raise ValueError(error)
+    if threshold is not None and threshold < 0:
+        error = f"Invalid value for threshold: {threshold} < 0"
+        raise ValueError(error)
+    if interval <= 0:
+        error = f"Invalid value for interval: {interval} <= 0"
+        raise ValueError(error)
+
+
+def _get_profile_panel(
+        stats: FunctionStats, *, title: str, subtitle: str, label_style: Style | Sequence[AnsiCodes] | None,
+        counter: str, sort: str, top: int, time_format: str, width: int | None, color: str | None,
 ) -> str:
-    label = label if label else f"Function {funcname}"
-    label = _styling_text(label, style=label_style)
-    duration = _styling_text(duration, style=time_style)
-    return f"{label} {connector} {duration}"
+    """Get the panel with the table of the top functions."""
+    from outlify.panel import Panel
+
+    column = 2 if sort == "cumulative" else 1
+    functions = sorted(stats.items(), key=lambda item: item[1][column], reverse=True)[:top]
+    rows = [("function", counter, "self", "cumulative")]
+    rows.extend(
+        (name, str(count), format_duration(own, fmt=time_format), format_duration(cumulative, fmt=time_format))
+        for name, (count, own, cumulative) in functions
+    )
+    # names that do not fit end with `…`, so the panel does not wrap rows in the middle of columns
+    width = resolve_width(width)
+    numbers = sum(max(len(row[column]) for row in rows) + 2 for column in range(1, len(rows[0])))
+    name_width = max(width - 4 - numbers, 1)  # inside the borders and padding of the panel
+    rows = [(shorten(row[0], max_chars=name_width, max_items=None, max_level=None), *row[1:]) for row in rows]
+    content = table(rows) if functions else "no samples"
+    return str(Panel(content, title=title, title_style=label_style, subtitle=subtitle, width=width, color=color))
+
+
+def timer_overhead() -> float:
+    """Get the timer's own cost included in every measured duration, in seconds.
+
+    It is the cost of reading the clock twice and calling the function, measured once per process
+    on the first call. `timer(calibrate=True)` subtracts it from measured durations.
+    """
+    return overhead_ns() / 1e9
+
+
+def _aggregate(
+        func: "Callable[P, R]", *, label: str | None, label_style: Style | Sequence[AnsiCodes] | None, connector: str,
+        time_format: str, time_style: Style | Sequence[AnsiCodes] | None, output_func: Callable[[str], None],
+        report_interval: float | None, report_at_exit: bool, report_panel: bool, throughput: bool, overhead: int,
+        memory: bool, sampler: Sampler | None, trace: TraceSink | None, color: str | None,
+) -> "Callable[P, R]":
+    """Wrap the function to record its durations into statistics instead of outputting each call."""
+    stats = TimingStats()
+    lock = threading.Lock()
+    interval = None if report_interval is None else int(report_interval * 1e9)
+    last_report = time.perf_counter_ns()
+
+    def report() -> None:
+        """Output the summary of recorded durations, if there are any."""
+        nonlocal last_report
+        with lock:
+            last_report = time.perf_counter_ns()
+            if not stats.count:
+                return
+            summary = get_summary(
+                stats, time_format=time_format, time_style=time_style, connector=connector,
+                label=label, label_style=label_style, funcname=repr(func.__name__), panel=report_panel,
+                throughput=throughput, sampler=sampler, color=color,
+            )
+        output_func(summary)
+
+    def record(nanoseconds: int, end: int, items: int | None, allocated: Memory | None) -> None:
+        with lock:
+            stats.add(nanoseconds / 1e9, items=items or 0, memory=allocated)
+        if interval is not None and end - last_report >= interval:
+            report()
+
+    wrapper = measure(
+        func, _traced(record, trace, name=label if label else func.__qualname__), overhead=overhead, memory=memory,
+    )
+    wrapper.stats = stats
+    wrapper.report = report
+    if report_at_exit:
+        atexit.register(report)
+    return wrapper
+
+
+def _traced(record: Record, trace: TraceSink | None, *, name: str) -> Record:
+    """Emit an event to the trace sink before recording the measurement, if the sink is given."""
+    if trace is None:
+        return record
+
+    def traced(nanoseconds: int, end: int, items: int | None, allocated: Memory | None) -> None:
+        args = {}
+        if items is not None:
+            args["items"] = items
+        if allocated is not None:
+            args["peak_bytes"], args["net_bytes"] = allocated
+        trace.emit(name, start_ns=end - nanoseconds, duration_ns=nanoseconds, category="timer", args=args)
+        record(nanoseconds, end, items, allocated)
+    return traced
+
+
+def report_spans(
+        time_format: str = "{h:02}:{m:02}:{s:02}.{ms:03}",
+        time_style: Style | Sequence[AnsiCodes] | None = None,
+        output_func: Callable[[str], None] = print,
+        *,
+        color: str | None = None,
+) -> None:
+    """Output the tree of recorded spans.
 
+    For every span the report shows the number of runs, total wall time, self time
+    (wall time not spent in child spans), percentage of the parent's total time and CPU time.
 
-def _styling_text(text: str, style: Sequence[AnsiCodes] | None) -> str:
-    style = parse_styles(style)
-    reset = get_reset_by_style(style)
-    return f"{style}{text}{reset}"
+    :param time_format: a string format specifying how the durations will be displayed, see `timer`
+    :param time_style: enumeration of time styles. Any class inherited from AnsiCodes,
+                       including Colors, Back and Styles
+    :param output_func: function for outputting the report
+    :param color: color mode of the report: "auto", "always" or "never", the global mode by default
+
+    :raises KeyError: used invalid key(s) of 'time_format' format-string
+    :raises ValueError: invalid format spec in 'time_format' format-string, e.g. "{ms:zz}"
+    """
+    rows = [("span", "calls", "total", "self", "%", "cpu")]
+    rows.extend(_get_span_rows(ROOT, time_format=time_format, time_style=time_style, color=color))
+    output_func(table(rows))
+
+
+def reset_spans() -> None:
+    """Forget all recorded spans."""
+    ROOT.reset()
+
+
+def _get_span_rows(
+        root: SpanNode, *, time_format: str, time_style: Style | Sequence[AnsiCodes] | None, color: str | None = None,
+) -> list[tuple[str, ...]]:
+    """Get the report rows of all spans below the root, depth-first with tree guides."""
+    def styled(seconds: float) -> str:
+        return styling_text(format_duration(seconds, fmt=time_format), style=time_style, color=color)
+
+    def children(node: SpanNode, prefix: str | None) -> list[tuple[SpanNode, float, str | None, bool]]:
+        """Get the stack items of the node's children in reversed order, `prefix` is None for top-level spans."""
+        total = node.total if node is not root else sum(child.total for child in node.children.values())
+        return [(child, total, prefix, index == 0) for index, child in enumerate(reversed(node.children.values()))]
+
+    rows = []
+    stack = children(root, None)
+    while stack:
+        node, parent_total, prefix, last = stack.pop()
+        if prefix is None:
+            name, child_prefix = node.name, ""
+        else:
+            name = f"{prefix}{'└── ' if last else '├── '}{node.name}"
+            child_prefix = f"{prefix}{'    ' if last else '│   '}"
+        percent = node.total / parent_total * 100 if parent_total else 0.0
+        rows.append((
+            name, str(node.count), styled(node.total), styled(node.self_time), f"{percent:.1f}%", styled(node.cpu),
+        ))
+        stack.extend(children(node, child_prefix))
+    return rows
 
 
 if __name__ == "__main__":  # pragma: no cover
@@ -108,7 +445,7 @@ if __name__ == "__main__":  # pragma: no cover
         return a + b
     """)
 
-    with patch("outlify.decorators.time.perf_counter", side_effect=[0, 0.123]):
+    with patch("outlify.decorators.time.perf_counter_ns", side_effect=[0, 123_000_000]):
         dummy_func(1, 2)
 
 
@@ -122,7 +459,7 @@ if __name__ == "__main__":  # pragma: no cover
         return a + b
     """)
 
-    with patch("outlify.decorators.time.perf_counter", side_effect=[0, 1.23]):
+    with patch("outlify.decorators.time.perf_counter_ns", side_effect=[0, 1_230_000_000]):
         dummy_func_with_custom_name(1, 2)
 
 
@@ -136,7 +473,7 @@ if __name__ == "__main__":  # pragma: no cover
         return a + b
     """)
 
-    with patch("outlify.decorators.time.perf_counter", side_effect=[0, 123.345]):
+    with patch("outlify.decorators.time.perf_counter_ns", side_effect=[0, 123_345_000_000]):
         dummy_func_with_custom_fmt(2, 3)
 
 
@@ -150,7 +487,7 @@ if __name__ == "__main__":  # pragma: no cover
         return a + b
     """)
 
-    with patch("outlify.decorators.time.perf_counter", side_effect=[0, 3723.456]):
+    with patch("outlify.decorators.time.perf_counter_ns", side_effect=[0, 3_723_456_000_000]):
         colored_timer(1, 2)
 
 
@@ -164,5 +501,5 @@ if __name__ == "__main__":  # pragma: no cover
         return a + b
     """)
 
-    with patch("outlify.decorators.time.perf_counter", side_effect=[0, 3723.456]):
+    with patch("outlify.decorators.time.perf_counter_ns", side_effect=[0, 3_723_456_000_000]):
         colored_timer(1, 2)
@@ -1,63 +1,157 @@
+import itertools
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Sequence
-from typing import Any
+from collections.abc import Iterable, Iterator, Sequence, Sized
 
+from outlify import _width
+from outlify._grid import LAYOUTS, fit_columns, iter_grid
+from outlify._shorten import ELLIPSIS, shorten, validate_limits
 from outlify._utils import get_reset_by_style, parse_styles, resolve_width
-from outlify.style import AnsiCodes
+from outlify.style import AnsiCodes, Style
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    from typing import Any, TextIO
 
 __all__ = ["ListBase", "TitledList"]
 
 
+STREAM_BATCH = 1024  # elements of an iterator joined into a single piece of the streamed output
+
+
 class ListBase(ABC):
     """Base class for creating formatted lists with titles."""
 
     def __init__(
-            self, content: Sequence[Any], *, width: int | None,
-            title: str, title_separator: str, title_style: Sequence[AnsiCodes] | None,
+            self, content: Iterable["Any"], *, width: int | None,
+            title: str, title_separator: str, title_style: Style | Sequence[AnsiCodes] | None,
+            max_chars: int | None = None, max_items: int | None = None, max_level: int | None = None,
+            count: int | None = None, limit: int | None = None, color: str | None = None,
     ) -> None:
         """Create a base list with customizable title and formatting.
 
-        :param content: element enumeration
+        :param content: element enumeration, any iterable
         :param width: maximum width for content (None = auto)
         :param title: title displayed before elements
         :param title_separator: separator between title and content
         :param title_style: enumeration of title styles. Any class inherited from AnsiCodes,
                             including Colors, Back and Styles
+        :param max_chars: maximum number of characters of every element, longer ones end with `…`
+        :param max_items: maximum number of items shown in elements that are lists, tuples, dicts or sets
+        :param max_level: maximum nesting level shown in elements that are lists, tuples, dicts or sets
+        :param count: number of elements of an iterable without `len`, e.g. a generator.
+                      If not specified, it is counted by consuming the iterable
+        :param limit: show only the first `limit` elements followed by "… and N more"
+        :param color: color mode of this list: "auto", "always" or "never", the global mode by default
         """
+        validate_limits(max_chars=max_chars, max_items=max_items, max_level=max_level)
+        if limit is not None and limit < 0:
+            error = f"Invalid value for limit: {limit} < 0"
+            raise ValueError(error)
+        if count is not None and count < 0:
+            error = f"Invalid value for count: {count} < 0"
+            raise ValueError(error)
+        self.max_chars, self.max_items, self.max_level = max_chars, max_items, max_level
         self.width = resolve_width(width)
-        title_style = parse_styles(title_style)
+        self._elements, count = self._take(content, count=count, limit=limit)
+        self._shown = count if limit is None else min(count, limit)
+        self._more = count - self._shown
+
+        title_style = parse_styles(title_style, color)
         title_reset = get_reset_by_style(title_style)
-        self.title = self._get_title(title, count=len(content), style=title_style, reset=title_reset)
+        self.title = self._get_title(title, count=count, style=title_style, reset=title_reset)
         self.title_separator = title_separator
 
-        content = self._prepare_content(content)
-        self.content = self._get_content(content, width=self.width)
+    @staticmethod
+    def _take(content: Iterable["Any"], *, count: int | None, limit: int | None) -> tuple[Iterable["Any"], int]:
+        """Get the elements to show and the number of all elements.
+
+        Only the shown elements are kept: if the number of elements is not known,
+        the rest of the iterable is counted without storing or stringifying it.
+        The shown elements of a sized collection are copied, so later changes of the collection
+        do not make the rendered elements disagree with the count in the title.
+        """
+        if isinstance(content, Sized):
+            count = len(content)
+            content = tuple(itertools.islice(content, limit))
+        elif count is None:
+            iterator = iter(content)
+            content = list(itertools.islice(iterator, limit))
+            count = len(content) + sum(1 for _ in iterator)
+        elif limit is not None:
+            content = itertools.islice(content, limit)
+        return content, count
+
+    @property
+    def content(self) -> str:
+        """Formatted elements (without the title). An iterator of elements is consumed by the first rendering."""
+        return "".join(self._iter_content())
+
+    def render_to(self, stream: "TextIO | None" = None) -> None:
+        """Write the list to the stream piece by piece without building the whole string.
+
+        Elements are stringified as they are written, so an iterator of elements with a known `count`
+        is rendered with constant memory (except the grid layouts, which need the widths of all elements).
+
+        :param stream: text stream to write to, defaults to `sys.stdout`
+        """
+        stream = sys.stdout if stream is None else stream
+        stream.write(self.title)
+        if self._shown or self._more:
+            stream.write(self.title_separator)
+            for chunk in self._iter_content():
+                stream.write(chunk)
+        stream.write("\n")
+
+    def _iter_content(self) -> Iterable[str]:
+        content = self._prepare_content(self._elements)
+        if self._more:
+            content = itertools.chain(content, (f"{ELLIPSIS} and {self._more} more",))
+        return self._get_content(content, width=self.width)
 
     @abstractmethod
-    def _get_content(self, content: list[Any], *, width: int) -> str:
-        pass  # pragma: no cover
+    def _get_content(self, content: Iterator[str], *, width: int) -> Iterable[str]:
+        """Get the pieces of formatted content from the stringified elements.
+
+        If not all elements are shown, the last one is "… and N more".
+        """
 
     @staticmethod
     def _get_title(title: str, *, count: int, style: str, reset: str) -> str:
         return f"{style}{title} ({count}){reset}"
 
-    @staticmethod
-    def _prepare_content(content: Sequence[Any]) -> list[str]:
-        return [str(elem) for elem in content]
+    def _prepare_content(self, content: Iterable["Any"]) -> Iterator[str]:
+        """Lazily stringify the elements."""
+        max_chars, max_items, max_level = self.max_chars, self.max_items, self.max_level
+        if max_chars is None and max_items is None and max_level is None:
+            return map(str, content)
+        return (shorten(elem, max_chars=max_chars, max_items=max_items, max_level=max_level) for elem in content)
 
     def __str__(self) -> str:
         """Return a human-readable string representation of the panel."""
-        if len(self.content) == 0:
+        content = self.content
+        if len(content) == 0:
             return self.title
-        return self.title_separator.join((self.title, self.content))
+        return self.title_separator.join((self.title, content))
 
     def __repr__(self) -> str:
         """Return an unambiguous string representation of the panel for debugging.
 
         The representation includes all non-private attributes of the panel instance,
         making it useful for reconstructing the object or understanding its current state.
+        Content given as a one-shot iterator, e.g. a generator, is shown by its type and not rendered,
+        because rendering it would consume the iterator.
         """
-        content = ", ".join(f"{name}={getattr(self, name)!r}" for name in dir(self) if not name.startswith("_"))
+        one_shot = isinstance(self._elements, Iterator)
+        attributes = []
+        for name in dir(self):
+            if name.startswith("_"):
+                continue
+            if name == "content" and one_shot:
+                attributes.append(f"content=<{type(self._elements).__name__}>")
+            elif not callable(value := getattr(self, name)):
+                attributes.append(f"{name}={value!r}")
+        content = ", ".join(attributes)
         return f"{self.__class__.__name__}({content})"
 
 
@@ -65,31 +159,80 @@ class TitledList(ListBase):
     """Titled list with length."""
 
     def __init__(
-            self, content: Sequence[Any], *,
-            title: str = "Content", title_style: Sequence[AnsiCodes] | None = None,
-            title_separator: str = ": ",
+            self, content: Iterable["Any"], *, width: int | None = None,
+            title: str = "Content", title_style: Style | Sequence[AnsiCodes] | None = None,
+            title_separator: str | None = None,
             separator: str = "  ",
+            layout: str = "inline",
+            max_chars: int | None = None, max_items: int | None = None, max_level: int | None = None,
+            count: int | None = None, limit: int | None = None,
+            color: str | None = None,
     ) -> None:
         """Create a simple list for displaying elements with customizable title.
 
         Can be used to list installed packages, processed files, etc.
 
-        :param content: element enumeration
+        :param content: element enumeration, any iterable including generators.
+                        An iterator is consumed by the first rendering
+        :param width: maximum width of the grid layouts. If not specified, the terminal width is used
         :param title: title displayed before elements
         :param title_style: enumeration of title styles. Any class inherited from AnsiCodes,
                             including Colors, Back and Styles
-        :param title_separator: separator between title and first item in list (content)
-        :param separator: separator between title and elements
+        :param title_separator: separator between title and first item in list (content),
+                                ": " for the inline layout and ":" with a line break for the grid layouts by default
+        :param separator: separator between elements, in the grid layouts - between columns
+        :param layout: "inline" - all elements in one line, "columns" - a grid with the maximum number
+                       of columns that fit the width, filled top to bottom like `ls`,
+                       "rows" - the same grid filled left to right like `ls -x`
+        :param max_chars: maximum number of characters of every element, longer ones end with `…`.
+                          Elements that are lists, tuples, dicts or sets are formatted only up to this length
+        :param max_items: maximum number of items shown in elements that are lists, tuples, dicts or sets
+        :param max_level: maximum nesting level shown in elements that are lists, tuples, dicts or sets
+        :param count: number of elements of an iterable without `len`, e.g. a generator.
+                      If not specified, the iterable is consumed to count its elements
+                      (only the shown ones are kept in memory)
+        :param limit: show only the first `limit` elements followed by "… and N more",
+                      the other elements are neither stored nor stringified
+        :param color: color mode of this list: "auto" - styled only for a color terminal, "always" or "never".
+                      If not specified, the global mode set by `set_color_mode` is used
         """
+        if layout not in LAYOUTS:
+            error = f"Invalid value for layout: {layout!r} is not one of {LAYOUTS}"
+            raise ValueError(error)
+        if title_separator is None:
+            title_separator = ": " if layout == "inline" else ":\n"
         self.separator = separator
+        self.layout = layout
         super().__init__(
-            content, width=None, title=title,
+            content, width=width, title=title,
             title_separator=title_separator,
             title_style=title_style,
+            max_chars=max_chars, max_items=max_items, max_level=max_level, count=count, limit=limit,
+            color=color,
         )
 
-    def _get_content(self, content: list[str], *, width: int) -> str:  # noqa: ARG002
-        return self.separator.join(content)
+    def _get_content(self, content: Iterator[str], *, width: int) -> Iterator[str]:
+        if self.layout == "inline":
+            # elements already in memory are joined at once, an iterator - in batches to keep memory constant
+            size = None if isinstance(self._elements, Sized) else STREAM_BATCH
+            yield self.separator.join(itertools.islice(content, size))
+            while batch := list(itertools.islice(content, size)):
+                yield f"{self.separator}{self.separator.join(batch)}"
+            return
+
+        items = list(content)
+        more = items.pop() if self._more else None  # "… and N more" goes to its own line
+        column_major = self.layout == "columns"
+        widths = [_width.visible_width(item) for item in items]
+        column_widths = fit_columns(
+            widths, width=width, gap=_width.visible_width(self.separator), column_major=column_major,
+        )
+        lines = iter_grid(items, widths, column_widths, separator=self.separator, column_major=column_major)
+        yield next(lines, "")
+        for line in lines:
+            yield f"\n{line}"
+        if more is not None:
+            yield f"\n{more}" if items else more
 
 
 if __name__ == "__main__":  # pragma: no cover
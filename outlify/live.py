@@ -0,0 +1,168 @@
+import sys
+import threading
+import time
+from collections.abc import Iterable
+from types import TracebackType
+
+from outlify._ansi import CSI
+
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    from typing import Any, TextIO
+
+__all__ = ["Live"]
+
+
+CLEAR_LINE = f"{CSI}2K"        # erase the entire line
+CLEAR_BELOW = f"{CSI}J"        # erase from the cursor to the end of the screen
+
+
+def _cursor_up(rows: int) -> str:
+    return f"{CSI}{rows}A"
+
+
+def _cursor_down(rows: int) -> str:
+    return f"{CSI}{rows}B"
+
+
+class Live:
+    """Redraw a panel (or any other output) in place instead of printing it again."""
+
+    def __init__(self, *, stream: "TextIO | None" = None, max_refresh: float = 10) -> None:
+        """Create a live display that rewrites only the changed lines on every update.
+
+        Previously drawn lines are kept, and each redraw moves the cursor to the changed rows
+        and rewrites only them. Updates coming faster than `max_refresh` are coalesced:
+        only the latest one is drawn, by a background timer, as soon as the next redraw is allowed,
+        or earlier by `refresh()` or when the display is closed.
+
+        If the stream is not a terminal (e.g. output is piped to a file), cursor movement is
+        not available, so only the final state is written when the display is closed.
+
+        :param stream: text stream to draw to, defaults to `sys.stdout`
+        :param max_refresh: maximum number of redraws per second
+        """
+        if max_refresh <= 0:
+            error = f"Invalid value for max_refresh: {max_refresh} <= 0"
+            raise ValueError(error)
+        self.stream = sys.stdout if stream is None else stream
+        self.max_refresh = max_refresh
+        self._interval = 1 / max_refresh
+        self._interactive = self.stream.isatty()
+        self._lines: list[str] = []
+        self._pending: Any = None
+        self._last_draw = float("-inf")
+        self._timer: threading.Timer | None = None  # deferred redraw of a coalesced update
+        self._lock = threading.Lock()
+
+    def update(self, renderable: "Any") -> None:
+        """Set new content of the display.
+
+        :param renderable: a panel or any other object with `iter_lines()`, or anything convertible to `str`
+        """
+        with self._lock:
+            self._pending = renderable
+            if not self._interactive:
+                return
+            elapsed = time.monotonic() - self._last_draw
+            if elapsed >= self._interval:
+                self._draw()
+            elif self._timer is None:  # draw the latest update once the refresh rate allows it
+                self._timer = threading.Timer(self._interval - elapsed, self._draw_deferred)
+                self._timer.daemon = True
+                self._timer.start()
+
+    def refresh(self) -> None:
+        """Draw the latest update immediately, ignoring the refresh rate."""
+        with self._lock:
+            if self._interactive:
+                self._draw()
+
+    def close(self) -> None:
+        """Draw the latest update and leave the cursor below the display."""
+        with self._lock:
+            self._draw()
+
+    def _draw_deferred(self) -> None:
+        with self._lock:
+            if self._timer is threading.current_thread():  # not cancelled by a draw in the meantime
+                self._draw()
+
+    def _draw(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if self._pending is None:
+            return
+        lines = list(_get_lines(self._pending))
+        self._pending = None
+        self._last_draw = time.monotonic()
+
+        output = _diff(self._lines, lines) if self._interactive else "".join(f"{line}\n" for line in lines)
+        self._lines = lines
+        if output:
+            self.stream.write(output)
+            self.stream.flush()
+
+    def __enter__(self) -> "Live":
+        """Start the live display."""
+        return self
+
+    def __exit__(
+            self, exc_type: type[BaseException] | None, exc: BaseException | None, traceback: TracebackType | None,
+    ) -> None:
+        """Draw the final state of the live display."""
+        self.close()
+
+
+def _get_lines(renderable: "Any") -> Iterable[str]:
+    if hasattr(renderable, "iter_lines"):
+        return renderable.iter_lines()
+    return str(renderable).split("\n")
+
+
+def _diff(old: list[str], new: list[str]) -> str:
+    """Build the output that turns already drawn `old` lines into `new` ones.
+
+    The cursor is expected at the beginning of the line below the drawn lines
+    and is left at the beginning of the line below the new ones.
+    """
+    parts = []
+    row = len(old)  # current cursor row, counting from the first drawn line
+    for index, (before, after) in enumerate(zip(old, new, strict=False)):
+        if before == after:
+            continue
+        if index < row:
+            parts.append(_cursor_up(row - index))
+        elif index > row:
+            parts.append(_cursor_down(index - row))
+        parts.append(f"\r{CLEAR_LINE}{after}")
+        row = index
+
+    common = min(len(old), len(new))
+    if row < common:
+        parts.append(_cursor_down(common - row))
+    elif row > common:
+        parts.append(_cursor_up(row - common))
+    if row != common or parts:
+        parts.append("\r")
+
+    if len(new) > len(old):  # append new lines below
+        parts.extend(f"{line}\n" for line in new[common:])
+    elif len(new) < len(old):  # erase lines that are not needed anymore
+        parts.append(CLEAR_BELOW)
+    return "".join(parts)
+
+
+if __name__ == "__main__":  # pragma: no cover
+    from outlify.panel import PanelRenderer, ParamsPanel
+
+    renderer = PanelRenderer(ParamsPanel, title="Live ParamsPanel", width=50)
+    with Live(max_refresh=20) as live:
+        for step in range(101):
+            live.update(renderer.render({
+                "step": f"{step}/100",
+                "progress": f"{'█' * (step // 5)}{'░' * (20 - step // 5)}",
+                "status": "done" if step == 100 else "running",  # noqa: PLR2004
+            }))
+            time.sleep(0.03)
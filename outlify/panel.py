@@ -1,27 +1,43 @@
-import re
-import textwrap
+import itertools
+import sys
 from abc import ABC, abstractmethod
-from collections.abc import Iterable, Mapping, Sequence
-from typing import Any
-
-from outlify._ansi import AnsiCodes
+from collections.abc import Collection, Iterable, Iterator, Mapping, Sequence
+
+from outlify import _width
+from outlify._ansi import AnsiCodes, Style
+from outlify._flatten import flatten
+from outlify._lazy import LazyPattern
+from outlify._mask import hidden_keys, mask
+from outlify._shorten import shorten, validate_limits
 from outlify._utils import get_reset_by_style, parse_styles, parse_title_align, resolve_width
+from outlify._wrap import split, wrap
 from outlify.style import Align, BorderStyle
 
-__all__ = ["Panel", "PanelBase", "ParamsPanel"]
+TYPE_CHECKING = False  # the same as `typing.TYPE_CHECKING` without importing `typing`
+if TYPE_CHECKING:
+    import re
+    from typing import Any, TextIO
+
+__all__ = ["Panel", "PanelBase", "PanelRenderer", "ParamsPanel"]
+
+_LINE_BREAK = LazyPattern("\r\n|[\n\r\x0b\x0c\x1c\x1d\x1e\x85\u2028\u2029]")  # same breaks as str.splitlines
 
 
 class PanelBase(ABC):
     """Base class for creating formatted panels with borders and headers."""
 
+    _empty_content: "Any" = ""  # content of a panel used as a template by `PanelRenderer`
+
     def __init__(
-            self, content: Any, *, width: int | None,
+            self, content: "Any", *, width: int | None,
             title: str, subtitle: str,
             title_align: str | Align, subtitle_align: str | Align,
-            title_style: Sequence[AnsiCodes | str] | None, subtitle_style: Sequence[AnsiCodes | str] | None,
+            title_style: Style | Sequence[AnsiCodes | str] | None,
+            subtitle_style: Style | Sequence[AnsiCodes | str] | None,
             title_conns: str, subtitle_conns: str,
             border: str | BorderStyle,
-            border_style: Sequence[AnsiCodes] | None,
+            border_style: Style | Sequence[AnsiCodes] | None,
+            color: str | None = None,
     ) -> None:
         """Create a base panel with customizable borders, title, and subtitle.
 
@@ -40,14 +56,15 @@ class PanelBase(ABC):
         :param border: border character style. Can be a string or BorderStyle instance
         :param border_style: enumeration of border styles. Any class inherited from AnsiCodes,
                              including Colors, Back and Styles
+        :param color: color mode of this panel: "auto", "always" or "never", the global mode by default
         """
         border = self._parse_border(border)
         width = resolve_width(width)
 
-        title_style, subtitle_style = parse_styles(title_style), parse_styles(subtitle_style)
+        title_style, subtitle_style = parse_styles(title_style, color), parse_styles(subtitle_style, color)
         title_reset, subtitle_reset = get_reset_by_style(title_style), get_reset_by_style(subtitle_style)
 
-        border_style = parse_styles(border_style)
+        border_style = parse_styles(border_style, color)
         self.border_reset = get_reset_by_style(border_style)
         self.header = self._get_header(
             title, align=parse_title_align(title_align), title_style=title_style, title_style_reset=title_reset,
@@ -59,12 +76,54 @@ class PanelBase(ABC):
             title_style_reset=subtitle_reset, width=width, left=border.lb, char=border.headers,
             right=border.rb, conns=subtitle_conns, border_style=border_style,
         )
-        self.content = self._get_content(content, width=width, char=border.sides, border_style=border_style)
+        self._content = self._snapshot(content)
+        self._rendered: str | None = None  # content lines joined on the first access of `content`
+        self._layout = {"width": width, "char": border.sides, "border_style": border_style}
+        self._get_content(self._content, **self._layout)  # validate content eagerly, lines are rendered lazily
+
+    def _snapshot(self, content: "Any") -> "Any":
+        """Get the content kept by the panel, so later changes of the given object do not change the panel."""
+        return content
 
     @abstractmethod
-    def _get_content(self, content: Any, *, width: int, char: str, border_style: str) -> str:
+    def _get_content(self, content: "Any", *, width: int, char: str, border_style: str) -> Iterator[str]:
         pass  # pragma: no cover
 
+    @property
+    def content(self) -> str:
+        """Panel content lines (with side borders) joined into a single string, rendered on the first access."""
+        if self._rendered is None:
+            self._rendered = "\n".join(self._get_content(self._content, **self._layout))
+        return self._rendered
+
+    def iter_lines(self) -> Iterator[str]:
+        """Lazily yield the rendered panel line by line: header, content lines and footer.
+
+        Content lines are produced on demand, so even a huge panel is rendered with constant
+        additional memory and the first line is available immediately. If `content` has been
+        accessed already, its lines are reused.
+        """
+        if self._rendered is not None:
+            return iter((self.header, *self._rendered.split("\n"), self.footer))
+        return self._iter_lines(self._content)
+
+    def render_to(self, stream: "TextIO | None" = None) -> None:
+        """Write the panel to the stream line by line without building the whole string.
+
+        :param stream: text stream to write to, defaults to `sys.stdout`
+        """
+        _write_lines(self.iter_lines(), stream)
+
+    def _iter_lines(self, content: "Any") -> Iterator[str]:
+        yield self.header
+        empty = True
+        for line in self._get_content(content, **self._layout):
+            empty = False
+            yield line
+        if empty:
+            yield ""
+        yield self.footer
+
     @staticmethod
     def _get_inner_width(outside: int) -> int:
         """Get inner panel width.
@@ -110,8 +169,6 @@ class PanelBase(ABC):
             char: str, conns: str, border_style: str,
     ) -> str:
         if title != "":
-            width += len(str(title_style)) + len(title_style_reset)   # title styling
-            width += len(self.border_reset) + len(str(border_style))  # border styling
             title = f"{self.border_reset}{title_style}{title}{title_style_reset}{border_style}"
 
         lconn, rconn = self._get_connectors(conns)
@@ -119,11 +176,11 @@ class PanelBase(ABC):
 
         if align == Align.left:
             title = f"{char}{title}"
-            return f"{title.ljust(width, char)}"
+            return _width.ljust(title, width, char)
         if align == Align.right:
             title = f"{title}{char}"
-            return title.rjust(width, char)
-        return title.center(width, char)
+            return _width.rjust(title, width, char)
+        return _width.center(title, width, char)
 
     def _get_connectors(self, conns: str) -> tuple[str, str]:
         if not isinstance(conns, str):
@@ -148,23 +205,30 @@ class PanelBase(ABC):
         :return: a string representing the line wrapped with borders and padded to match the specified width
         """
         border = f"{border_style}{char}{self.border_reset}"
-        return f"{border} {indent}{line.ljust(width - len(indent))} {border}"
+        return f"{border} {indent}{_width.ljust(line, width - _width.visible_width(indent))} {border}"
 
     def __str__(self) -> str:
         """Return a human-readable string representation of the panel."""
-        return (
-            f"{self.header}\n"
-            f"{self.content}\n"
-            f"{self.footer}"
-        )
+        return f"{self.header}\n{self.content}\n{self.footer}"
 
     def __repr__(self) -> str:
         """Return an unambiguous string representation of the panel for debugging.
 
         The representation includes all non-private attributes of the panel instance,
         making it useful for reconstructing the object or understanding its current state.
+        Content given as a one-shot iterator, e.g. a generator, is shown by its type and not rendered,
+        because rendering it would consume the iterator.
         """
-        content = ", ".join(f"{name}={getattr(self, name)!r}" for name in dir(self) if not name.startswith("_"))
+        one_shot = self._rendered is None and isinstance(self._content, Iterator)
+        attributes = []
+        for name in dir(self):
+            if name.startswith("_"):
+                continue
+            if name == "content" and one_shot:
+                attributes.append(f"content=<{type(self._content).__name__}>")
+            elif not callable(value := getattr(self, name)):
+                attributes.append(f"{name}={value!r}")
+        content = ", ".join(attributes)
         return f"{self.__class__.__name__}({content})"
 
 
@@ -175,11 +239,12 @@ class Panel(PanelBase):
             self, content: str, *, width: int | None = None,
             title: str = "", subtitle: str = "",
             title_align: str | Align = "center", subtitle_align: str | Align = "center",
-            title_style: Sequence[AnsiCodes | str] | None = None,
-            subtitle_style: Sequence[AnsiCodes | str] | None = None,
+            title_style: Style | Sequence[AnsiCodes | str] | None = None,
+            subtitle_style: Style | Sequence[AnsiCodes | str] | None = None,
             title_conns: str = "", subtitle_conns: str = "",
             border: str | BorderStyle = "╭╮╰╯─│",
-            border_style: Sequence[AnsiCodes | str] | None = None,
+            border_style: Style | Sequence[AnsiCodes | str] | None = None,
+            color: str | None = None,
     ) -> None:
         """Create a simple panel for displaying plain text with customizable borders, title, and subtitle.
 
@@ -215,6 +280,8 @@ class Panel(PanelBase):
                        or an instance of BorderStyle
         :param border_style: enumeration of border styles. Any class inherited from AnsiCodes,
                              including Colors, Back and Styles
+        :param color: color mode of this panel: "auto" - styled only for a color terminal, "always" or "never".
+                      If not specified, the global mode set by `set_color_mode` is used
         """
         super().__init__(
             content, width=width,
@@ -222,51 +289,54 @@ class Panel(PanelBase):
             title_align=title_align, subtitle_align=subtitle_align,
             title_style=title_style, subtitle_style=subtitle_style,
             title_conns=title_conns, subtitle_conns=subtitle_conns,
-            border=border, border_style=border_style,
+            border=border, border_style=border_style, color=color,
         )
 
-    def _get_content(self, content: Any, *, width: int, char: str, border_style: str) -> str:
+    def _snapshot(self, content: "Any") -> str:
+        return str(content)
+
+    def _get_content(self, content: "Any", *, width: int, char: str, border_style: str) -> Iterator[str]:
         """Get prepared panel content.
 
         :param content: multi-line string to display in the panel
         :param width: total panel width (including borders)
         :param char: character for the side borders. If empty string, disables wrapping and borders
         :param border_style: ansi escape sequences
-        :return: panel with prepared content
+        :return: iterator over panel lines with prepared content
         """
-        content = str(content)
         width = self._get_inner_width(width)
+        return self._iter_content(str(content), width=width, char=char, border_style=border_style)
 
-        lines = []
-        for line in content.splitlines():
+    def _iter_content(self, content: str, *, width: int, char: str, border_style: str) -> Iterator[str]:
+        for line in _iter_splitlines(content):
             if char == "" or (line := line.strip()) == "":
-                lines.append(line)
+                yield self._fill(line, width=width, char=char, border_style=border_style)
                 continue
 
-            wrapped = textwrap.wrap(
-                line, width=width, replace_whitespace=False,
-                drop_whitespace=False, break_on_hyphens=False,
-            )
-            lines.extend(wrapped)
-
-        lines = [self._fill(line, width=width, char=char, border_style=border_style) for line in lines]
-        return "\n".join(lines)
+            for part in wrap(line, width):
+                yield self._fill(part, width=width, char=char, border_style=border_style)
 
 
 class ParamsPanel(PanelBase):
     """Providing parameters in the panel."""
 
+    _empty_content: Mapping["Any", "Any"] = {}
+
     def __init__(
-            self, content: Mapping[Any, Any], *, width: int | None = None,
+            self, content: "Mapping[Any, Any] | Iterable[tuple[Any, Any]]", *, width: int | None = None,
             title: str = "", subtitle: str = "",
             title_align: str | Align = "center", subtitle_align: str | Align = "center",
-            title_style: Sequence[AnsiCodes | str] | None = None,
-            subtitle_style: Sequence[AnsiCodes | str] | None = None,
+            title_style: Style | Sequence[AnsiCodes | str] | None = None,
+            subtitle_style: Style | Sequence[AnsiCodes | str] | None = None,
             title_conns: str = "", subtitle_conns: str = "",
             border: str | BorderStyle = "╭╮╰╯─│",
-            border_style: Sequence[AnsiCodes | str] | None = None,
-            hidden: Iterable[str | re.Pattern] = (".*password.*", ".*token.*"), separator: str = " = ",
-            params_style: Sequence[AnsiCodes | str] | None = None,
+            border_style: Style | Sequence[AnsiCodes | str] | None = None,
+            hidden: "Iterable[str | re.Pattern[str]]" = (".*password.*", ".*token.*"), separator: str = " = ",
+            params_style: Style | Sequence[AnsiCodes | str] | None = None, mask_visible: int = 0,
+            key_width: int | None = None, key_width_scan: int | None = None,
+            flat: bool = False, max_depth: int = 10,
+            max_chars: int | None = None, max_items: int | None = None, max_level: int | None = None,
+            color: str | None = None,
     ) -> None:
         """Create a panel for displaying key-value parameters in a formatted layout.
 
@@ -276,6 +346,8 @@ class ParamsPanel(PanelBase):
 
         :param content: a mapping of keys to string values to display in the panel.
                         For example: {'learning_rate': '0.001', 'batch_size': '64'}.
+                        It can also be any iterable of `(key, value)` pairs, e.g. a generator:
+                        pairs are rendered as they are consumed, so a one-shot iterator can be rendered once
         :param width: total panel width (including borders)
         :param title: title displayed at the top of the panel
         :param title_align: alignment of the title. Can be a string ('left', 'center', 'right') or an Align enum/type
@@ -307,110 +379,262 @@ class ParamsPanel(PanelBase):
         :param separator: key-value separator
         :param params_style: enumeration of parameter name styles. Any class inherited from AnsiCodes,
                              including Colors, Back and Styles
+        :param mask_visible: number of the last characters of hidden values left visible, e.g. 4 → `*****1234`.
+                             They are shown only for values more than twice as long
+        :param key_width: fixed width of the key column. Longer keys are not truncated and shift their values
+        :param key_width_scan: if `key_width` is not set, derive it from the first `key_width_scan` parameters
+                               instead of all of them, so rendering starts without reading the whole content
+        :param flat: show nested mappings and sequences as separate parameters with dotted keys,
+                     e.g. `db.hosts[0] = localhost`. `hidden` patterns are matched against the full keys,
+                     a hidden mapping or sequence is masked as a whole
+        :param max_depth: with `flat`, number of nesting levels to expand, deeper values are shown as they are
+        :param max_chars: maximum number of characters of every value, longer ones end with `…`.
+                          Values that are lists, tuples, dicts or sets are formatted only up to this length
+        :param max_items: maximum number of items shown in values that are lists, tuples, dicts or sets
+        :param max_level: maximum nesting level shown in values that are lists, tuples, dicts or sets
+        :param color: color mode of this panel: "auto" - styled only for a color terminal, "always" or "never".
+                      If not specified, the global mode set by `set_color_mode` is used
         """
+        if mask_visible < 0:
+            error = f"Invalid value for mask_visible: {mask_visible} < 0"
+            raise ValueError(error)
+        if key_width is not None and key_width < 0:
+            error = f"Invalid value for key_width: {key_width} < 0"
+            raise ValueError(error)
+        if key_width_scan is not None and key_width_scan < 1:
+            error = f"Invalid value for key_width_scan: {key_width_scan} < 1"
+            raise ValueError(error)
+        if max_depth < 1:
+            error = f"Invalid value for max_depth: {max_depth} < 1"
+            raise ValueError(error)
+        validate_limits(max_chars=max_chars, max_items=max_items, max_level=max_level)
+        width = resolve_width(width)
+        inner_width = self._get_inner_width(width)
+        if key_width is not None and key_width + _width.visible_width(separator) >= inner_width:
+            error = f"Invalid value for key_width: {key_width} with the separator does not fit in {inner_width}"
+            raise ValueError(error)
         self.hidden = self._compile_regexes(hidden)
+        self.mask_visible = mask_visible
+        self.key_width = key_width
+        self.key_width_scan = key_width_scan
+        self.flat = flat
+        self.max_depth = max_depth
+        self.max_chars, self.max_items, self.max_level = max_chars, max_items, max_level
+        self._hidden_keys = hidden_keys(self.hidden)
         self.separator = separator
-        self.params_style = parse_styles(params_style)
+        self.params_style = parse_styles(params_style, color)
         self.params_reset = get_reset_by_style(self.params_style)
-
-        # width alignment to styles
-        self._additional_width = len(self.params_style) + len(self.params_reset)
         super().__init__(
             content, width=width,
             title=title, subtitle=subtitle,
             title_align=title_align, subtitle_align=subtitle_align,
             title_style=title_style, subtitle_style=subtitle_style,
             title_conns=title_conns, subtitle_conns=subtitle_conns,
-            border=border, border_style=border_style,
+            border=border, border_style=border_style, color=color,
         )
 
+    def _snapshot(
+            self, content: "Mapping[Any, Any] | Iterable[tuple[Any, Any]]",
+    ) -> "Iterable[tuple[Any, Any]] | Any":
+        """Copy the pairs of a mapping or a sized iterable; an iterator is kept and consumed by the first rendering.
+
+        :raises TypeError: an item of a sized iterable is not a pair
+        """
+        if isinstance(content, Mapping):
+            return tuple(content.items())
+        if isinstance(content, Collection) and not isinstance(content, str | bytes):
+            return tuple(map(self._as_pair, content))
+        return content
+
     @staticmethod
-    def _compile_regexes(hidden: Iterable[str | re.Pattern[str]]) -> tuple[re.Pattern[str], ...]:
+    def _compile_regexes(hidden: "Iterable[str | re.Pattern[str]]") -> "tuple[re.Pattern[str], ...]":
+        import re
+
         return tuple(re.compile(pattern) if isinstance(pattern, str) else pattern for pattern in hidden)
 
-    def _get_content(self, content: Mapping[Any, Any], *, width: int, char: str, border_style: str) -> str:
+    def _get_content(
+            self, content: "Mapping[Any, Any] | Iterable[tuple[Any, Any]]", *, width: int, char: str, border_style: str,
+    ) -> Iterator[str]:
         """Get prepared panel content.
 
-        :param content: parameters that should be in the panel
+        :param content: parameters that should be in the panel, a mapping or an iterable of pairs
         :param width: total panel width (including borders)
         :param char: character for the side borders. If empty string, disables wrapping and borders
         :param border_style: ansi escape sequences
-        :return: panel with prepared content
+        :return: iterator over panel lines with prepared content
         """
-        if not isinstance(content, Mapping):
-            error = f"Invalid type for content: {type(content)} is not Mapping"
+        if not isinstance(content, Mapping | Iterable) or isinstance(content, str | bytes):
+            error = f"Invalid type for content: {type(content)} is not Mapping or Iterable of pairs"
             raise TypeError(error)
         width = self._get_inner_width(width)
-        params = self._prepare_params(content)
+        return self._iter_content(content, width=width, char=char, border_style=border_style)
 
-        lines = []
-        max_key_length = max(len(key) for key in params)
-        width_inside = width - max_key_length - len(self.separator)
-        indent = " " * (max_key_length + len(self.separator))
-        leveled_width = width + self._additional_width
-        for key, value in params.items():
-            displayed_value = self._mask_value(key, value)
+    def _iter_content(
+            self, content: "Mapping[Any, Any] | Iterable[tuple[Any, Any]]", *, width: int, char: str, border_style: str,
+    ) -> Iterator[str]:
+        params = self._prepare_params(content)
+        max_key_length = self.key_width
+        if max_key_length is None:  # only the scanned parameters are kept in memory
+            scanned = list(itertools.islice(params, self.key_width_scan))
+            max_key_length = max((_width.visible_width(key) for key, _ in scanned), default=0)
+            params = itertools.chain(scanned, params)
+        indent = " " * (max_key_length + _width.visible_width(self.separator))
+        if len(indent) >= width:  # no room for values next to the keys, so they are wrapped at the full width
+            indent = ""
+        width_inside = width - len(indent)
+        for key, value in params:
             line = (
-                f"{self.params_style}{key.ljust(max_key_length)}{self.params_reset}"
-                f"{self.separator}{displayed_value}"
+                f"{self.params_style}{_width.ljust(key, max_key_length)}{self.params_reset}"
+                f"{self.separator}{value}"
             )
 
             if not char:  # mode without border in sides
-                lines.append(f"  {line}")
-            elif len(line) <= leveled_width:  # the whole line fits in the panel
-                lines.append(self._fill(line, width=leveled_width, char=char, border_style=border_style))
+                yield f"  {line}"
+            elif _width.visible_width(line) <= width:  # the whole line fits in the panel
+                yield self._fill(line, width=width, char=char, border_style=border_style)
             else:  # it's necessary to split the string
-                lines.extend(self._wrap_line(line, width, leveled_width, width_inside, char, border_style, indent))
-        return "\n".join(lines)
+                yield from self._wrap_line(line, width, width_inside, char, border_style, indent)
+
+    def _prepare_params(self, content: "Mapping[Any, Any] | Iterable[tuple[Any, Any]]") -> Iterator[tuple[str, str]]:
+        """Lazily convert all keys and values to strings, flattening nested values if needed.
+
+        Values of hidden keys are masked instead of shortened: the mask is built from the original value,
+        so a shortened value can not reveal its middle characters.
+
+        :param content: original content mapping or iterable of pairs
+        :return: iterator over stringified keys and displayed values
+        """
+        pairs = self._iter_pairs(content)
+        if self.flat:
+            pairs = flatten(pairs, max_depth=self.max_depth, keep=self._hidden_keys)
+        for key, value in pairs:
+            if self._hidden_keys(key):
+                yield key, mask(value, visible=self.mask_visible)
+            else:
+                yield key, shorten(
+                    value, max_chars=self.max_chars, max_items=self.max_items, max_level=self.max_level,
+                )
 
     @staticmethod
-    def _prepare_params(content: Mapping[Any, Any]) -> dict[str, str]:
-        """Convert all keys and values in the mapping to strings.
+    def _iter_pairs(content: "Mapping[Any, Any] | Iterable[tuple[Any, Any]]") -> Iterator[tuple[str, "Any"]]:
+        """Lazily iterate over the parameters with stringified keys.
 
-        :param content: original content mapping
-        :return: dictionary with stringified keys and values
+        :raises TypeError: an item of the iterable is not a pair
         """
-        return {str(key): str(value) for key, value in content.items()}
+        if isinstance(content, Mapping):
+            for key, value in content.items():
+                yield str(key), value
+            return
 
-    def _mask_value(self, key: str, value: str) -> str:
-        """Replace value with asterisks if the key is in the hidden list.
+        for key, value in map(ParamsPanel._as_pair, content):
+            yield str(key), value
 
-        :param key: parameter name
-        :param value: parameter value
-        :return: either the original value or a masked string
+    @staticmethod
+    def _as_pair(item: "Any") -> tuple["Any", "Any"]:
+        """Unpack an item of the content into a key and a value without stringifying them.
+
+        :raises TypeError: the item is not a pair
         """
-        for pattern in self.hidden:
-            if pattern.fullmatch(key):
-                return "*****" if value else value
-        return value
+        if not isinstance(item, str | bytes):
+            try:
+                key, value = item
+            except (TypeError, ValueError):
+                pass
+            else:
+                return key, value
+        error = f"Invalid item of content: {item!r} is not a (key, value) pair"
+        raise TypeError(error)
 
     def _wrap_line(
-            self, line: str, width: int, leveled_width: int, width_inside: int,
+            self, line: str, width: int, width_inside: int,
             char: str, border_style: str, indent: str,
     ) -> list[str]:
         """Wrap a long line into multiple lines with proper indentation and border formatting.
 
         :param line: the full line to wrap
-        :param width: full panel width including borders
-        :param width: leveled panel width including borders (for ansi colors)
+        :param width: inner panel width (visible cells, ansi escape sequences are not counted)
         :param width_inside: usable width after the key and separator
         :param char: border character
         :param border_style: ansi escape sequences
         :param indent: indentation for wrapped lines
         :return: list of wrapped and formatted lines
         """
-        head, tail = line[:leveled_width], line[leveled_width:]
-        wrapped = textwrap.wrap(
-            tail, width=width_inside, replace_whitespace=False,
-            drop_whitespace=False, break_on_hyphens=False,
-        )
+        head, tail = split(line, width)
         lines = [self._fill(head, width=width, char=char, border_style=border_style)]
         lines.extend(
-            self._fill(part, width=width, char=char, border_style=border_style, indent=indent) for part in wrapped
+            self._fill(part, width=width, char=char, border_style=border_style, indent=indent)
+            for part in wrap(tail, width_inside)
         )
         return lines
 
 
+class PanelRenderer:
+    """Reusable panel template for rendering different content with the same styling."""
+
+    def __init__(self, panel: type[PanelBase] = Panel, *, width: int | None = None, **options: "Any") -> None:
+        """Create a panel template that renders only the content on each call.
+
+        Borders, styles, connectors, header and footer are resolved once per panel width and reused
+        by every render. Useful when the same panel (e.g. a status panel) is printed many times
+        and only its body changes.
+
+        :param panel: panel class to render, e.g. `Panel` or `ParamsPanel`
+        :param width: total panel width (including borders). If not specified,
+                      the terminal width at the time of rendering is used
+        :param options: other keyword arguments of the panel class: title, border, border_style, etc.
+        """
+        self.panel = panel
+        self.width = width
+        self.options = options
+        self._templates: dict[int, PanelBase] = {}
+        self._get_template()  # validate options eagerly
+
+    def render(self, content: "Any") -> str:
+        """Render the panel with the given content to a string."""
+        return "\n".join(self.iter_lines(content))
+
+    def iter_lines(self, content: "Any") -> Iterator[str]:
+        """Lazily yield the panel with the given content line by line, see `PanelBase.iter_lines`."""
+        return self._get_template()._iter_lines(content)  # noqa: SLF001
+
+    def render_to(self, content: "Any", stream: "TextIO | None" = None) -> None:
+        """Write the panel with the given content to the stream line by line.
+
+        :param content: panel content
+        :param stream: text stream to write to, defaults to `sys.stdout`
+        """
+        _write_lines(self.iter_lines(content), stream)
+
+    def _get_template(self) -> PanelBase:
+        width = resolve_width(self.width)
+        template = self._templates.get(width)
+        if template is None:
+            template = self.panel(self.panel._empty_content, width=width, **self.options)  # noqa: SLF001
+            self._templates[width] = template
+        return template
+
+    def __repr__(self) -> str:
+        """Return an unambiguous string representation of the renderer for debugging."""
+        options = "".join(f", {name}={value!r}" for name, value in self.options.items())
+        return f"{self.__class__.__name__}({self.panel.__name__}, width={self.width!r}{options})"
+
+
+def _write_lines(lines: Iterable[str], stream: "TextIO | None") -> None:
+    stream = sys.stdout if stream is None else stream
+    for line in lines:
+        stream.write(f"{line}\n")
+
+
+def _iter_splitlines(text: str) -> Iterator[str]:
+    """Lazily split text into lines, equivalent to `str.splitlines` without building the whole list."""
+    start = 0
+    for match in _LINE_BREAK.finditer(text):
+        yield text[start:match.start()]
+        start = match.end()
+    if start < len(text):
+        yield text[start:]
+
+
 if __name__ == "__main__":  # pragma: no cover
     from outlify.style import Colors
 
@@ -1,5 +1,5 @@
+from collections import namedtuple
 from enum import Enum
-from typing import NamedTuple
 
 from outlify._ansi import (  # noqa: F401
     AnsiBackColorsCodes,
@@ -8,7 +8,20 @@ from outlify._ansi import (  # noqa: F401
     AnsiStylesCodes,
     Back,
     Colors,
+    Style,
     Styles,
+    strip_ansi,
+)
+from outlify._color import (  # noqa: F401
+    COLOR_MODES,
+    ColorDepth,
+    detect_color,
+    detect_color_depth,
+    get_color_depth,
+    get_color_mode,
+    set_color_depth,
+    set_color_mode,
+    use_color,
 )
 
 
@@ -20,15 +33,12 @@ class Align(Enum):
     right = "right"
 
 
-class BorderStyle(NamedTuple):
+# typing.NamedTuple would import `typing`, which is slow, for every program that only uses colors
+class BorderStyle(namedtuple("BorderStyle", ("lt", "rt", "lb", "rb", "headers", "sides"))):  # noqa: PYI024
     """Represent border styling."""
 
-    lt: str
-    rt: str
-    lb: str
-    rb: str
-    headers: str
-    sides: str
+    __slots__ = ()
+
 
 if __name__ == "__main__":  # pragma: no cover
     print(f"Outlify allow you {Styles.bold}styling{Styles.reset} your text")
@@ -36,3 +46,5 @@ if __name__ == "__main__":  # pragma: no cover
         f"for example, you can {Colors.blue}color{Colors.reset} your text, "
         f"{Styles.underline}underline{Styles.reset} it.",
     )
+    warning = Colors.red | Styles.bold
+    print(f"and combine styles: {warning}warning{warning.reset} is red and bold")
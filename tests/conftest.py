@@ -0,0 +1,11 @@
+import pytest
+
+from outlify.style import set_color_mode
+
+
+@pytest.fixture(autouse=True)
+def color_mode() -> None:
+    """Style the output in every test: "auto" would disable styles, as tests do not run in a terminal."""
+    set_color_mode("always")
+    yield
+    set_color_mode("auto")
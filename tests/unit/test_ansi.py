@@ -119,3 +119,67 @@ def test_back(back: AnsiCodes, result: str):
 )
 def test_styles(style: AnsiCodes, result: str):
     assert style == result
+
+
+@pytest.mark.unit
+def test_custom_ansicodes_are_converted_once_per_class():
+    class Brand(IDAnsiCodes):
+        logo = 38, 5, 33
+        escape = '\033[1m'  # already an escape sequence
+
+    assert Brand.logo == '\033[38;5;33m'
+    assert Brand.escape == '\033[1m'
+    assert Brand.pink == CustomID.pink == '\033[38;5;207m'  # inherited codes are not converted again
+    assert vars(Brand()) == {}  # instances do no work
+
+
+@pytest.fixture
+def color_depth():
+    from outlify.style import set_color_depth
+
+    yield set_color_depth
+    set_color_depth(None)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'depth,rgb,back,palette',
+    [
+        (24, '\033[38;2;255;128;0m', '\033[48;2;0;170;255m', '\033[38;5;208m'),
+        (8, '\033[38;5;208m', '\033[48;5;39m', '\033[38;5;208m'),
+        (4, '\033[33m', '\033[46m', '\033[33m'),
+        (0, '\033[33m', '\033[46m', '\033[33m'),
+    ]
+)
+def test_extended_colors(color_depth, depth: int, rgb: str, back: str, palette: str):
+    color_depth(depth)
+    assert Colors.rgb(255, 128, 0) == rgb
+    assert Colors.hex('#ff8000') == rgb
+    assert Back.hex('#0af') == back
+    assert Colors.palette(208) == palette
+    assert Colors.rgb(255, 128, 0) is Colors.rgb(255, 128, 0)  # cached
+
+
+@pytest.mark.unit
+def test_extended_colors_compose(color_depth):
+    color_depth(24)
+    style = Colors.hex('#ff8000') | Back.palette(17) | Styles.bold
+    assert style == '\033[38;2;255;128;0;48;5;17;1m'
+    assert style.reset == '\033[39;49;22m'
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'call,error',
+    [
+        (lambda: Colors.rgb(256, 0, 0), 'Invalid value for RGB color: 256'),
+        (lambda: Colors.rgb(-1, 0, 0), 'Invalid value for RGB color: -1'),
+        (lambda: Back.rgb(0, 0.5, 0), 'Invalid value for RGB color: 0.5'),
+        (lambda: Colors.hex('orange'), 'Invalid hex color'),
+        (lambda: Colors.palette(256), 'Invalid index of palette color: 256'),
+        (lambda: Back.palette('1'), "Invalid index of palette color: '1'"),
+    ]
+)
+def test_extended_colors_invalid(call, error: str):
+    with pytest.raises(ValueError, match=error):
+        call()
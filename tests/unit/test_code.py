@@ -0,0 +1,44 @@
+import functools
+import inspect
+
+import pytest
+
+from outlify._code import is_async_generator_function, is_coroutine_function, is_generator_function
+
+
+def function():
+    pass
+
+
+def generator():
+    yield
+
+
+async def coroutine():
+    pass
+
+
+async def async_generator():
+    yield
+
+
+class Methods:
+    def generator(self):
+        yield
+
+    async def coroutine(self):
+        pass
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'func',
+    [
+        function, generator, coroutine, async_generator, Methods().generator, Methods().coroutine,
+        functools.partial(coroutine), functools.partial(functools.partial(generator)), print, len, Methods, 42,
+    ],
+)
+def test_matches_inspect(func):
+    assert is_generator_function(func) is inspect.isgeneratorfunction(func)
+    assert is_coroutine_function(func) is inspect.iscoroutinefunction(func)
+    assert is_async_generator_function(func) is inspect.isasyncgenfunction(func)
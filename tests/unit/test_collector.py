@@ -0,0 +1,125 @@
+import json
+import multiprocessing
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from outlify._collector import TimingCollector
+from outlify.decorators import EveryNth, timer
+
+
+@pytest.mark.unit
+def test_collector_flush():
+    collector = TimingCollector(flush_every=3)
+    collector.add("work", 0.1)
+    collector.add("work", 0.2)
+    assert collector._stats == {}  # still in the thread's buffer
+    collector.add("work", 0.3)
+    assert collector._stats["work"].count == 3
+
+
+@pytest.mark.unit
+def test_collector_threads():
+    collector = TimingCollector(flush_every=7)
+
+    def work(index):
+        for _ in range(100):
+            collector.add(f"task-{index % 2}", 0.001)
+
+    threads = [threading.Thread(target=work, args=(index,)) for index in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = collector.stats()
+    assert sorted(stats) == ["task-0", "task-1"]
+    assert stats["task-0"].count == stats["task-1"].count == 200
+
+
+@pytest.mark.unit
+def test_collector_snapshot_merge():
+    child = TimingCollector()
+    child.add("work", 0.5, items=3)
+    child.add("other", 1.0)
+
+    parent = TimingCollector()
+    parent.add("work", 0.1)
+    parent.merge(json.loads(json.dumps(child.snapshot())))
+    stats = parent.stats()
+    assert (stats["work"].count, stats["work"].items, stats["work"].max) == (2, 3, 0.5)
+    assert stats["other"].count == 1
+
+    parent.reset()
+    assert parent.stats() == {}
+
+
+@pytest.mark.unit
+def test_collector_report():
+    collector = TimingCollector()
+    collector.add("b", 2.0)
+    collector.add("a", 1.0)
+    collector.add("a", 3.0)
+    output_mock = Mock()
+    collector.report(time_format="{s}", output_func=output_mock)
+    assert output_mock.call_args[0][0].split("\n") == [
+        "name  calls  total  mean  p50  p95  p99  max",
+        "a         2      4     2    1    3    3    3",
+        "b         1      2     2    2    2    2    2",
+    ]
+
+
+@pytest.mark.unit
+def test_collector_report_memory():
+    collector = TimingCollector()
+    collector.add("a", 1.0, memory=(2048, 1024))
+    collector.add("b", 2.0)
+    output_mock = Mock()
+    collector.report(time_format="{s}", output_func=output_mock)
+    assert output_mock.call_args[0][0].split("\n") == [
+        "name  calls  total  mean  p50  p95  p99  max  peak memory  net memory",
+        "a         1      1     1    1    1    1    1      2.0 KiB    +1.0 KiB",
+        "b         1      2     2    2    2    2    2            -           -",
+    ]
+
+
+@pytest.mark.unit
+def test_collector_invalid_flush_every():
+    with pytest.raises(ValueError):
+        TimingCollector(flush_every=0)
+
+
+collector = TimingCollector()
+
+
+@timer(collector=collector)
+def _square(x):
+    return x * x
+
+
+def _reset():
+    collector.reset()
+
+
+def _worker(numbers):
+    return [_square(x) for x in numbers], collector.snapshot(reset=True)
+
+
+@pytest.mark.unit
+def test_timer_collector_threads_and_processes():
+    collector.reset()
+    with ThreadPoolExecutor(4) as executor:
+        assert list(executor.map(_square, range(20))) == [x * x for x in range(20)]
+
+    with multiprocessing.get_context("spawn").Pool(2, initializer=_reset) as pool:
+        for results, snapshot in pool.map(_worker, [range(5), range(5, 10)]):
+            collector.merge(snapshot)
+    assert collector.stats()["_square"].count == 30
+
+
+@pytest.mark.unit
+def test_timer_collector_rejects_sampling():
+    with pytest.raises(ValueError, match="sampling can not be used with collector"):
+        timer(collector=TimingCollector(), sampling=EveryNth(10))
@@ -0,0 +1,204 @@
+import random
+
+import pytest
+
+from outlify._color import (
+    ColorDepth, color_codes, detect_color, detect_color_depth, get_color_depth, get_color_mode, palette_rgb,
+    palette_to_standard, parse_hex, rgb_to_palette, rgb_to_standard, set_color_depth, set_color_mode, use_color,
+)
+
+
+def distance(first, second) -> int:
+    return sum((a - b) ** 2 for a, b in zip(first, second))
+
+
+@pytest.fixture
+def detect(monkeypatch):
+    for name in ('COLORTERM', 'TERM', 'WT_SESSION'):
+        monkeypatch.delenv(name, raising=False)
+
+    def detect(isatty: bool = False, **env) -> ColorDepth:
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setattr('sys.stdout.isatty', lambda: isatty, raising=False)
+        detect_color_depth.cache_clear()
+        return detect_color_depth()
+
+    yield detect
+    detect_color_depth.cache_clear()
+
+
+@pytest.fixture
+def auto(monkeypatch):
+    for name in ('COLORTERM', 'TERM', 'WT_SESSION', 'NO_COLOR', 'FORCE_COLOR'):
+        monkeypatch.delenv(name, raising=False)
+
+    def auto(isatty: bool = False, **env) -> bool:
+        for name, value in env.items():
+            monkeypatch.setenv(name, value)
+        monkeypatch.setattr('sys.stdout.isatty', lambda: isatty, raising=False)
+        detect_color.cache_clear()
+        detect_color_depth.cache_clear()
+        return use_color('auto')
+
+    yield auto
+    detect_color.cache_clear()
+    detect_color_depth.cache_clear()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'env,isatty,result',
+    [
+        ({'COLORTERM': 'truecolor', 'TERM': 'xterm-256color'}, True, ColorDepth.truecolor),
+        ({'COLORTERM': '24bit'}, False, ColorDepth.truecolor),
+        ({'WT_SESSION': '1'}, True, ColorDepth.truecolor),
+        ({'TERM': 'xterm-256color'}, True, ColorDepth.extended),
+        ({'TERM': 'screen-256color', 'COLORTERM': 'yes'}, False, ColorDepth.extended),
+        ({'TERM': 'xterm'}, True, ColorDepth.standard),
+        ({'TERM': 'dumb'}, True, ColorDepth.no_color),
+        ({}, True, ColorDepth.standard),
+        ({}, False, ColorDepth.no_color),
+    ]
+)
+def test_detect_color_depth(detect, env: dict, isatty: bool, result: ColorDepth):
+    assert detect(isatty, **env) == result
+
+
+@pytest.mark.unit
+def test_color_depth_is_detected_once(detect):
+    assert detect(TERM='xterm-256color') == ColorDepth.extended
+    assert detect_color_depth.cache_info().currsize == 1
+
+
+@pytest.mark.unit
+def test_set_color_depth():
+    try:
+        set_color_depth(24)
+        assert get_color_depth() is ColorDepth.truecolor
+        set_color_depth(ColorDepth.standard)
+        assert get_color_depth() is ColorDepth.standard
+    finally:
+        set_color_depth(None)
+    assert get_color_depth() == detect_color_depth()
+    with pytest.raises(ValueError):
+        set_color_depth(16)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'rgb,palette,standard',
+    [
+        ((0, 0, 0), 16, 0),
+        ((255, 255, 255), 231, 15),
+        ((255, 0, 0), 196, 9),
+        ((255, 128, 0), 208, 3),
+        ((128, 128, 128), 244, 8),
+        ((0, 0, 238), 21, 4),
+        ((18, 18, 18), 233, 0),
+    ]
+)
+def test_downsampling(rgb: tuple, palette: int, standard: int):
+    assert rgb_to_palette(rgb) == palette
+    assert rgb_to_standard(rgb) == standard
+
+
+@pytest.mark.unit
+def test_rgb_to_palette_is_nearest():
+    rnd = random.Random(0)
+    for _ in range(2000):
+        rgb = tuple(rnd.randrange(256) for _ in range(3))
+        nearest = min(range(16, 256), key=lambda index: distance(rgb, palette_rgb(index)))
+        assert distance(rgb, palette_rgb(rgb_to_palette(rgb))) == distance(rgb, palette_rgb(nearest))
+
+
+@pytest.mark.unit
+def test_palette_to_standard_is_nearest():
+    for index in range(256):
+        nearest = min(range(16), key=lambda standard: distance(palette_rgb(index), palette_rgb(standard)))
+        assert distance(palette_rgb(index), palette_rgb(palette_to_standard(index))) == \
+            distance(palette_rgb(index), palette_rgb(nearest))
+    assert [palette_to_standard(index) for index in range(16)] == list(range(16))
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'depth,result',
+    [
+        (ColorDepth.truecolor, (38, 2, 255, 128, 0)),
+        (ColorDepth.extended, (38, 5, 208)),
+        (ColorDepth.standard, (33,)),
+        (ColorDepth.no_color, (33,)),  # whether to output colors at all is decided elsewhere
+    ]
+)
+def test_color_codes(depth: ColorDepth, result: tuple):
+    assert color_codes((255, 128, 0), extended=38, standard=30, depth=depth) == result
+
+
+@pytest.mark.unit
+def test_color_codes_bright():
+    assert color_codes((255, 0, 0), extended=48, standard=40, depth=ColorDepth.standard) == (101,)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'color,result',
+    [
+        ('#ff8000', (255, 128, 0)),
+        ('FF8000', (255, 128, 0)),
+        ('#f80', (255, 136, 0)),
+        ('000', (0, 0, 0)),
+    ]
+)
+def test_parse_hex(color: str, result: tuple):
+    assert parse_hex(color) == result
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('color', ['', '#', '#ff80', '#ff800g', 'ff_800', ' fff', '#fffffff'])
+def test_parse_hex_invalid(color: str):
+    with pytest.raises(ValueError, match='Invalid hex color'):
+        parse_hex(color)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'env,isatty,result',
+    [
+        ({'TERM': 'xterm-256color'}, True, True),
+        ({'TERM': 'xterm-256color'}, False, False),
+        ({'TERM': 'dumb'}, True, False),
+        ({}, True, True),
+        ({'TERM': 'xterm', 'NO_COLOR': '1'}, True, False),
+        ({'TERM': 'xterm', 'NO_COLOR': ''}, True, True),
+        ({'FORCE_COLOR': '1'}, False, True),
+        ({'TERM': 'dumb', 'FORCE_COLOR': 'true'}, False, True),
+        ({'FORCE_COLOR': ''}, False, False),
+        ({'NO_COLOR': '1', 'FORCE_COLOR': '1'}, True, False),
+    ]
+)
+def test_detect_color(auto, env: dict, isatty: bool, result: bool):
+    assert auto(isatty, **env) is result
+
+
+@pytest.mark.unit
+def test_use_color(auto):
+    auto(False)
+    assert use_color('always') is True
+    assert use_color('never') is False
+    set_color_mode('never')
+    assert get_color_mode() == 'never'
+    assert use_color() is False
+    assert use_color('always') is True  # a single call overrides the global mode
+    set_color_mode('auto')
+    assert use_color() is False
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('mode', ['', 'yes', 'NEVER', 'none'])
+def test_color_mode_invalid(mode: str):
+    with pytest.raises(ValueError, match='Invalid value for color mode'):
+        set_color_mode(mode)
+    with pytest.raises(ValueError, match='Invalid value for color mode'):
+        use_color(mode)
+    assert get_color_mode() == 'always'
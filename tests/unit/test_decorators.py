@@ -1,9 +1,10 @@
+import asyncio
 from typing import Type
 from unittest.mock import Mock, patch
 
 import pytest
 
-from outlify.decorators import timer
+from outlify.decorators import EveryNth, timer, timer_overhead
 
 
 @pytest.mark.unit
@@ -26,7 +27,9 @@ from outlify.decorators import timer
 
         ("test format", None, "{h:02}:{m:02}",  0.0, 3661.0, "test format took 01:01"),
         ("test format", None, "{m} min {s} sec",  0.0, 3661.0, "test format took 1 min 1 sec"),
+        ("test format", None, "{s}.{ms:03}{us:03}{ns:03}",  0.0, 1.000123456, "test format took 1.000123456"),
         ("test format extra names", None, "{mm}",  0.0, 1.0, KeyError),
+        ("test format invalid spec", None, "{ms:zz}",  0.0, 1.0, ValueError),
     ]
 )
 def test_timer_decorator_outputs_timing(label: str, connector: str, timefmt: str, start: float, end: float, result: str | Type[BaseException]):
@@ -38,11 +41,12 @@ def test_timer_decorator_outputs_timing(label: str, connector: str, timefmt: str
     if connector is not None:
         params["connector"] = connector
 
-    @timer(**params)
-    def dummy_func(x, y):
-        return x + y
     def run():
-        with patch("outlify.decorators.time.perf_counter", side_effect=[start, end]):
+        @timer(**params)
+        def dummy_func(x, y):
+            return x + y
+
+        with patch("outlify.decorators.time.perf_counter_ns", side_effect=[round(start * 1e9), round(end * 1e9)]):
             dummy_func(2, 3)
 
     if isinstance(result, type) and issubclass(result, BaseException):
@@ -54,3 +58,419 @@ def test_timer_decorator_outputs_timing(label: str, connector: str, timefmt: str
     output_mock.assert_called_once()
     message = output_mock.call_args[0][0]
     assert message == result
+
+
+@pytest.mark.unit
+def test_timer_aggregate():
+    output_mock = Mock()
+
+    with patch("outlify.decorators.atexit.register") as register_mock:
+        @timer(label="Agg", time_format="{s}.{ms:03}", output_func=output_mock, aggregate=True)
+        def dummy_func(x, y):
+            return x + y
+    register_mock.assert_called_once_with(dummy_func.report)
+
+    with patch(
+            "outlify.decorators.time.perf_counter_ns",
+            side_effect=[0, 100_000_000, 1_000_000_000, 1_300_000_000, 2_000_000_000, 2_200_000_000, 3_000_000_000],
+    ):
+        assert [dummy_func(1, 2), dummy_func(2, 3), dummy_func(3, 4)] == [3, 5, 7]
+        output_mock.assert_not_called()
+        dummy_func.report()
+
+    assert dummy_func.stats.count == 3
+    assert dummy_func.stats.min == pytest.approx(0.1)
+    assert dummy_func.stats.max == pytest.approx(0.3)
+    output_mock.assert_called_once_with(
+        "Agg took 0.200 on average over 3 calls (min: 0.100, p50: 0.199, p95: 0.300, p99: 0.300, max: 0.300)"
+    )
+
+
+@pytest.mark.unit
+def test_timer_aggregate_interval():
+    output_mock = Mock()
+
+    with patch(
+            "outlify.decorators.time.perf_counter_ns",
+            side_effect=[0, 0, 500_000_000, 5_000_000_000, 5_500_000_000, 10_000_000_000, 10_500_000_000, 10_500_000_000],
+    ):
+        @timer(output_func=output_mock, aggregate=True, report_interval=10, report_at_exit=False)
+        def dummy_func():
+            pass
+
+        dummy_func()
+        dummy_func()
+        output_mock.assert_not_called()
+        dummy_func()  # 10 seconds since decoration
+    output_mock.assert_called_once()
+    assert output_mock.call_args[0][0].startswith("Function 'dummy_func' took 00:00:00.500 on average over 3 calls")
+
+
+@pytest.mark.unit
+def test_timer_aggregate_panel():
+    output_mock = Mock()
+
+    @timer(label="Agg", output_func=output_mock, aggregate=True, report_at_exit=False, report_panel=True)
+    def dummy_func():
+        pass
+
+    dummy_func.report()  # nothing recorded yet
+    output_mock.assert_not_called()
+
+    with patch("outlify.decorators.time.perf_counter_ns", side_effect=[0, 1_500_000_000]):
+        dummy_func()
+    dummy_func.report()
+    panel = output_mock.call_args[0][0]
+    assert " Agg " in panel.split("\n")[0]
+    assert "│ calls = 1" in panel
+    assert "│ mean  = 00:00:01.500" in panel
+    assert "│ p99   = 00:00:01.500" in panel
+
+
+@pytest.mark.unit
+def test_timer_invalid_format_at_decoration():
+    with pytest.raises(KeyError, match="ns - nanoseconds"):
+        timer(time_format="{s}.{mss}")
+
+
+@pytest.mark.unit
+def test_timer_calibrate():
+    output_mock = Mock()
+
+    with patch("outlify.decorators.overhead_ns", return_value=300):
+        @timer(time_format="{us}.{ns:03}", output_func=output_mock, calibrate=True)
+        def dummy_func():
+            pass
+
+    with patch("outlify.decorators.time.perf_counter_ns", side_effect=[0, 1_000, 0, 100]):
+        dummy_func()
+        dummy_func()  # shorter than the overhead
+    assert [call[0][0] for call in output_mock.call_args_list] == [
+        "Function 'dummy_func' took 0.700",
+        "Function 'dummy_func' took 0.000",
+    ]
+
+
+@pytest.mark.unit
+def test_timer_overhead():
+    overhead = timer_overhead()
+    assert 0 <= overhead < 0.001
+    assert timer_overhead() == overhead  # measured once
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('aggregate', [False, True])
+@pytest.mark.parametrize(
+    'time_format,error', [("{mm}", KeyError), ("{ms:zz}", ValueError), ("{s:d}.{ms:.3}", ValueError), ("{s", ValueError)],
+)
+def test_timer_invalid_format_at_decoration(aggregate: bool, time_format: str, error: type[Exception]):
+    with pytest.raises(error):
+        timer(time_format=time_format, aggregate=aggregate, report_at_exit=False)
+
+
+@pytest.mark.unit
+def test_timer_coroutine():
+    output_mock = Mock()
+
+    @timer(label="Async", output_func=output_mock)
+    async def dummy_func(x, y):
+        await asyncio.sleep(0)
+        return x + y
+
+    assert asyncio.iscoroutinefunction(dummy_func)
+    with patch("outlify.decorators.time.perf_counter_ns", side_effect=[0, 1_500_000_000]):
+        coroutine = dummy_func(1, 2)
+        output_mock.assert_not_called()  # not measured until awaited
+        assert asyncio.run(coroutine) == 3
+    output_mock.assert_called_once_with("Async took 00:00:01.500")
+
+
+@pytest.mark.unit
+def test_timer_generator():
+    output_mock = Mock()
+
+    @timer(label="Gen", output_func=output_mock, throughput=True)
+    def dummy_func(n):
+        yield from range(n)
+        return "done"
+
+    def consume():
+        result = yield from dummy_func(3)
+        assert result == "done"
+
+    # resume-to-yield intervals: 0.0-0.5, 1.0-1.5, 2.0-2.5, 3.0-3.5 (exhausted)
+    with patch(
+            "outlify.decorators.time.perf_counter_ns",
+            side_effect=[0, 500_000_000, 1_000_000_000, 1_500_000_000, 2_000_000_000, 2_500_000_000, 3_000_000_000, 3_500_000_000],
+    ):
+        items = list(consume())
+    assert items == [0, 1, 2]
+    output_mock.assert_called_once_with("Gen took 00:00:02.000 (3 items, 1.5 items/sec)")
+
+
+@pytest.mark.unit
+def test_timer_generator_closed_early():
+    output_mock = Mock()
+
+    @timer(label="Gen", output_func=output_mock, throughput=True)
+    def dummy_func():
+        yield from range(100)
+
+    with patch("outlify.decorators.time.perf_counter_ns", side_effect=[0, 500_000_000, 1_000_000_000, 1_500_000_000]):
+        for item in dummy_func():
+            if item == 1:
+                break
+    output_mock.assert_called_once_with("Gen took 00:00:01.000 (2 items, 2.0 items/sec)")
+
+
+@pytest.mark.unit
+def test_timer_generator_send_and_throw():
+    output_mock = Mock()
+
+    @timer(output_func=output_mock)
+    def dummy_func():
+        received = yield "ready"
+        try:
+            yield received * 2
+        except ValueError:
+            yield "handled"
+
+    generator = dummy_func()
+    assert next(generator) == "ready"
+    assert generator.send(21) == 42
+    assert generator.throw(ValueError) == "handled"
+    with pytest.raises(StopIteration):
+        next(generator)
+    output_mock.assert_called_once()
+
+
+@pytest.mark.unit
+def test_timer_async_generator_aggregate():
+    @timer(aggregate=True, report_at_exit=False, throughput=True)
+    async def dummy_func(n):
+        for item in range(n):
+            await asyncio.sleep(0)
+            yield item
+
+    async def consume():
+        return [item async for item in dummy_func(4)]
+
+    with patch("outlify.decorators.time.perf_counter_ns", side_effect=[step * 250_000_000 for step in range(10)]):
+        assert asyncio.run(consume()) == [0, 1, 2, 3]
+    assert dummy_func.stats.count == 1
+    assert dummy_func.stats.items == 4
+    assert dummy_func.stats.total == pytest.approx(1.25)
+    assert dummy_func.stats.throughput == pytest.approx(3.2)
+
+
+@pytest.mark.unit
+def test_timer_generator_exception_not_recorded():
+    output_mock = Mock()
+
+    @timer(output_func=output_mock)
+    def dummy_func():
+        yield 1
+        raise RuntimeError
+
+    with pytest.raises(RuntimeError):
+        list(dummy_func())
+    output_mock.assert_not_called()
+
+
+@pytest.mark.unit
+def test_timer_sampling_aggregate():
+    output_mock = Mock()
+    sampling = EveryNth(3)
+
+    @timer(label="Sampled", time_format="{s}.{ms:03}", output_func=output_mock, aggregate=True,
+           report_at_exit=False, sampling=sampling)
+    def dummy_func(x):
+        return x
+
+    with patch(
+            "outlify.decorators.time.perf_counter_ns",
+            side_effect=[0, 100_000_000, 0, 300_000_000, 0, 200_000_000, 0],
+    ) as clock_mock:
+        assert [dummy_func(x) for x in range(9)] == list(range(9))
+        assert clock_mock.call_count == 6  # only 3 calls of 9 are measured
+        dummy_func.report()
+
+    assert sampling.calls == 0  # the policy is copied for the function
+    assert (dummy_func.sampler.calls, dummy_func.sampler.sampled) == (9, 3)
+    assert dummy_func.stats.count == 3
+    output_mock.assert_called_once_with(
+        "Sampled took 0.200 on average over 9 calls, 3 sampled "
+        "(min: 0.100, p50: 0.199, p95: 0.300, p99: 0.300, max: 0.300)"
+    )
+
+
+@pytest.mark.unit
+def test_timer_sampling_generator():
+    output_mock = Mock()
+
+    @timer(output_func=output_mock, sampling=EveryNth(2))
+    def dummy_func(n):
+        start = yield "ready"
+        yield from range(start, n)
+
+    for _ in range(3):
+        generator = dummy_func(4)
+        assert next(generator) == "ready"
+        assert generator.send(2) == 2
+        assert list(generator) == [3]
+    assert output_mock.call_count == 2
+
+
+@pytest.mark.unit
+def test_timer_sampling_coroutine():
+    output_mock = Mock()
+
+    @timer(output_func=output_mock, sampling=EveryNth(2))
+    async def dummy_func(x):
+        return x
+
+    assert asyncio.iscoroutinefunction(dummy_func)
+    assert [asyncio.run(dummy_func(x)) for x in range(4)] == [0, 1, 2, 3]
+    assert output_mock.call_count == 2
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "memory,result",
+    [
+        ((512, 0), "(peak 512 B, net +0 B)"),
+        ((1536, 1024), "(peak 1.5 KiB, net +1.0 KiB)"),
+        ((3 * 1024 ** 2, -2048), "(peak 3.0 MiB, net -2.0 KiB)"),
+    ]
+)
+def test_timer_memory(memory: tuple[int, int], result: str):
+    peak, net = memory
+    output_mock = Mock()
+    tracemalloc_mock = Mock()
+    with patch.dict("sys.modules", {"tracemalloc": tracemalloc_mock}):  # imported on the first measured call
+        tracemalloc_mock.get_traced_memory.side_effect = [(10_000, 0), (10_000 + net, 10_000 + peak)]
+
+        @timer(output_func=output_mock, memory=True)
+        def dummy_func():
+            pass
+
+        with patch("outlify.decorators.time.perf_counter_ns", side_effect=[0, 100_000_000]):
+            dummy_func()
+    tracemalloc_mock.reset_peak.assert_called_once()
+    output_mock.assert_called_once_with(f"Function 'dummy_func' took 00:00:00.100 {result}")
+
+
+@pytest.mark.unit
+def test_timer_memory_aggregate():
+    output_mock = Mock()
+    tracemalloc_mock = Mock()
+    with patch.dict("sys.modules", {"tracemalloc": tracemalloc_mock}):  # imported on the first measured call
+        tracemalloc_mock.get_traced_memory.side_effect = [(0, 0), (100, 2048), (100, 100), (0, 4096)]
+
+        @timer(output_func=output_mock, memory=True, aggregate=True, report_at_exit=False)
+        async def dummy_func():
+            pass
+
+        with patch("outlify.decorators.time.perf_counter_ns", side_effect=[0, 0, 1_000_000, 0, 3_000_000, 0]):
+            asyncio.run(dummy_func())
+            asyncio.run(dummy_func())
+            dummy_func.report()
+    assert (dummy_func.stats.memory_peak, dummy_func.stats.memory_net) == (3996, 0)
+    assert output_mock.call_args[0][0].endswith("peak 3.9 KiB, net +0 B)")
+
+
+@pytest.mark.unit
+def test_timer_memory_real_allocation():
+    import tracemalloc
+
+    output_mock = Mock()
+    tracing = tracemalloc.is_tracing()
+    try:
+        @timer(output_func=output_mock, memory=True, aggregate=True, report_at_exit=False)
+        def dummy_func():
+            return [0] * 100_000
+
+        assert tracemalloc.is_tracing() == tracing  # not started until the first call
+        result = dummy_func()
+        assert tracemalloc.is_tracing() == tracing  # stopped after the call if the timer started it
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    assert len(result) == 100_000
+    assert dummy_func.stats.memory_peak >= 800_000
+    assert dummy_func.stats.memory_net >= 800_000
+
+
+@pytest.mark.unit
+def test_timer_memory_nested():
+    @timer(output_func=Mock(), memory=True, aggregate=True, report_at_exit=False)
+    def inner():
+        return len([0] * 10_000)
+
+    @timer(output_func=Mock(), memory=True, aggregate=True, report_at_exit=False)
+    def outer():
+        data = [0] * 1_000_000
+        del data
+        return inner()
+
+    outer()
+    assert outer.stats.memory_peak >= 8_000_000  # not wiped by the peak reset of the inner call
+    assert inner.stats.memory_peak < 1_000_000
+
+
+@pytest.mark.unit
+def test_timer_memory_generator():
+    def dummy_func():
+        yield 1
+
+    with pytest.raises(TypeError):
+        timer(memory=True)(dummy_func)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('aggregate', [False, True])
+def test_timer_color_never(aggregate: bool):
+    from outlify.style import Colors, Styles
+
+    output_mock = Mock()
+
+    @timer(
+        label_style=[Styles.bold], time_style=Colors.green, output_func=output_mock, aggregate=aggregate,
+        report_at_exit=False, color='never',
+    )
+    def dummy():
+        pass
+
+    dummy()
+    if aggregate:
+        dummy.report()
+    message = output_mock.call_args[0][0]
+    assert message.startswith("Function 'dummy' took")
+    assert '\033' not in message
+
+
+@pytest.mark.unit
+def test_timer_memory_threads():
+    import threading
+    import tracemalloc
+
+    from outlify._timing import measure
+
+    allocated, results = [], []  # results are kept, so no other thread frees memory during a call
+    barrier = threading.Barrier(4)
+
+    def dummy_func():
+        data = bytearray(1_000_000)
+        barrier.wait()  # all threads are inside their measured calls, some of them finish first
+        return data
+
+    wrapper = measure(dummy_func, lambda _ns, _end, _items, memory: allocated.append(memory), memory=True)
+    tracing = tracemalloc.is_tracing()
+    threads = [threading.Thread(target=lambda: results.extend(wrapper() for _ in range(20))) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert tracemalloc.is_tracing() == tracing  # stopped only after the calls of every thread
+    assert len(allocated) == 80
+    assert all(peak >= 900_000 and net >= 900_000 for peak, net in allocated)
@@ -0,0 +1,51 @@
+import itertools
+
+import pytest
+
+from outlify._flatten import flatten
+
+
+cyclic = {'name': 'root'}
+cyclic['self'] = cyclic
+cyclic_list = [1]
+cyclic_list.append(cyclic_list)
+shared = {'x': 1}
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'pairs,max_depth,result',
+    [
+        ([('a', 1)], 10, [('a', 1)]),
+        ([('db', {'host': 'h', 'ports': [1, 2]})], 10, [('db.host', 'h'), ('db.ports[0]', 1), ('db.ports[1]', 2)]),
+        ([('a', {}), ('b', []), ('c', 'text'), ('d', b'bytes')], 10, [('a', {}), ('b', []), ('c', 'text'), ('d', b'bytes')]),
+        ([('a', {'b': {}, 'c': ()})], 10, [('a.b', {}), ('a.c', ())]),
+        ([('a', {'b': {'c': {'d': 1}}})], 2, [('a.b.c', {'d': 1})]),
+        ([('a', {'b': 1})], 0, [('a', {'b': 1})]),
+        ([('root', cyclic)], 10, [('root.name', 'root'), ('root.self', '{...}')]),
+        ([('items', cyclic_list)], 10, [('items[0]', 1), ('items[1]', '[...]')]),
+        ([('a', [shared, shared])], 10, [('a[0].x', 1), ('a[1].x', 1)]),  # shared, but not a cycle
+    ]
+)
+def test_flatten(pairs, max_depth: int, result):
+    assert list(flatten(pairs, max_depth=max_depth)) == result
+
+
+@pytest.mark.unit
+def test_flatten_keep():
+    pairs = [('secrets', {'token': 'x'}), ('db', {'password': {'old': 'y'}, 'host': 'h'})]
+    assert list(flatten(pairs, max_depth=10, keep=lambda path: path in {'secrets', 'db.password'})) == [
+        ('secrets', {'token': 'x'}), ('db.password', {'old': 'y'}), ('db.host', 'h'),
+    ]
+
+
+@pytest.mark.unit
+def test_flatten_is_lazy_and_deep():
+    deep = leaf = {}
+    for _ in range(10_000):  # deeper than the recursion limit
+        leaf['n'] = leaf = {}
+    leaf['n'] = 'end'
+    assert list(flatten([('deep', deep)], max_depth=20_000))[0] == ('deep' + '.n' * 10_001, 'end')
+
+    huge = [('big', range(10 ** 12))]
+    assert list(itertools.islice(flatten(huge, max_depth=10), 3)) == [('big[0]', 0), ('big[1]', 1), ('big[2]', 2)]
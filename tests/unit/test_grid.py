@@ -0,0 +1,58 @@
+import pytest
+
+from outlify._grid import fit_columns, iter_grid
+
+
+def brute_force(widths: list[int], width: int, gap: int, column_major: bool) -> int:
+    """Get the maximum number of columns by trying every count."""
+    best = 1
+    for columns in range(1, len(widths) + 1):
+        rows = -(-len(widths) // columns)
+        if column_major:
+            groups = [widths[index:index + rows] for index in range(0, len(widths), rows)]
+        else:
+            groups = [widths[index::columns] for index in range(columns)]
+        if sum(max(group) for group in groups) + gap * (len(groups) - 1) <= width:
+            best = max(best, len(groups))
+    return best
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('column_major', [True, False])
+@pytest.mark.parametrize(
+    'widths,width,gap',
+    [
+        ([3, 1, 4, 1, 5, 9, 2, 6, 5, 3, 5], 20, 2),
+        ([10] * 7, 35, 2),
+        ([1] * 50, 20, 1),
+        ([1, 20, 1, 1, 1, 1, 1, 1], 26, 1),
+        ([30, 1, 1], 20, 2),
+        ([0, 0, 0], 10, 0),
+        ([5], 80, 2),
+    ]
+)
+def test_fit_columns(widths: list[int], width: int, gap: int, column_major: bool):
+    column_widths = fit_columns(widths, width=width, gap=gap, column_major=column_major)
+    assert len(column_widths) == brute_force(widths, width, gap, column_major)
+    assert len(column_widths) == 1 or sum(column_widths) + gap * (len(column_widths) - 1) <= width
+
+
+@pytest.mark.unit
+def test_fit_columns_empty():
+    assert fit_columns([], width=80, gap=2, column_major=True) == []
+    assert list(iter_grid([], [], [], separator='  ', column_major=True)) == []
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'column_major,result',
+    [
+        (True, ['a   ccc  e', 'bb  d']),
+        (False, ['a  bb  ccc', 'd  e']),
+    ]
+)
+def test_iter_grid(column_major: bool, result: list[str]):
+    items = ['a', 'bb', 'ccc', 'd', 'e']
+    widths = [len(item) for item in items]
+    column_widths = fit_columns(widths, width=11, gap=2, column_major=column_major)
+    assert list(iter_grid(items, widths, column_widths, separator='  ', column_major=column_major)) == result
@@ -0,0 +1,16 @@
+import re
+
+import pytest
+
+from outlify._lazy import LazyPattern
+
+
+@pytest.mark.unit
+def test_lazy_pattern():
+    pattern = LazyPattern(r'\d+')
+    assert 'sub' not in vars(pattern)  # not compiled yet
+    assert pattern.sub('#', 'a1b22') == 'a#b#'
+    assert pattern.sub == re.compile(r'\d+').sub  # methods of the compiled pattern are kept on the instance
+    assert 'sub' in vars(pattern)
+    assert pattern.fullmatch('123')
+    assert repr(pattern) == "LazyPattern('\\\\d+')"
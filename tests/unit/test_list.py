@@ -45,7 +45,7 @@ def test_get_title(title: str, count: int, style: str, reset: str, result: str):
     ]
 )
 def test_prepared_content(content: Sequence[Any], result: list[str]):
-    assert ReleasedListBase([])._prepare_content(content) == result
+    assert list(ReleasedListBase([])._prepare_content(content)) == result
 
 
 @pytest.mark.unit
@@ -75,9 +75,146 @@ def test_titled_list(content: Sequence[Any], title: Optional[str], separator: Op
     [
         (
             TitledList([]),
-            "TitledList(content='', separator='  ', title='Content (0)', title_separator=': ', width=80)",
+            "TitledList(content='', layout='inline', max_chars=None, max_items=None, max_level=None, separator='  ', "
+            "title='Content (0)', title_separator=': ', width=80)",
         ),
     ]
 )
 def test_repr(list_: TitledList, result: str):
     assert repr(list_) == result
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('limit,result', [(None, 'Content (2): a  b'), (1, 'Content (2): a  … and 1 more')])
+def test_titled_list_snapshots_content(limit: Optional[int], result: str):
+    content = ['a', 'b']
+    list_ = TitledList(content, limit=limit)
+    content.append('c')
+    content[0] = 'x'
+    assert str(list_) == result
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('options', [{'count': 3}, {'count': 3, 'limit': 2}])
+def test_repr_keeps_one_shot_content(options: dict[str, int]):
+    list_ = TitledList((f'item{index}' for index in range(3)), **options)
+    assert 'content=<' in repr(list_)
+    assert str(list_).startswith('Content (3): item0  item1')
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'content,options,result',
+    [
+        (['x' * 20, 'short'], {'max_chars': 8}, 'Content (2): xxxxxxx…  short'),
+        ([list(range(10 ** 6)), {'a': {'b': 1}}], {'max_items': 2, 'max_level': 1}, "Content (2): [0, 1, …]  {'a': {…}}"),
+    ]
+)
+def test_titled_list_limits(content: Sequence[Any], options: dict[str, int], result: str):
+    assert str(TitledList(content, **options)) == result
+
+
+@pytest.mark.unit
+def test_titled_list_invalid_limits():
+    with pytest.raises(ValueError):
+        TitledList([], max_chars=-1)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'layout,options,result',
+    [
+        ('columns', {}, 'Content (5):\none  three  five\ntwo  four'),
+        ('rows', {}, 'Content (5):\none   two   three\nfour  five'),
+        ('columns', {'title_separator': ': ', 'separator': ' | '}, 'Content (5): one | three | five\ntwo | four'),
+        ('inline', {'width': 10}, 'Content (5): one  two  three  four  five'),
+    ]
+)
+def test_titled_list_grid(layout: str, options: dict[str, Any], result: str):
+    options.setdefault('width', 18)
+    assert str(TitledList(['one', 'two', 'three', 'four', 'five'], layout=layout, **options)) == result
+
+
+@pytest.mark.unit
+def test_titled_list_invalid_layout():
+    with pytest.raises(ValueError):
+        TitledList([], layout='table')
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'content,options,result',
+    [
+        (range(10), {'limit': 3}, 'Content (10): 0  1  2  … and 7 more'),
+        ((index for index in range(10)), {'limit': 3}, 'Content (10): 0  1  2  … and 7 more'),
+        ((index for index in range(10)), {'limit': 3, 'count': 10}, 'Content (10): 0  1  2  … and 7 more'),
+        ((index for index in range(3)), {}, 'Content (3): 0  1  2'),
+        ((index for index in range(3)), {'limit': 5}, 'Content (3): 0  1  2'),
+        ({'a', 'b', 'c'}, {'limit': 0}, 'Content (3): … and 3 more'),
+        ([], {'limit': 0}, 'Content (0)'),
+        (iter([]), {}, 'Content (0)'),
+        (
+            [f'item{index}' for index in range(10)], {'limit': 5, 'layout': 'columns', 'width': 20},
+            'Content (10):\nitem0  item2  item4\nitem1  item3\n… and 5 more',
+        ),
+    ]
+)
+def test_titled_list_lazy(content, options: dict[str, Any], result: str):
+    assert str(TitledList(content, **options)) == result
+
+
+@pytest.mark.unit
+def test_titled_list_limit_does_not_stringify_hidden_elements():
+    class Element:
+        converted = 0
+
+        def __str__(self):
+            Element.converted += 1
+            return 'element'
+
+    lazy = TitledList((Element() for _ in range(100_000)), limit=2)
+    assert str(lazy) == 'Content (100000): element  element  … and 99998 more'
+    assert Element.converted == 2
+
+
+@pytest.mark.unit
+def test_titled_list_render_to_streams(monkeypatch):
+    import io
+
+    monkeypatch.setattr('outlify.list.STREAM_BATCH', 2)
+
+    consumed = []
+
+    def elements():
+        for index in range(5):
+            consumed.append(index)
+            yield index
+
+    class Stream(io.StringIO):
+        def write(self, text):
+            writes.append((text, len(consumed)))
+            return super().write(text)
+
+    writes = []
+    stream = Stream()
+    TitledList(elements(), count=5).render_to(stream)
+    assert stream.getvalue() == 'Content (5): 0  1  2  3  4\n'
+    # elements are read in batches while writing
+    assert writes == [('Content (5)', 0), (': ', 0), ('0  1', 2), ('  2  3', 4), ('  4', 5), ('\n', 5)]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('options', [{'limit': -1}, {'count': -1}])
+def test_titled_list_invalid_count_and_limit(options: dict[str, int]):
+    with pytest.raises(ValueError):
+        TitledList(iter([]), **options)
+
+
+@pytest.mark.unit
+def test_titled_list_color_never():
+    from outlify.style import Colors, set_color_mode
+
+    assert str(TitledList(['a', 'b'], title_style=[Colors.red], color='never')) == 'Content (2): a  b'
+    assert str(TitledList(['a', 'b'], title_style=[Colors.red])) == '\033[31mContent (2)\033[0m: a  b'
+    set_color_mode('never')
+    assert str(TitledList(['a', 'b'], title_style=[Colors.red])) == 'Content (2): a  b'
@@ -0,0 +1,93 @@
+import io
+from unittest.mock import patch
+
+import pytest
+
+from outlify.live import Live, _diff
+from outlify.panel import Panel
+
+
+class TTY(io.StringIO):
+    def isatty(self) -> bool:
+        return True
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'old,new,result',
+    [
+        ([], ['a', 'b'], 'a\nb\n'),
+        (['a', 'b'], ['a', 'b'], ''),
+        # only the changed row is rewritten
+        (['a', 'b', 'c'], ['a', 'X', 'c'], '\033[2A\r\033[2KX\033[2B\r'),
+        (['a', 'b', 'c'], ['X', 'b', 'Y'], '\033[3A\r\033[2KX\033[2B\r\033[2KY\033[1B\r'),
+        # new rows are appended below
+        (['a'], ['X', 'b'], '\033[1A\r\033[2KX\033[1B\rb\n'),
+        (['a'], ['a', 'b', 'c'], 'b\nc\n'),
+        # extra rows are erased
+        (['a', 'b', 'c'], ['a'], '\033[2A\r\033[J'),
+        (['a', 'b', 'c'], ['X'], '\033[3A\r\033[2KX\033[1B\r\033[J'),
+    ]
+)
+def test_diff(old: list[str], new: list[str], result: str):
+    assert _diff(old, new) == result
+
+
+@pytest.mark.unit
+def test_live_redraws_changed_lines():
+    stream = TTY()
+    with Live(stream=stream) as live:
+        live.update(Panel('first', width=12))
+        live.refresh()
+        live.update(Panel('second', width=12))
+    assert stream.getvalue() == (
+        '╭──────────╮\n│ first    │\n╰──────────╯\n'
+        '\033[2A\r\033[2K│ second   │\033[2B\r'
+    )
+
+
+@pytest.mark.unit
+def test_live_coalesces_updates():
+    stream = TTY()
+    live = Live(stream=stream, max_refresh=2)
+    with patch('outlify.live.time.monotonic', side_effect=[10.0, 10.0, 10.1, 10.2, 10.6, 10.6]):
+        live.update('1')  # drawn
+        live.update('2')  # coalesced
+        live.update('3')  # coalesced
+        live.update('4')  # drawn: 0.6 seconds passed
+    assert stream.getvalue() == '1\n\033[1A\r\033[2K4\033[1B\r'
+
+
+@pytest.mark.unit
+def test_live_not_a_terminal():
+    stream = io.StringIO()
+    with Live(stream=stream) as live:
+        for step in range(100):
+            live.update(f'step {step}')
+        live.refresh()
+        assert stream.getvalue() == ''
+    assert stream.getvalue() == 'step 99\n'
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('max_refresh', [0, -1])
+def test_live_invalid_refresh(max_refresh: float):
+    with pytest.raises(ValueError):
+        Live(stream=io.StringIO(), max_refresh=max_refresh)
+
+
+@pytest.mark.unit
+def test_live_draws_coalesced_update_later():
+    import time
+
+    stream = TTY()
+    live = Live(stream=stream, max_refresh=20)
+    live.update('1')  # drawn
+    live.update('2')  # coalesced, drawn by the timer without further updates
+    assert stream.getvalue() == '1\n'
+    deadline = time.monotonic() + 5
+    while stream.getvalue() == '1\n' and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert stream.getvalue() == '1\n\033[1A\r\033[2K2\033[1B\r'
+    live.close()
+    assert stream.getvalue() == '1\n\033[1A\r\033[2K2\033[1B\r'
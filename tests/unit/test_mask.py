@@ -0,0 +1,77 @@
+import re
+from typing import Any
+
+import pytest
+
+from outlify._mask import HiddenKeys, mask
+
+
+PATTERNS = [
+    'token', 'api.*', '.*password.*', '.*', '(?i).*secret.*', '(one|two)?-more.*', r'(a)\1', '.*other', 'x+',
+]
+KEYS = [
+    'token', 'tokens', 'api', 'api_key', 'my_api', 'password', 'db.password.old', 'db\npassword', 'SECRET', 'Secret_key',
+    'one-more', '-more', 'three-more', 'aa', 'ab', 'another', 'other_', 'xxx', '', 'value',
+]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'patterns',
+    [[pattern] for pattern in PATTERNS] + [PATTERNS, PATTERNS[1:3] + PATTERNS[5:], []],
+)
+def test_hidden_keys_matches_like_fullmatch(patterns: list[str]):
+    compiled = [re.compile(pattern) for pattern in patterns]
+    hidden = HiddenKeys(compiled)
+    for key in KEYS:
+        expected = any(pattern.fullmatch(key) for pattern in compiled)
+        assert hidden(key) is expected, key
+        assert hidden(key) is expected, key  # memoized
+
+
+@pytest.mark.unit
+def test_hidden_keys_memo_is_bounded(monkeypatch):
+    monkeypatch.setattr('outlify._mask.MEMO_SIZE', 3)
+    hidden = HiddenKeys([re.compile('k.')])
+    assert [hidden(f'k{index}') for index in range(5)] == [True] * 5
+    assert len(hidden._memo) <= 3
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'value,visible,result',
+    [
+        ('', 4, ''),
+        ('secret', 0, '*****'),
+        ('secret', 4, '*****'),
+        ('secret-1234', 4, '*****1234'),
+        ('123456789', 4, '*****6789'),
+        (123456789, 4, '*****6789'),
+        (None, 0, '*****'),
+        ([], 0, '*****'),
+        (['secret-1234'], 4, '*****'),
+        ({'password': 'x'}, 0, '*****'),
+        (b'secret-1234', 4, '*****'),
+    ]
+)
+def test_mask(value: Any, visible: int, result: str):
+    assert mask(value, visible=visible) == result
+
+
+class Unprintable(list):
+    def __repr__(self):
+        raise AssertionError('must not be converted to a string')
+
+
+@pytest.mark.unit
+def test_mask_does_not_stringify_collections():
+    assert mask(Unprintable(range(10)), visible=4) == '*****'
+
+
+@pytest.mark.unit
+def test_hidden_keys_shared_between_panels():
+    from outlify.panel import ParamsPanel
+
+    first, second = ParamsPanel({'token': 'x'}), ParamsPanel({'token': 'y'})
+    assert first._hidden_keys is second._hidden_keys
+    assert ParamsPanel({}, hidden=['x'])._hidden_keys is not first._hidden_keys
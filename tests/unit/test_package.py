@@ -0,0 +1,44 @@
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import outlify
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('name', outlify.__all__)
+def test_public_names_are_lazily_exported(name: str):
+    import importlib
+
+    module = importlib.import_module(outlify._LOCATIONS[name])
+    assert getattr(outlify, name) is getattr(module, name)
+    assert name in dir(outlify)
+
+
+@pytest.mark.unit
+def test_unknown_name():
+    with pytest.raises(AttributeError, match="has no attribute 'unknown'"):
+        outlify.unknown  # noqa: B018
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'module,not_imported',
+    [
+        ('outlify', ['outlify.style', 'outlify.panel', 'outlify.decorators', 're']),
+        ('outlify.style', ['re', 'shutil', 'typing']),
+        ('outlify.panel', ['re', 'shutil', 'textwrap', 'typing']),
+        ('outlify.list', ['re', 'shutil', 'typing']),
+        (
+            'outlify.decorators',
+            ['inspect', 'tracemalloc', 'pickle', 'cProfile', 'pstats', 'json', 'pathlib', 'random', 'string', 're', 'typing'],
+        ),
+    ]
+)
+def test_import_defers_heavy_modules(module: str, not_imported: list[str]):
+    code = f'import sys, {module}; print(*sorted(set({not_imported!r}) & set(sys.modules)))'
+    root = Path(outlify.__file__).parent.parent
+    result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True, cwd=root)
+    assert result.stdout.strip() == ''
@@ -1,9 +1,12 @@
+import io
+import os
 import re
 from typing import Union, Optional, Any, Sequence
+from unittest.mock import patch
 
 import pytest
 
-from outlify.panel import PanelBase, Panel, ParamsPanel
+from outlify.panel import PanelBase, Panel, PanelRenderer, ParamsPanel
 from outlify.style import Align, BorderStyle, AnsiCodes
 
 
@@ -406,13 +409,30 @@ def test_params_panel(
     assert str(panel) == result
 
 
+@pytest.mark.unit
+def test_params_panel_mask_visible():
+    panel = ParamsPanel({'token': 'ghp-abcdef1234', 'password': 'short'}, width=30, mask_visible=4)
+    assert panel.content.split('\n') == [
+        '│ token    = *****1234       │',
+        '│ password = *****           │',
+    ]
+    with pytest.raises(ValueError):
+        ParamsPanel({}, mask_visible=-1)
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     'content',
     [
+        1,
+        'test',
+        b'test',
+        None,
         (1,),
         ('test',),
-        ((1, 2),),
+        ('ab',),
+        ((1, 2, 3),),
+        [('x', 1), None],
     ]
 )
 def test_params_panel_invalid_content(content):
@@ -420,6 +440,117 @@ def test_params_panel_invalid_content(content):
         ParamsPanel(content)
 
 
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'content',
+    [
+        iter([(1,)]),
+        (pair for pair in [('x', 1), 'test']),
+    ]
+)
+def test_params_panel_invalid_pairs_of_iterator(content):
+    panel = ParamsPanel(content)  # pairs of an iterator are read only when rendering
+    with pytest.raises(TypeError):
+        str(panel)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'content,options,result',
+    [
+        (
+            [('x', 10), ('long_key', 20)], {},
+            ['│ x        = 10      │', '│ long_key = 20      │'],
+        ),
+        (((1, 2),), {}, ['│ 1 = 2              │']),
+        (
+            ((f'k{index}', index) for index in range(3)), {},
+            ['│ k0 = 0             │', '│ k1 = 1             │', '│ k2 = 2             │'],
+        ),
+        (
+            iter([('x', 10), ('long_key', 20)]), {'key_width_scan': 1},
+            ['│ x = 10             │', '│ long_key = 20      │'],
+        ),
+        (
+            [('x', 10), ('y', 'long value to wrap')], {'key_width': 3},
+            ['│ x   = 10           │', '│ y   = long value t │', '│       o wrap       │'],
+        ),
+        (
+            [('x', 10), ('token', 'secret')], {'key_width': 0},
+            ['│ x = 10             │', '│ token = *****      │'],
+        ),
+        (
+            [('a_key_as_wide_as_panel', 'value to wrap')], {},
+            ['│ a_key_as_wide_as_p │', '│ anel = value to    │', '│ wrap               │'],
+        ),
+    ]
+)
+def test_params_panel_iterable(content, options: dict[str, Any], result: list[str]):
+    assert ParamsPanel(content, width=22, **options).content.split('\n') == result
+
+
+@pytest.mark.unit
+def test_params_panel_wraps_styled_value():
+    panel = ParamsPanel({'k': '\033[31mred text long long long long\033[0m'}, width=20)
+    assert panel.content.split('\n') == [
+        '│ k = \033[31mred text lon\033[0m │',
+        '│     \033[31mg long long \033[0m │',
+        '│     \033[31mlong\033[0m         │',
+    ]
+
+
+@pytest.mark.unit
+def test_params_panel_streams_pairs():
+    consumed = []
+
+    def pairs():
+        for index in range(1_000_000):
+            consumed.append(index)
+            yield f'k{index}', index
+
+    lines = ParamsPanel(pairs(), width=22, key_width_scan=10).iter_lines()
+    assert next(lines).startswith('╭')
+    assert next(lines) == '│ k0 = 0             │'
+    assert len(consumed) == 10
+
+
+@pytest.mark.unit
+def test_params_panel_flat():
+    config = {'db': {'host': 'localhost', 'credentials': {'token': 'secret'}, 'replicas': ['a', 'b']}, 'debug': True}
+    panel = ParamsPanel(config, width=40, flat=True, hidden=['.*token', 'db.replicas'])
+    assert panel.content.split('\n') == [
+        '│ db.host              = localhost     │',
+        '│ db.credentials.token = *****         │',
+        '│ db.replicas          = *****         │',
+        '│ debug                = True          │',
+    ]
+
+
+@pytest.mark.unit
+def test_params_panel_limits():
+    panel = ParamsPanel(
+        {'rows': list(range(10 ** 6)), 'text': 'long ' * 10 ** 5, 'token': 'x' * 10 ** 6},
+        width=40, max_chars=20, max_items=3,
+    )
+    assert panel.content.split('\n') == [
+        '│ rows  = [0, 1, 2, …]                 │',
+        '│ text  = long long long long…         │',
+        '│ token = *****                        │',
+    ]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'options', [
+        {'key_width': -1}, {'key_width_scan': 0}, {'max_depth': 0}, {'max_items': -1},
+        {'key_width': 15, 'width': 22}, {'key_width': 18, 'width': 22, 'separator': ''},
+    ],
+)
+def test_params_panel_invalid_key_width(options: dict[str, Any]):
+    with pytest.raises(ValueError):
+        ParamsPanel({}, **options)
+
+
 @pytest.mark.unit
 @pytest.mark.parametrize(
     'panel,result',
@@ -430,11 +561,190 @@ def test_params_panel_invalid_content(content):
         ),
         (
             ParamsPanel({'x': 10}, width=10),
-            "ParamsPanel(border_reset='', content='│ x = 10 │', footer='╰────────╯', header='╭────────╮', "
-            "hidden=(re.compile('.*password.*'), re.compile('.*token.*')), params_reset='', params_style='', "
+            "ParamsPanel(border_reset='', content='│ x = 10 │', flat=False, footer='╰────────╯', header='╭────────╮', "
+            "hidden=(re.compile('.*password.*'), re.compile('.*token.*')), key_width=None, "
+            "key_width_scan=None, mask_visible=0, max_chars=None, max_depth=10, max_items=None, max_level=None, "
+            "params_reset='', params_style='', "
             "separator=' = ')",
         ),
     ]
 )
 def test_repr(panel: Panel | ParamsPanel, result: str):
     assert repr(panel) == result
+
+
+@pytest.mark.unit
+def test_params_panel_snapshots_content():
+    content = {'x': 10}
+    pairs = [('x', 10)]
+    panels = ParamsPanel(content, width=12), ParamsPanel(pairs, width=12)
+    content['y'] = 20
+    pairs.append(('y', 20))
+    for panel in panels:
+        assert panel.content == '│ x = 10   │'
+
+
+@pytest.mark.unit
+def test_panel_renders_content_once():
+    panel = ParamsPanel(((f'k{index}', index) for index in range(2)), width=12)
+    result = str(panel)
+    assert str(panel) == result
+    assert '\n'.join(panel.iter_lines()) == result
+    assert panel.content is panel.content
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('options', [{}, {'key_width': 1}, {'key_width_scan': 1}])
+def test_repr_keeps_one_shot_content(options: dict[str, int]):
+    panel = ParamsPanel(((f'k{index}', index) for index in range(2)), width=12, **options)
+    assert 'content=<generator>' in repr(panel)
+    lines = str(panel).split('\n')
+    assert lines[1].startswith('│ k0 = 0')
+    assert lines[2].startswith('│ k1 = 1')
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'panel',
+    [
+        Panel('first line\nsecond line that should be wrapped', width=20, title='title', subtitle='subtitle'),
+        Panel('', width=20),
+        ParamsPanel({'x': 10, 'password': 'secret', 'y': 'long value to wrap inside'}, width=20),
+        ParamsPanel({'x': 10}, width=20, border='╭╮╰╯─'),
+    ]
+)
+def test_iter_lines(panel: Panel | ParamsPanel):
+    assert '\n'.join(panel.iter_lines()) == str(panel)
+    assert list(panel.iter_lines()) == str(panel).split('\n')
+
+
+@pytest.mark.unit
+def test_iter_lines_is_lazy():
+    lines = Panel('line\n' * 1_000_000, width=20).iter_lines()
+    assert next(lines) == '╭──────────────────╮'
+    assert next(lines) == '│ line             │'
+
+
+@pytest.mark.unit
+def test_render_to():
+    panel = ParamsPanel({'x': 10, 'y': 20}, width=20, title='params')
+    stream = io.StringIO()
+    panel.render_to(stream)
+    assert stream.getvalue() == f'{panel}\n'
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'align,result',
+    [
+        ('left', '\033[34m╭─\033[0m\033[31mタイトル\033[0m\033[34m───╮\033[0m'),
+        ('center', '\033[34m╭──\033[0m\033[31mタイトル\033[0m\033[34m──╮\033[0m'),
+        ('right', '\033[34m╭───\033[0m\033[31mタイトル\033[0m\033[34m─╮\033[0m'),
+    ]
+)
+def test_styled_wide_header(align: str, result: str):
+    panel = Panel('', width=14, title='タイトル', title_align=align, title_style=['\033[31m'], border_style=['\033[34m'])
+    assert panel.header == result
+
+
+@pytest.mark.unit
+def test_params_panel_styled_keys_alignment():
+    panel = ParamsPanel({'名前': 'value', 'x': 1}, width=20, params_style=['\033[31m'])
+    assert str(panel) == (
+        '╭──────────────────╮\n'
+        '│ \033[31m名前\033[0m = value     │\n'
+        '│ \033[31mx   \033[0m = 1         │\n'
+        '╰──────────────────╯'
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'panel,options,content',
+    [
+        (Panel, {}, 'test'),
+        (Panel, {'title': 'title', 'subtitle': 'sub', 'title_align': 'left', 'title_conns': '[]'}, 'long text to wrap'),
+        (Panel, {'border': '╔╗╚╝═║', 'border_style': ['\033[31m'], 'title': 'styled'}, 'first\nsecond'),
+        (ParamsPanel, {'title': 'params', 'separator': ': '}, {'x': 10, 'token': 'secret'}),
+    ]
+)
+def test_panel_renderer(panel: type[PanelBase], options: dict[str, Any], content: Any):
+    renderer = PanelRenderer(panel, width=20, **options)
+    assert renderer.render(content) == str(panel(content, width=20, **options))
+    assert list(renderer.iter_lines(content)) == list(panel(content, width=20, **options).iter_lines())
+
+
+@pytest.mark.unit
+def test_panel_renderer_reuses_template():
+    renderer = PanelRenderer(title='status', width=20)
+    first, second = renderer.render('first'), renderer.render('second')
+    assert first.split('\n')[0] == second.split('\n')[0] == '╭──────status──────╮'
+    assert len(renderer._templates) == 1
+
+    stream = io.StringIO()
+    renderer.render_to('third', stream)
+    assert stream.getvalue() == f'{renderer.render("third")}\n'
+
+
+@pytest.mark.unit
+def test_panel_renderer_terminal_width():
+    with patch('shutil.get_terminal_size', return_value=os.terminal_size((12, 24))):
+        renderer = PanelRenderer()
+        assert renderer.render('text') == '╭──────────╮\n│ text     │\n╰──────────╯'
+    with patch('shutil.get_terminal_size', return_value=os.terminal_size((10, 24))):
+        assert renderer.render('text') == '╭────────╮\n│ text   │\n╰────────╯'
+    assert sorted(renderer._templates) == [10, 12]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'options,error',
+    [
+        ({'border': 123}, TypeError),
+        ({'title_conns': '['}, ValueError),
+        ({'width': 2}, ValueError),
+    ]
+)
+def test_panel_renderer_validates_options(options: dict[str, Any], error: type[Exception]):
+    with pytest.raises(error):
+        PanelRenderer(**options)
+
+
+@pytest.mark.unit
+def test_composed_styles():
+    from outlify.style import Colors, Styles
+
+    panel = Panel('', width=14, title='Title', title_style=Colors.red | Styles.bold, border_style=Colors.blue)
+    assert panel.header == '\033[34m╭───\033[39m\033[31;1mTitle\033[39;22m\033[34m────╮\033[39m'
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('panel,content', [(Panel, 'text'), (ParamsPanel, {'key': 'value'})])
+def test_color_never(panel, content):
+    from outlify.style import Colors, Styles, set_color_mode
+
+    styles = {'title_style': Colors.red | Styles.bold, 'subtitle_style': [Colors.green], 'border_style': [Colors.blue]}
+    if panel is ParamsPanel:
+        styles['params_style'] = [Styles.underline]
+    plain = str(panel(content, width=20, title='T', subtitle='S'))
+    assert str(panel(content, width=20, title='T', subtitle='S', color='never', **styles)) == plain
+    assert '\033' in str(panel(content, width=20, title='T', subtitle='S', **styles))
+
+    set_color_mode('never')
+    assert str(panel(content, width=20, title='T', subtitle='S', **styles)) == plain
+    assert '\033' in str(panel(content, width=20, title='T', subtitle='S', color='always', **styles))
+
+
+@pytest.mark.unit
+def test_color_invalid():
+    with pytest.raises(ValueError, match='Invalid value for color mode'):
+        Panel('text', width=20, color='off')
+
+
+@pytest.mark.unit
+def test_params_panel_masks_before_shortening():
+    panel = ParamsPanel({'token': 'abcdefghijklmnop', 'name': 'abcdefghijklmnop'}, width=30, max_chars=8, mask_visible=3)
+    assert panel.content.split('\n') == [
+        '│ token = *****nop           │',
+        '│ name  = abcdefg…           │',
+    ]
@@ -0,0 +1,121 @@
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from outlify.decorators import profile
+
+
+def _inner(n):
+    return sum(range(n))
+
+
+@pytest.mark.unit
+def test_profile_cprofile():
+    output_mock = Mock()
+
+    @profile(label="Work", output_func=output_mock, width=100, top=3)
+    def work():
+        return [_inner(1000) for _ in range(5)]
+
+    assert len(work()) == 5
+    lines = output_mock.call_args[0][0].split("\n")
+    assert " Work " in lines[0]
+    assert " took " in lines[-1]
+    assert lines[1].split() == ["│", "function", "calls", "self", "cumulative", "│"]
+    assert len(lines) == 3 + 3  # header, table header, 3 functions, footer
+    assert lines[2].startswith("│ work (test_profile.py:")
+    assert any("_inner (test_profile.py:" in line and " 5 " in line for line in lines)
+
+
+@pytest.mark.unit
+def test_profile_sort_self():
+    output_mock = Mock()
+
+    @profile(output_func=output_mock, width=100, top=1, sort="self")
+    def work():
+        time.sleep(0.01)
+
+    work()
+    lines = output_mock.call_args[0][0].split("\n")
+    assert "time.sleep" in lines[2]
+
+
+@pytest.mark.unit
+def test_profile_nested():
+    output_mock = Mock()
+
+    @profile(output_func=output_mock, width=100)
+    def inner():
+        return 1
+
+    @profile(output_func=output_mock, width=100)
+    def outer():
+        return inner() + 1
+
+    assert outer() == 2
+    assert output_mock.call_count == 1  # the nested call runs without its own profiler
+    panel = output_mock.call_args.args[0]
+    assert 'inner' in panel
+    assert 'enable' not in panel
+
+
+@pytest.mark.unit
+def test_profile_threshold():
+    output_mock = Mock()
+
+    @profile(output_func=output_mock, width=100, threshold=0.02, interval=0.001)
+    def work(seconds):
+        time.sleep(seconds)
+        return seconds
+
+    assert work(0) == 0
+    output_mock.assert_not_called()  # fast calls are not reported
+
+    assert work(0.1) == 0.1
+    panel = output_mock.call_args[0][0]
+    lines = panel.split("\n")
+    assert lines[1].split() == ["│", "function", "samples", "self", "cumulative", "│"]
+    assert "work (test_profile.py:" in lines[2]
+    assert " samples " in lines[-1]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'params',
+    [
+        {"sort": "calls"},
+        {"top": 0},
+        {"threshold": -1},
+        {"interval": 0},
+    ]
+)
+def test_profile_invalid_params(params):
+    with pytest.raises(ValueError):
+        profile(**params)
+
+
+@pytest.mark.unit
+def test_profile_rejects_coroutines():
+    with pytest.raises(TypeError):
+        @profile()
+        async def work():
+            pass
+
+
+@pytest.mark.unit
+def test_profile_long_names_fit_width():
+    output_mock = Mock()
+
+    def function_with_a_very_long_name_that_does_not_fit_into_the_narrow_profile_panel():
+        return _inner(10)
+
+    @profile(output_func=output_mock, width=70, top=3)
+    def work():
+        return function_with_a_very_long_name_that_does_not_fit_into_the_narrow_profile_panel()
+
+    work()
+    lines = output_mock.call_args[0][0].split("\n")
+    assert len(lines) == 3 + 3  # no row is wrapped
+    assert all(len(line) == 70 for line in lines)
+    assert any("function_with_a_very_long_name" in line and "…" in line for line in lines)
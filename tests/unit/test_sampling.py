@@ -0,0 +1,61 @@
+from unittest.mock import patch
+
+import pytest
+
+from outlify._sampling import EveryNth, PerSecond, Probability
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'n,calls,result',
+    [
+        (1, 3, [True, True, True]),
+        (3, 7, [True, False, False, True, False, False, True]),
+    ]
+)
+def test_every_nth(n: int, calls: int, result: list[bool]):
+    sampler = EveryNth(n)
+    assert [sampler() for _ in range(calls)] == result
+    assert sampler.calls == calls
+    assert sampler.sampled == result.count(True)
+
+
+@pytest.mark.unit
+def test_probability():
+    sampler = Probability(0.25)
+    with patch.object(sampler, "_random", side_effect=[0.1, 0.3, 0.24, 0.9]):
+        assert [sampler() for _ in range(4)] == [True, False, True, False]
+    assert (sampler.calls, sampler.sampled) == (4, 2)
+
+
+@pytest.mark.unit
+def test_per_second():
+    sampler = PerSecond(2)
+    with patch("outlify._sampling.time.monotonic_ns", side_effect=[0, 1, 2, 999_999_999, 1_000_000_000, 1_500_000_000]):
+        assert [sampler() for _ in range(6)] == [True, True, False, False, True, True]
+    assert (sampler.calls, sampler.sampled) == (6, 4)
+
+
+@pytest.mark.unit
+def test_reset():
+    sampler = EveryNth(2)
+    sampler()
+    sampler()
+    sampler.reset()
+    assert (sampler.calls, sampler.sampled) == (0, 0)
+    assert sampler() is True
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'factory,value',
+    [
+        (EveryNth, 0),
+        (Probability, 0),
+        (Probability, 1.5),
+        (PerSecond, 0),
+    ]
+)
+def test_invalid_values(factory, value):
+    with pytest.raises(ValueError):
+        factory(value)
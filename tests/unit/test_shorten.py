@@ -0,0 +1,94 @@
+import sys
+from collections import Counter, OrderedDict, defaultdict, namedtuple
+
+import pytest
+
+from outlify._shorten import shorten, validate_limits
+
+
+recursive = [1]
+recursive.append(recursive)
+recursive_dict = {'a': 1}
+recursive_dict['self'] = recursive_dict
+
+
+class Explosive:
+    def __repr__(self):
+        raise AssertionError('must not be formatted')
+
+
+class ListSubclass(list):
+    pass
+
+
+class SetSubclass(set):
+    pass
+
+
+Point = namedtuple('Point', ['x', 'y'])
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'value',
+    [
+        1, 'text', None, [], (), {}, set(), frozenset(), [1, 'a', (2,), {'k': [1, {3}]}, frozenset({1})],
+        (1,), ('a', 'b'), {'a': {'b': []}}, recursive, recursive_dict,
+        ListSubclass([1, 2]), SetSubclass({1}), SetSubclass(), OrderedDict(a=1, b=[2]), OrderedDict(),
+        defaultdict(list, a=[1]), defaultdict(int), Point(1, (2,)), [Point('a', 'b')], Counter('abb'),
+    ]
+)
+def test_shorten_like_str(value):
+    assert shorten(value, max_chars=1000, max_items=1000, max_level=1000) == str(value)
+    assert shorten(value, max_chars=None, max_items=None, max_level=None) == str(value)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'value,max_chars,max_items,max_level,result',
+    [
+        ('x' * 100, 10, None, None, 'xxxxxxxxx…'),
+        ('short', 5, None, None, 'short'),
+        (12345678, 4, None, None, '123…'),
+        (list(range(10 ** 6)), 20, None, None, '[0, 1, 2, 3, 4, 5, …'),
+        (['x' * 10 ** 6], 8, None, None, "['xxxxx…"),
+        (list(range(10 ** 6)), None, 3, None, '[0, 1, 2, …]'),
+        ({index: index for index in range(10 ** 6)}, None, 2, None, '{0: 0, 1: 1, …}'),
+        ((1, 2), None, 1, None, '(1, …)'),
+        ([1, 2], None, 0, None, '[…]'),
+        ({'a': {'b': {'c': 1}}, 'd': [[1]]}, None, None, 2, "{'a': {'b': {…}}, 'd': [[…]]}"),
+        ([1, 2], None, None, 0, '[…]'),
+        ([1, [Explosive()] * 10], 4, None, None, '[1,…'),
+        (ListSubclass(range(10 ** 6)), None, 2, None, '[0, 1, …]'),
+        (defaultdict(int, {index: index for index in range(10 ** 6)}), None, 1, None, "defaultdict(<class 'int'>, {0: 0, …})"),
+        (Point(list(range(10 ** 6)), 2), None, 2, None, 'Point(x=[0, 1, …], y=2)'),
+        (Point(1, 2), None, 1, None, 'Point(x=1, …)'),
+        (Point([1], 2), None, None, 1, 'Point(x=[…], y=2)'),
+    ]
+)
+def test_shorten(value, max_chars, max_items, max_level, result: str):
+    assert shorten(value, max_chars=max_chars, max_items=max_items, max_level=max_level) == result
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(sys.version_info < (3, 12), reason='OrderedDict is shown as a list of pairs before Python 3.12')
+def test_shorten_ordered_dict():
+    value = OrderedDict((index, index) for index in range(10 ** 6))
+    assert shorten(value, max_chars=20, max_items=None, max_level=None) == 'OrderedDict({0: 0, …'
+
+
+@pytest.mark.unit
+def test_shorten_deep_nesting():
+    deep = []
+    for _ in range(10_000):  # deeper than the recursion limit
+        deep = [deep]
+    assert shorten(deep, max_chars=6, max_items=None, max_level=None) == '[[[[[…'
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('name', ['max_chars', 'max_items', 'max_level'])
+def test_validate_limits(name: str):
+    limits = {'max_chars': None, 'max_items': None, 'max_level': None}
+    validate_limits(**limits)
+    with pytest.raises(ValueError):
+        validate_limits(**{**limits, name: -1})
@@ -0,0 +1,141 @@
+import asyncio
+import contextvars
+import threading
+from unittest.mock import Mock, patch
+
+import pytest
+
+from outlify._spans import ROOT, span
+from outlify.decorators import report_spans, reset_spans
+
+
+@pytest.fixture(autouse=True)
+def clean_spans():
+    reset_spans()
+    yield
+    reset_spans()
+
+
+@pytest.mark.unit
+def test_span_nesting():
+    with span("request"):
+        with span("parse"):
+            pass
+        with span("parse"):
+            pass
+        with span("db"):
+            pass
+    with span("request"):
+        pass
+
+    request = ROOT.children["request"]
+    assert list(ROOT.children) == ["request"]
+    assert request.count == 2
+    assert list(request.children) == ["parse", "db"]
+    assert request.children["parse"].count == 2
+    assert request.children["db"].count == 1
+
+
+@pytest.mark.unit
+def test_span_wall_and_cpu_time():
+    with patch("outlify._spans.time.perf_counter", side_effect=[0.0, 1.0, 3.0, 10.0]), \
+            patch("outlify._spans.time.thread_time", side_effect=[0.0, 0.5, 1.5, 2.0]):
+        with span("outer"):
+            with span("inner"):
+                pass
+
+    outer = ROOT.children["outer"]
+    inner = outer.children["inner"]
+    assert outer.total == pytest.approx(10.0)
+    assert inner.total == pytest.approx(2.0)
+    assert outer.self_time == pytest.approx(8.0)
+    assert outer.cpu == pytest.approx(2.0)
+    assert inner.cpu == pytest.approx(1.0)
+
+
+@pytest.mark.unit
+def test_span_recorded_on_exception():
+    with pytest.raises(ValueError), span("failing"):
+        raise ValueError
+    assert ROOT.children["failing"].count == 1
+    with span("next"):
+        pass
+    assert "next" in ROOT.children  # the current span is restored after the exception
+
+
+@pytest.mark.unit
+def test_span_decorator():
+    @span("work")
+    def work(x):
+        with span("step"):
+            return x * 2
+
+    @span("async work")
+    async def async_work(x):
+        with span("step"):
+            await asyncio.sleep(0)
+            return x * 3
+
+    assert work(2) == 4
+    assert asyncio.run(async_work(2)) == 6
+    assert work.__name__ == "work"
+    assert ROOT.children["work"].children["step"].count == 1
+    assert ROOT.children["async work"].children["step"].count == 1
+
+
+@pytest.mark.unit
+def test_span_decorator_rejects_generators():
+    with pytest.raises(TypeError):
+        @span("gen")
+        def gen():
+            yield 1
+
+
+@pytest.mark.unit
+def test_span_asyncio_tasks():
+    async def task():
+        with span("task"):
+            await asyncio.sleep(0)
+
+    async def main():
+        with span("main"):
+            await asyncio.gather(task(), task())
+
+    asyncio.run(main())
+    assert list(ROOT.children) == ["main"]
+    assert ROOT.children["main"].children["task"].count == 2
+
+
+@pytest.mark.unit
+def test_span_threads():
+    def work():
+        with span("thread"):
+            pass
+
+    with span("main"):
+        plain = threading.Thread(target=work)
+        copied = threading.Thread(target=contextvars.copy_context().run, args=(work,))
+        plain.start(); plain.join()
+        copied.start(); copied.join()
+
+    assert ROOT.children["thread"].count == 1  # the plain thread does not inherit the context
+    assert ROOT.children["main"].children["thread"].count == 1
+
+
+@pytest.mark.unit
+def test_report_spans():
+    output_mock = Mock()
+    with patch("outlify._spans.time.perf_counter", side_effect=[0.0, 1.0, 2.0, 3.0, 4.0, 10.0]), \
+            patch("outlify._spans.time.thread_time", return_value=0.0):
+        with span("request"):
+            with span("parse"):
+                pass
+            with span("db"):
+                pass
+    report_spans(time_format="{s}.{ms:03}", output_func=output_mock)
+    assert output_mock.call_args[0][0].split("\n") == [
+        "span       calls   total   self       %    cpu",
+        "request        1  10.000  8.000  100.0%  0.000",
+        "├── parse      1   1.000  1.000   10.0%  0.000",
+        "└── db         1   1.000  1.000   10.0%  0.000",
+    ]
@@ -0,0 +1,102 @@
+import json
+import random
+
+import pytest
+
+from outlify._stats import TimingStats
+
+
+@pytest.mark.unit
+def test_empty_stats():
+    stats = TimingStats()
+    assert (stats.count, stats.total, stats.mean, stats.percentile(50)) == (0, 0, 0, 0)
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'durations,percent,result',
+    [
+        ([1.0], 50, 1.0),
+        ([1.0, 2.0, 3.0], 0, 1.0),
+        ([1.0, 2.0, 3.0], 100, 3.0),
+        ([0.0, 0.0, 1.0], 50, 0.0),
+        ([0.001] * 99 + [10.0], 99, 0.001),
+        ([0.001] * 99 + [10.0], 100, 10.0),
+    ]
+)
+def test_percentile(durations: list[float], percent: float, result: float):
+    stats = TimingStats()
+    for duration in durations:
+        stats.add(duration)
+    assert stats.percentile(percent) == pytest.approx(result, rel=0.04)
+
+
+@pytest.mark.unit
+def test_percentile_accuracy():
+    rnd = random.Random(0)
+    durations = sorted(rnd.lognormvariate(-7, 1.5) for _ in range(10_000))
+    stats = TimingStats()
+    for duration in durations:
+        stats.add(duration)
+
+    assert stats.count == len(durations)
+    assert stats.total == pytest.approx(sum(durations))
+    assert (stats.min, stats.max) == (durations[0], durations[-1])
+    for percent in (50, 90, 95, 99):
+        assert stats.percentile(percent) == pytest.approx(durations[len(durations) * percent // 100 - 1], rel=0.04)
+    assert len(stats.buckets) < 300  # memory is bounded by the range of durations, not their count
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('percent', [-1, 101])
+def test_invalid_percentile(percent: float):
+    with pytest.raises(ValueError):
+        TimingStats().percentile(percent)
+
+
+@pytest.mark.unit
+def test_reset():
+    stats = TimingStats()
+    stats.add(1.0)
+    stats.reset()
+    assert (stats.count, stats.buckets) == (0, {})
+
+
+@pytest.mark.unit
+def test_merge():
+    first, second, combined = TimingStats(), TimingStats(), TimingStats()
+    for index, seconds in enumerate([0.1, 0.5, 0.2, 0.9, 0.05]):
+        (first if index % 2 else second).add(seconds, items=1)
+        combined.add(seconds, items=1)
+    first.merge(second)
+    first.merge(TimingStats())
+    assert (first.count, first.items, first.min, first.max) == (combined.count, combined.items, 0.05, 0.9)
+    assert first.total == pytest.approx(combined.total)
+    assert first.buckets == combined.buckets
+
+
+@pytest.mark.unit
+def test_snapshot_roundtrip():
+    stats = TimingStats()
+    for seconds in [0.001, 0.002, 1.5]:
+        stats.add(seconds, items=2)
+    restored = TimingStats.from_snapshot(json.loads(json.dumps(stats.snapshot())))
+    assert repr(restored) == repr(stats)
+    assert restored.buckets == stats.buckets
+    assert restored.items == 6
+
+    empty = TimingStats.from_snapshot(json.loads(json.dumps(TimingStats().snapshot())))
+    assert repr(empty) == repr(TimingStats())
+
+
+@pytest.mark.unit
+def test_memory():
+    first, second = TimingStats(), TimingStats()
+    first.add(0.1)
+    assert first.memory_peak is None
+    first.add(0.1, memory=(100, 50))
+    second.add(0.2, memory=(300, -20))
+    first.merge(second)
+    assert (first.memory_peak, first.memory_net) == (300, 30)
+    restored = TimingStats.from_snapshot(json.loads(json.dumps(first.snapshot())))
+    assert (restored.memory_peak, restored.memory_net) == (300, 30)
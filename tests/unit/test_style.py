@@ -1,6 +1,6 @@
 import pytest
 
-from outlify.style import Align
+from outlify.style import Align, Back, Colors, Style, Styles
 
 
 @pytest.mark.unit
@@ -14,3 +14,62 @@ from outlify.style import Align
 )
 def test_align(align: str, result: Align):
     assert Align(align) == result
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'style,sequence,reset',
+    [
+        (Style(), '', ''),
+        (Colors.red, '\033[31m', '\033[39m'),
+        (Colors.red | Styles.bold, '\033[31;1m', '\033[39;22m'),
+        (Back.blue | Styles.bold | Styles.dim, '\033[44;1;2m', '\033[49;22m'),
+        (Colors.gray | Back.snow, '\033[90;107m', '\033[39;49m'),
+        (Style(38, 5, 207) | Style(48, 2, 255, 128, 0), '\033[38;5;207;48;2;255;128;0m', '\033[39;49m'),
+        (Styles.underline | Styles.reset_underline, '\033[4;24m', '\033[24m'),
+        (Styles.reset, '\033[0m', ''),
+        (Style(53), '\033[53m', '\033[0m'),  # unknown codes are reset by the full reset
+    ]
+)
+def test_style(style: Style, sequence: str, reset: str):
+    assert style == sequence
+    assert style.reset == reset
+    assert isinstance(style.reset, Style)
+    assert f'{style}text' == f'{sequence}text'
+
+
+@pytest.mark.unit
+def test_style_is_interned():
+    style = Colors.red | Styles.bold
+    assert style is Style(31, 1) is Colors.red | Styles.bold
+    assert style.reset is style.reset
+    assert Colors.red is Style(31)
+    assert hash(style) == hash('\033[31;1m')
+    assert {style: 1}['\033[31;1m'] == 1
+    assert repr(style) == 'Style(31, 1)'
+
+
+@pytest.mark.unit
+def test_style_copy_and_pickle():
+    import copy
+    import pickle
+
+    style = Colors.red | Styles.bold
+    assert copy.copy(style) is style
+    assert copy.deepcopy(style) is style
+    assert pickle.loads(pickle.dumps(style)) is style
+
+
+@pytest.mark.unit
+def test_style_is_immutable():
+    with pytest.raises(AttributeError):
+        Colors.red.other = 1
+    with pytest.raises(TypeError):
+        Colors.red | '\033[1m'
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('codes', [('31',), (31, 1.5), (None,)])
+def test_style_invalid_codes(codes: tuple):
+    with pytest.raises(TypeError, match='is not int'):
+        Style(*codes)
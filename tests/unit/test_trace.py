@@ -0,0 +1,139 @@
+import io
+import json
+import os
+from unittest.mock import Mock, patch
+
+import pytest
+
+from outlify._spans import span
+from outlify._trace import TraceSink
+from outlify.decorators import reset_spans, timer
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'events,buffer_size,result',
+    [
+        (0, 10, "[]\n"),
+        (1, 10, '[\n{"name": "e0", "cat": "test", "ph": "X", "ts": 0.0, "dur": 1.0, "pid": 1, "tid": 2}\n]\n'),
+        (
+            2, 1,
+            '[\n{"name": "e0", "cat": "test", "ph": "X", "ts": 0.0, "dur": 1.0, "pid": 1, "tid": 2},\n'
+            '{"name": "e1", "cat": "test", "ph": "X", "ts": 1.0, "dur": 1.0, "pid": 1, "tid": 2}\n]\n',
+        ),
+    ]
+)
+def test_chrome_format(events: int, buffer_size: int, result: str):
+    stream = io.StringIO()
+    with patch("outlify._trace.os.getpid", return_value=1), patch("outlify._trace.threading.get_ident", return_value=2):
+        with TraceSink(stream, buffer_size=buffer_size) as sink:
+            for index in range(events):
+                sink.emit(f"e{index}", start_ns=index * 1000, duration_ns=1000, category="test")
+    assert stream.getvalue() == result
+    assert isinstance(json.loads(stream.getvalue()), list)
+
+
+@pytest.mark.unit
+def test_jsonl_format_buffering():
+    stream = io.StringIO()
+    sink = TraceSink(stream, trace_format="jsonl", buffer_size=2)
+    sink.emit("a", start_ns=0, duration_ns=5000, category="timer", args={"items": 3})
+    assert stream.getvalue() == ""  # buffered
+    sink.emit("b", start_ns=0, duration_ns=5000, category="timer")
+    lines = stream.getvalue().splitlines()
+    assert [json.loads(line)["name"] for line in lines] == ["a", "b"]
+    assert json.loads(lines[0])["args"] == {"items": 3}
+    sink.close()
+    sink.close()
+    sink.emit("c", start_ns=0, duration_ns=1, category="timer")
+    sink.flush()
+    assert len(stream.getvalue().splitlines()) == 2  # dropped after closing
+
+
+@pytest.mark.unit
+def test_file_target(tmp_path):
+    path = tmp_path / "trace.json"
+    with TraceSink(path) as sink:
+        sink.emit("a", start_ns=0, duration_ns=1000, category="timer")
+    assert [event["name"] for event in json.loads(path.read_text())] == ["a"]
+
+
+@pytest.mark.unit
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="fork is not available")
+@pytest.mark.filterwarnings("ignore:This process .* is multi-threaded:DeprecationWarning")  # threads of other tests
+def test_forked_child(tmp_path):
+    path = tmp_path / "trace.json"
+    stream = io.StringIO()
+    with TraceSink(path) as sink, TraceSink(stream, trace_format="jsonl") as stream_sink:
+        sink.emit("parent", start_ns=0, duration_ns=1000, category="timer")
+        stream_sink.emit("parent", start_ns=0, duration_ns=1000, category="timer")
+        pid = os.fork()
+        if pid == 0:  # child: write the events and exit without running the test runner's cleanup
+            try:
+                sink.emit("child", start_ns=0, duration_ns=1000, category="timer")
+                stream_sink.emit("child", start_ns=0, duration_ns=1000, category="timer")
+                sink.close()
+                stream_sink.close()
+            finally:
+                os._exit(0)
+        os.waitpid(pid, 0)
+    assert [(event["name"], event["pid"]) for event in json.loads(path.read_text())] == [("parent", os.getpid())]
+    child = json.loads((tmp_path / f"trace.json.{pid}").read_text())
+    assert [(event["name"], event["pid"]) for event in child] == [("child", pid)]
+    assert [json.loads(line)["name"] for line in stream.getvalue().splitlines()] == ["parent"]
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'params',
+    [
+        {"trace_format": "xml"},
+        {"buffer_size": 0},
+    ]
+)
+def test_invalid_params(params):
+    with pytest.raises(ValueError):
+        TraceSink(io.StringIO(), **params)
+
+
+@pytest.mark.unit
+def test_timer_trace():
+    stream = io.StringIO()
+    sink = TraceSink(stream, trace_format="jsonl")
+
+    @timer(output_func=Mock(), trace=sink)
+    def work():
+        pass
+
+    @timer(label="items", aggregate=True, report_at_exit=False, trace=sink)
+    def gen():
+        yield from range(3)
+
+    with patch("outlify.decorators.time.perf_counter_ns", side_effect=[1_000_000, 3_000_000]):
+        work()
+    list(gen())
+    sink.close()
+
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert events[0]["name"].endswith("test_timer_trace.<locals>.work")
+    assert (events[0]["cat"], events[0]["ts"], events[0]["dur"]) == ("timer", 1000.0, 2000.0)
+    assert (events[1]["name"], events[1]["args"]) == ("items", {"items": 3})
+
+
+@pytest.mark.unit
+def test_span_trace():
+    reset_spans()
+    stream = io.StringIO()
+    sink = TraceSink(stream, trace_format="jsonl")
+    with span("outside"):
+        pass
+    with span("request", trace=sink):
+        with span("parse"):
+            pass
+    sink.close()
+    reset_spans()
+
+    events = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [event["name"] for event in events] == ["parse", "request"]
+    assert {event["cat"] for event in events} == {"span"}
+    assert "cpu_us" in events[0]["args"]
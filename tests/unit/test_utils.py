@@ -3,8 +3,8 @@ from unittest.mock import patch
 
 import pytest
 
-from outlify.style import Align
-from outlify._utils import parse_title_align, resolve_width
+from outlify.style import Align, Colors, Styles, set_color_mode
+from outlify._utils import get_reset_by_style, parse_styles, parse_title_align, resolve_width
 
 
 @pytest.mark.unit
@@ -46,3 +46,30 @@ def test_resolve_width_errors(width: int, error, result: int):
 def test_resolve_width_terminal_fallback(exception):
     with patch("shutil.get_terminal_size", side_effect=exception):
         assert resolve_width(None) == 80
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'codes,style,reset',
+    [
+        (None, '', ''),
+        ([], '', ''),
+        (['\033[31m', '\033[1m'], '\033[31m\033[1m', '\033[0m'),
+        (Colors.red | Styles.bold, '\033[31;1m', '\033[39;22m'),
+        ([Colors.red | Styles.bold], '\033[31;1m', '\033[0m'),
+    ]
+)
+def test_parse_styles(codes, style: str, reset: str):
+    parsed = parse_styles(codes)
+    assert parsed == style
+    assert get_reset_by_style(parsed) == reset
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('codes', [None, ['\033[31m'], Colors.red | Styles.bold])
+def test_parse_styles_never(codes):
+    parsed = parse_styles(codes, 'never')
+    assert parsed == ''
+    assert get_reset_by_style(parsed) == ''
+    set_color_mode('never')
+    assert parse_styles(codes) == ''
@@ -0,0 +1,109 @@
+import pytest
+
+from outlify._width import center, char_width, ljust, rjust, split_at_width, strip_ansi, visible_width
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'char,result',
+    [
+        ('a', 1),
+        (' ', 1),
+        ('\t', 0),
+        ('\x1b', 0),
+        ('é', 1),
+        ('́', 0),  # combining acute accent
+        ('​', 0),  # zero width space
+        ('日', 2),
+        ('ｱ', 1),       # halfwidth katakana
+        ('Ａ', 2),      # fullwidth latin
+        ('🚀', 2),
+        ('─', 1),
+    ]
+)
+def test_char_width(char: str, result: int):
+    assert char_width(char) == result
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'text,result',
+    [
+        ('', 0),
+        ('text', 4),
+        ('\033[31mtext\033[0m', 4),
+        ('\033[38;2;255;128;0mtext\033[39m', 4),
+        ('\033]8;;https://example.com\033\\link\033]8;;\033\\', 4),
+        ('日本語', 6),
+        ('\033[1m日本\033[0m語', 6),
+        ('é', 1),
+        ('🚀 launch', 9),
+    ]
+)
+def test_visible_width(text: str, result: int):
+    assert visible_width(text) == result
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'text,width,fillchar,result',
+    [
+        ('ab', 5, '-', ('ab---', '---ab', '--ab-')),
+        ('ab', 6, '-', ('ab----', '----ab', '--ab--')),
+        ('abc', 6, '-', ('abc---', '---abc', '-abc--')),
+        ('abcd', 2, '-', ('abcd', 'abcd', 'abcd')),
+        ('\033[31mab\033[0m', 4, ' ', ('\033[31mab\033[0m  ', '  \033[31mab\033[0m', ' \033[31mab\033[0m ')),
+        ('日本', 6, '.', ('日本..', '..日本', '.日本.')),
+    ]
+)
+def test_justify(text: str, width: int, fillchar: str, result: tuple[str, str, str]):
+    assert (ljust(text, width, fillchar), rjust(text, width, fillchar), center(text, width, fillchar)) == result
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'text,width',
+    [('', 0), ('a', 3), ('ab', 5), ('abc', 6), ('abcd', 9), ('abcde', 4)],
+)
+def test_justify_matches_str(text: str, width: int):
+    assert ljust(text, width, '-') == text.ljust(width, '-')
+    assert rjust(text, width, '-') == text.rjust(width, '-')
+    assert center(text, width, '-') == text.center(width, '-')
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'text,width,result',
+    [
+        ('abcdef', 4, ('abcd', 'ef')),
+        ('abc', 10, ('abc', '')),
+        ('\033[31mabc\033[0mdef', 3, ('\033[31mabc\033[0m', 'def')),
+        ('日本語', 3, ('日', '本語')),
+        ('日本語', 4, ('日本', '語')),
+        ('éé', 1, ('é', 'é')),
+    ]
+)
+def test_split_at_width(text: str, width: int, result: tuple[str, str]):
+    assert split_at_width(text, width) == result
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'text,result',
+    [
+        ('', ''),
+        ('plain text', 'plain text'),
+        ('\x1b[31mred\x1b[0m', 'red'),
+        ('\x1b[38;2;255;128;0mрыжий\x1b[39m ok', 'рыжий ok'),
+        ('\x1b]8;;https://example.com\x1b\\link\x1b]8;;\x1b\\', 'link'),
+        ('\x1b[2K\x1b[1Aline', 'line'),
+    ]
+)
+def test_strip_ansi(text: str, result: str):
+    assert strip_ansi(text) == result
+
+
+@pytest.mark.unit
+def test_strip_ansi_plain_is_unchanged():
+    text = 'x' * 100
+    assert strip_ansi(text) is text
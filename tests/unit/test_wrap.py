@@ -0,0 +1,60 @@
+import textwrap
+
+import pytest
+
+from outlify._wrap import split, wrap
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'text,width',
+    [
+        ('', 10),
+        ('short', 10),
+        ('test looooong text', 16),
+        ('test looooonooooooooog', 16),
+        ('word  with   many    spaces', 7),
+        ('averyveryverylongwordthatneverfits', 5),
+        ('tabs\tare\texpanded', 8),
+        ('hyphen-ated words are not-broken', 10),
+        ('x', 1),
+    ]
+)
+def test_wrap_matches_textwrap(text: str, width: int):
+    assert wrap(text, width) == textwrap.wrap(
+        text, width=width, replace_whitespace=False, drop_whitespace=False, break_on_hyphens=False,
+    )
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'text,width,result',
+    [
+        # escape sequences are never split and take no space
+        ('\033[31mred\033[0m text', 8, ['\033[31mred\033[0m text']),
+        ('\033[1mab\033[0mcdef', 3, ['\033[1mab\033[0mc', 'def']),
+        # active styles are closed and reopened on the next line
+        ('\033[31mred words\033[0m plain', 6, ['\033[31mred \033[0m', '\033[31mwords\033[0m ', 'plain']),
+        ('\033[1m\033[31mbold red\033[0m', 5, ['\033[1m\033[31mbold \033[0m', '\033[1m\033[31mred\033[0m']),
+        # wide chars take two cells
+        ('日本語のテキスト', 6, ['日本語', 'のテキ', 'スト']),
+        ('日本語', 1, ['日', '本', '語']),
+        ('ab 日本', 5, ['ab ', '日本']),
+    ]
+)
+def test_wrap(text: str, width: int, result: list[str]):
+    assert wrap(text, width) == result
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    'text,width,result',
+    [
+        ('plain text', 4, ('plai', 'n text')),
+        ('\033[31mred text\033[0m', 4, ('\033[31mred \033[0m', '\033[31mtext\033[0m')),
+        ('\033[31mred\033[0m text', 3, ('\033[31mred\033[0m', '\033[31m\033[0m text')),
+        ('日本語', 3, ('日', '本語')),
+    ]
+)
+def test_split(text: str, width: int, result: tuple[str, str]):
+    assert split(text, width) == result